@@ -1,222 +1,294 @@
-from openai import OpenAI
+import asyncio
+import contextlib
 import os
-import time
-import re
 import json
-import streamlit as st
 import logging
+from src.core.admission import AdmissionController, AdmissionRejected
+from src.core.completion import PollBackoff, RunFailedError, complete_run_async
+from src.core.http_client import create_async_http_client, timeout as http_timeout
+from src.core.incremental_json import IncrementalJSONParser, PartialValue
+from src.core.providers import create_provider
+from src.core.response_cache import ResponseCache
+from src.core.response_parser import ResponseFormatError, parse_resume_package
+from src.core.retry import RetryPolicy, retry_budget
+from src.core.thread_pool import AsyncAssistantThreadPool
+from src.utils.metrics import INIT_RETRIES, REQUESTS, RUNS
+from src.utils.tracing import span
+from src.config.settings import THREAD_POOL
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class AssistantManager:
     MAX_RETRIES = 3
     RETRY_DELAY = 2  # seconds
+    RUN_TIMEOUT = 300  # 5 minutes
+    STREAM_RUNS = True  # fall back to backoff polling when streaming is unavailable
+    POLL_BACKOFF = PollBackoff(initial=0.2, maximum=2.0, factor=1.5)
 
-    def __init__(self):
-        """Initialize the AssistantManager with retry logic"""
-        self.client = None
-        self.assistant = None
-        self._initialize_with_retry()
+    def __init__(self, provider=None, admission=None):
+        """Initialize the AssistantManager with the configured LLM provider"""
+        self.response_cache = ResponseCache.from_settings()
+        self.provider = provider or create_provider(
+            timeout=self.RUN_TIMEOUT, stream=self.STREAM_RUNS, backoff=self.POLL_BACKOFF,
+            max_retries=self.MAX_RETRIES, retry_delay=self.RETRY_DELAY)
+        # Runs on a provider with quotas queue for a slot and the rate limits
+        if admission is None and self.provider.rate_limited:
+            admission = AdmissionController.from_settings()
+        self.admission = admission
 
-    def _initialize_with_retry(self):
-        """Initialize the OpenAI client and retrieve the assistant with retry logic"""
-        for attempt in range(self.MAX_RETRIES):
-            try:
-                # Initialize OpenAI client
-                self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-                
-                # Retrieve the assistant
-                agent_id = os.getenv("agent_id")
-                if not agent_id:
-                    raise ValueError("agent_id not found in environment variables")
-                
-                self.assistant = self.client.beta.assistants.retrieve(agent_id)
-                logger.info(f"Successfully initialized AssistantManager with assistant: {self.assistant.id}")
-                return
-                
-            except Exception as e:
-                logger.error(f"Attempt {attempt + 1} failed: {str(e)}")
-                if attempt < self.MAX_RETRIES - 1:
-                    logger.info(f"Retrying in {self.RETRY_DELAY} seconds...")
-                    time.sleep(self.RETRY_DELAY)
-                else:
-                    raise Exception(f"Failed to initialize AssistantManager after {self.MAX_RETRIES} attempts: {str(e)}")
-
-    def generate_resume_package(self, input_data):
+    def generate_resume_package(self, input_data, on_wait=None):
         """Generate the resume package using the assistant"""
+        *_, final = self.stream_resume_package(input_data, incremental=False, on_wait=on_wait)
+        return final.value
+
+    def stream_resume_package(self, input_data, incremental=True, on_wait=None):
+        """Generate the resume package, yielding PartialValue updates as it streams in.
+
+        Each top-level key of the package is yielded once its value is complete,
+        and string values in progress are yielded with ``complete=False``. The last
+        update has ``key=None`` and carries the validated package. Retries of
+        failed API calls share one budget for the whole request.
+
+        Uncached requests first wait in the admission queue; ``on_wait`` is
+        called with a QueueStatus (place in line and estimated wait) while they do.
+        """
+        with span("generate_resume_package", provider=self.provider.id, incremental=incremental), \
+                retry_budget():
+            cache_key = None
+            if self.response_cache is not None:
+                with span("response_cache.get") as lookup:
+                    cache_key = self.response_cache.key(input_data, self.provider)
+                    cached = self.response_cache.get(cache_key)
+                    lookup.set(hit=cached is not None)
+                if cached is not None:
+                    REQUESTS.inc(result="cached")
+                    yield PartialValue(None, cached, True)
+                    return
+
+            content = json.dumps(input_data)
+            admission = (self.admission.admit(content, on_wait) if self.admission is not None
+                         else contextlib.nullcontext())
+            try:
+                with admission:
+                    parser = IncrementalJSONParser() if incremental else None
+                    chunks = []
+                    # Submit the request to the provider
+                    with span("provider.create_run"):
+                        try:
+                            run = self.provider.create_run(content)
+                        except Exception:
+                            REQUESTS.inc(result="failed")
+                            raise
+                    run_status, result = "error", "failed"
+                    try:
+                        # Run the assistant and read its reply as it arrives
+                        with span("provider.run") as reply_span:
+                            for chunk in self.provider.iter_reply(run):
+                                if not chunks:
+                                    reply_span.set(first_chunk_ms=round(reply_span.duration_ms, 3))
+                                chunks.append(chunk)
+                                if parser is not None:
+                                    yield from parser.feed(chunk)
+                            reply_span.set(chunks=len(chunks))
+                        run_status = "completed"
+                        response = ''.join(chunks)
+
+                        if not response or not response.strip():
+                            raise ValueError("Empty response received from assistant")
+
+                        with span("parse_response", bytes=len(response)):
+                            parsed_response = self._parse_response(response)
+                        if cache_key is not None:
+                            with span("response_cache.put"):
+                                self.response_cache.put(cache_key, parsed_response)
+                        result = "generated"
+
+                    except TimeoutError as e:
+                        run_status = "timeout"
+                        logger.error(f"Timeout error: {str(e)}")
+                        raise
+                    except ValueError as e:
+                        logger.error(f"Validation error: {str(e)}")
+                        raise
+                    except Exception as e:
+                        if isinstance(e, RunFailedError):
+                            run_status = "failed"
+                        logger.error(f"Unexpected error: {str(e)}")
+                        raise
+                    finally:
+                        self.provider.finish_run(run)
+                        RUNS.inc(status=run_status)
+                        REQUESTS.inc(result=result)
+            except AdmissionRejected as e:
+                REQUESTS.inc(result="rejected")
+                logger.warning(f"Request turned away by admission control: {str(e)}")
+                raise
+
+            yield PartialValue(None, parsed_response, True)
+
+    def close(self):
+        """Release the provider's resources, such as pooled threads"""
+        self.provider.close()
+
+    def _parse_response(self, response):
+        """Extract and validate the resume package in the assistant's reply"""
+        # Log the raw response for debugging
+        logger.info("Raw assistant response received")
+        logger.debug(f"Response content: {response[:500]}...")
+
         try:
-            # Create a thread
-            thread = self.client.beta.threads.create()
+            parsed_response = parse_resume_package(response)
+        except ResponseFormatError as e:
+            if e.line is not None:
+                logger.error(f"JSON parsing error at line {e.line}, column {e.column}")
+            elif e.path:
+                logger.error(f"Invalid resume package at {e.path}")
+            logger.debug(f"Invalid response content: {response}")
+            raise
 
-            # Add the message to the thread
-            self.client.beta.threads.messages.create(
-                thread_id=thread.id,
-                role="user",
-                content=json.dumps(input_data))
+        logger.info("Successfully validated resume package structure")
+        return parsed_response
 
-            # Run the assistant
-            run = self.client.beta.threads.runs.create(
-                thread_id=thread.id, assistant_id=self.assistant.id)
+class AsyncAssistantManager:
+    """Asyncio-native counterpart of AssistantManager.
 
-            # Wait for completion with timeout
-            timeout = 300  # 5 minutes timeout
-            start_time = time.time()
+    All runs share one AsyncOpenAI client and its connection pool, and at most
+    ``max_concurrency`` runs are in flight at once, so hundreds of jobs can be
+    awaited from a single event loop.
+    """
+    MAX_RETRIES = AssistantManager.MAX_RETRIES
+    RETRY_DELAY = AssistantManager.RETRY_DELAY
+    RUN_TIMEOUT = AssistantManager.RUN_TIMEOUT
+    STREAM_RUNS = AssistantManager.STREAM_RUNS
+    POLL_BACKOFF = AssistantManager.POLL_BACKOFF
+    MAX_CONCURRENT_RUNS = 100
 
-            while True:
-                if time.time() - start_time > timeout:
-                    raise TimeoutError(
-                        "Assistant response timeout after 5 minutes")
+    def __init__(self, max_concurrency=None):
+        """Create the shared async client; the assistant is retrieved on first use"""
+        from openai import AsyncOpenAI
 
-                run_status = self.client.beta.threads.runs.retrieve(
-                    thread_id=thread.id, run_id=run.id)
+        self.max_concurrency = max_concurrency or self.MAX_CONCURRENT_RUNS
+        self.client = AsyncOpenAI(
+            api_key=os.getenv("OPENAI_API_KEY"),
+            http_client=create_async_http_client(self.max_concurrency),
+            timeout=http_timeout(),
+            max_retries=0)
+        self.retry = RetryPolicy.from_settings()
+        self.assistant = None
+        self.response_cache = ResponseCache.from_settings()
+        self.thread_pool = AsyncAssistantThreadPool(self.client, retry=self.retry, **THREAD_POOL)
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._init_lock = asyncio.Lock()
 
-                if run_status.status == 'completed':
-                    break
-                elif run_status.status == 'failed':
-                    raise Exception(
-                        f"Assistant run failed: {run_status.last_error}")
+    async def initialize(self):
+        """Retrieve the assistant with retry logic"""
+        async with self._init_lock:
+            if self.assistant is not None:
+                return
+            for attempt in range(self.MAX_RETRIES):
+                try:
+                    agent_id = os.getenv("agent_id")
+                    if not agent_id:
+                        raise ValueError("agent_id not found in environment variables")
 
-                time.sleep(1)
+                    self.assistant = await self.client.beta.assistants.retrieve(agent_id)
+                    logger.info(f"Successfully initialized AsyncAssistantManager with assistant: {self.assistant.id}")
+                    self.thread_pool.start()
+                    return
 
-            # Get the response
-            messages = self.client.beta.threads.messages.list(
-                thread_id=thread.id)
+                except Exception as e:
+                    logger.error(f"Attempt {attempt + 1} failed: {str(e)}")
+                    if attempt < self.MAX_RETRIES - 1:
+                        logger.info(f"Retrying in {self.RETRY_DELAY} seconds...")
+                        INIT_RETRIES.inc()
+                        await asyncio.sleep(self.RETRY_DELAY)
+                    else:
+                        raise Exception(f"Failed to initialize AsyncAssistantManager after {self.MAX_RETRIES} attempts: {str(e)}")
 
-            if not messages.data:
-                raise ValueError("No response received from assistant")
+    async def generate_resume_package(self, input_data):
+        """Generate the resume package using the assistant"""
+        if self.assistant is None:
+            await self.initialize()
 
-            # Parse the response
-            response = messages.data[0].content[0].text.value
+        cache_key = None
+        if self.response_cache is not None:
+            cache_key = self.response_cache.key(input_data, self.assistant)
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                REQUESTS.inc(result="cached")
+                return cached
+
+        try:
+            parsed_response = await self._run(input_data)
+        except BaseException:
+            REQUESTS.inc(result="failed")
+            raise
+        if cache_key is not None:
+            self.response_cache.put(cache_key, parsed_response)
+        REQUESTS.inc(result="generated")
+        return parsed_response
+
+    async def _run(self, input_data):
+        """Run the assistant on the request and return the validated package"""
+        async with self._semaphore:
+            with retry_budget():
+                response = await self._complete(input_data)
+
+        # Validation is CPU-only, so release the slot before doing it
+        try:
+            return self._parse_response(response)
+        except ValueError as e:
+            logger.error(f"Validation error: {str(e)}")
+            raise
+
+    async def _complete(self, input_data):
+        """Post the request to a pooled thread and return the assistant's reply"""
+        thread_id = await self.thread_pool.acquire()
+        run_status = "error"
+        try:
+            await self.retry.call_async(
+                self.client.beta.threads.messages.create,
+                thread_id=thread_id,
+                role="user",
+                content=json.dumps(input_data),
+                operation="messages.create")
+
+            response = await complete_run_async(
+                self.client, thread_id, self.assistant.id,
+                timeout=self.RUN_TIMEOUT, stream=self.STREAM_RUNS,
+                backoff=self.POLL_BACKOFF, retry=self.retry)
+            run_status = "completed"
 
             if not response or not response.strip():
                 raise ValueError("Empty response received from assistant")
 
-            # Log the raw response for debugging
-            logger.info("Raw assistant response received")
-            logger.debug(f"Response content: {response[:500]}...")
-
-            # Clean up the response string
-            # Remove any potential markdown code block markers and clean the JSON string
-            response = response.strip()
-            # Handle different markdown code block formats
-            if '```json' in response:
-                response = response.split('```json')[1].split('```')[0].strip()
-            elif '```' in response:
-                response = response.split('```')[1].split('```')[0].strip()
-            
-            # Remove any trailing commas before closing braces/brackets
-            response = re.sub(r',(\s*[}\]])', r'\1', response)
-            
-            try:
-                # Parse the JSON response with detailed error handling
-                try:
-                    parsed_response = json.loads(response)
-                except json.JSONDecodeError as e:
-                    # Try to identify the specific parsing error
-                    error_line = str(e).split(' line ')[1].split()[0]
-                    error_col = str(e).split(' column ')[1].split()[0]
-                    content_lines = response.split('\n')
-                    error_context = content_lines[int(error_line)-1] if int(error_line) <= len(content_lines) else "Context not available"
-                    
-                    logger.error(f"JSON parsing error at line {error_line}, column {error_col}")
-                    logger.error(f"Error context: {error_context}")
-                    logger.debug(f"Full response content:\n{response}")
-                    
-                    raise ValueError(
-                        f"Failed to parse assistant response as JSON. Error at line {error_line}, column {error_col}. "
-                        f"Context: {error_context}")
-            except Exception as e:
-                logger.error(f"Unexpected error during JSON parsing: {str(e)}")
-                logger.debug(f"Invalid JSON content: {response}")
-                raise ValueError(f"Failed to parse assistant response: {str(e)}")
-
-            # Validate required keys
-            required_keys = ['cv', 'structured_cv', 'cover_letter', 'analysis']
-            missing_keys = [
-                key for key in required_keys if key not in parsed_response
-            ]
-            if missing_keys:
-                raise ValueError(
-                    f"Missing required keys in response: {', '.join(missing_keys)}"
-                )
-
-            # Validate structured_cv format with detailed checks
-            structured_cv = parsed_response.get('structured_cv', {})
-            if not isinstance(structured_cv, dict):
-                raise ValueError("structured_cv must be a dictionary")
-
-            required_cv_sections = [
-                'name', 'contact','professional_summary', 'work_experience', 'education', 'skills'
-            ]
-            missing_sections = [
-                section for section in required_cv_sections
-                if section not in structured_cv
-            ]
-            if missing_sections:
-                raise ValueError(
-                    f"Missing required sections in structured_cv: {', '.join(missing_sections)}"
-                )
-
-            # Validate data types and nested structures
-            if not isinstance(structured_cv.get('name', ''), str):
-                raise ValueError("Name must be a string")
-                
-            contact_info = structured_cv.get('contact', [])
-            if not isinstance(contact_info, list):
-                raise ValueError("Contact information must be a list")
-            if not all(isinstance(item, str) for item in contact_info):
-                raise ValueError("All contact information items must be strings")
-
-            professional_summary = structured_cv.get('professional_summary', '')
-            if not isinstance(professional_summary, str):
-                raise ValueError("Professional summary must be a string")
-
-            work_experience = structured_cv.get('work_experience', [])
-            if not isinstance(work_experience, list):
-                raise ValueError("Work experience must be a list")
-            for idx, job in enumerate(work_experience):
-                if not isinstance(job, dict):
-                    raise ValueError(f"Work experience item {idx} must be a dictionary")
-                required_job_fields = ['title', 'company', 'dates', 'responsibilities']
-                missing_fields = [field for field in required_job_fields if field not in job]
-                if missing_fields:
-                    raise ValueError(f"Work experience item {idx} missing required fields: {', '.join(missing_fields)}")
-                if not isinstance(job.get('responsibilities', []), list):
-                    raise ValueError(f"Work experience item {idx} responsibilities must be a list")
-
-            education = structured_cv.get('education', [])
-            if not isinstance(education, list):
-                raise ValueError("Education must be a list")
-            for idx, edu in enumerate(education):
-                if not isinstance(edu, dict):
-                    raise ValueError(f"Education item {idx} must be a dictionary")
-                required_edu_fields = ['degree', 'institution', 'dates', 'details']
-                missing_fields = [field for field in required_edu_fields if field not in edu]
-                if missing_fields:
-                    raise ValueError(f"Education item {idx} missing required fields: {', '.join(missing_fields)}")
-                if not isinstance(edu.get('details', []), list):
-                    raise ValueError(f"Education item {idx} details must be a list")
-
-            skills = structured_cv.get('skills', {})
-            if not isinstance(skills, dict):
-                raise ValueError("Skills must be a dictionary")
-            for category, skill_list in skills.items():
-                if not isinstance(skill_list, list):
-                    raise ValueError(f"Skills category '{category}' must contain a list of skills")
-                if not all(isinstance(skill, str) for skill in skill_list):
-                    raise ValueError(f"All skills in category '{category}' must be strings")
-
-            logger.info("Successfully validated resume package structure")
-            return parsed_response
-
         except TimeoutError as e:
+            run_status = "timeout"
             logger.error(f"Timeout error: {str(e)}")
             raise
         except ValueError as e:
             logger.error(f"Validation error: {str(e)}")
             raise
         except Exception as e:
+            if isinstance(e, RunFailedError):
+                run_status = "failed"
             logger.error(f"Unexpected error: {str(e)}")
             raise
+        finally:
+            self.thread_pool.release(thread_id)
+            RUNS.inc(status=run_status)
+        return response
+
+    async def close(self):
+        """Delete pooled threads and close the shared connection pool"""
+        await self.thread_pool.close()
+        await self.client.close()
+
+    async def __aenter__(self):
+        await self.initialize()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    _parse_response = AssistantManager._parse_response
@@ -0,0 +1,208 @@
+"""Headless batch generation of resume packages for many job postings.
+
+Example:
+
+    python batch.py postings.jsonl --resume resume.md --output-dir output/batch --workers 4
+
+Postings are read from a JSONL or CSV file with the columns ``job_name``,
+``job_description``, ``location``, ``employer_info`` and ``language`` (plus an
+optional ``id``). Each finished package is written to its own directory together
+with its PDF and DOCX resumes, and recorded in a checkpoint file so that an
+interrupted batch can be re-run without repeating finished postings.
+"""
+import argparse
+import csv
+import json
+import logging
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, List, Set
+
+from dotenv import load_dotenv
+
+from src.utils.cache import canonical_hash
+from src.utils.helpers import sanitize_filename
+from utils import read_markdown_file
+
+logger = logging.getLogger(__name__)
+
+POSTING_FIELDS = ['job_name', 'job_description', 'location', 'employer_info', 'language']
+POSTING_DEFAULTS = {'location': 'Remote', 'language': 'English'}
+
+
+def read_postings(path: Path) -> List[Dict[str, str]]:
+    """Read job postings from a JSONL or CSV file"""
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        if path.suffix.lower() == '.csv':
+            rows = list(csv.DictReader(f))
+        else:
+            rows = [json.loads(line) for line in f if line.strip()]
+
+    postings = []
+    for line_number, row in enumerate(rows, start=1):
+        posting = {field: (row.get(field) or POSTING_DEFAULTS.get(field, '')).strip()
+                   for field in POSTING_FIELDS}
+        missing = [field for field in ('job_name', 'job_description', 'employer_info')
+                   if not posting[field]]
+        if missing:
+            raise ValueError(f"Posting {line_number} is missing: {', '.join(missing)}")
+        # Rows without an explicit id are identified by their content
+        posting['id'] = str(row.get('id') or canonical_hash(posting)[:16])
+        postings.append(posting)
+    return postings
+
+
+def read_resume(path: Path) -> str:
+    """Load the resume source as markdown"""
+    if path.suffix.lower() in ('.pdf', '.docx'):
+        from src.core.document_converter import DocumentConverter
+        try:
+            return DocumentConverter.from_settings().convert(path.read_bytes(), path.suffix)
+        except ValueError:
+            raise ValueError(f"Could not extract text from {path}")
+    return read_markdown_file(file_path=str(path))
+
+
+class Checkpoint:
+    """Append-only JSONL record of finished postings"""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def completed_ids(self) -> Set[str]:
+        if not self.path.exists():
+            return set()
+        with open(self.path, 'r', encoding='utf-8') as f:
+            return {json.loads(line)['id'] for line in f if line.strip()}
+
+    def record(self, posting_id: str, output_dir: Path, latency: float) -> None:
+        entry = {'id': posting_id, 'output_dir': str(output_dir),
+                 'latency': round(latency, 3), 'finished_at': time.time()}
+        with self._lock, open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry) + '\n')
+            f.flush()
+
+
+def write_artifacts(package: Dict, posting: Dict[str, str], job_dir: Path) -> None:
+    """Write the package and its rendered resumes to ``job_dir``"""
+    from export_pdf import generate_resume_pdf
+    from export_docx import generate_resume_docx
+
+    job_dir.mkdir(parents=True, exist_ok=True)
+    with open(job_dir / 'package.json', 'w', encoding='utf-8') as f:
+        json.dump(package, f, ensure_ascii=False, indent=2)
+    for key in ('cv', 'cover_letter', 'analysis'):
+        (job_dir / f'{key}.md').write_text(package[key], encoding='utf-8')
+
+    language = posting['language']
+    if not generate_resume_pdf(package['structured_cv'], language=language,
+                               output_path=str(job_dir / 'resume.pdf')):
+        raise RuntimeError("Failed to generate PDF resume")
+    if not generate_resume_docx(package['structured_cv'], language=language,
+                                output_path=str(job_dir / 'resume.docx')):
+        raise RuntimeError("Failed to generate DOCX resume")
+
+
+def run_job(assistant, posting: Dict[str, str], resume_content: str, job_dir: Path) -> float:
+    """Generate and export one posting, returning its latency in seconds"""
+    start = time.perf_counter()
+    input_data = {field: posting[field] for field in POSTING_FIELDS}
+    input_data['resume_content'] = resume_content
+    package = assistant.generate_resume_package(input_data)
+    write_artifacts(package, posting, job_dir)
+    return time.perf_counter() - start
+
+
+def job_directory(output_dir: Path, posting: Dict[str, str]) -> Path:
+    name = sanitize_filename(posting['job_name']).replace(' ', '_')[:60]
+    return output_dir / f"{name}_{posting['id']}"
+
+
+def run_batch(postings: List[Dict[str, str]], resume_content: str, output_dir: Path,
+              workers: int = 4, checkpoint_path: Path = None, assistant=None,
+              out=sys.stdout) -> Dict[str, int]:
+    """Run every unfinished posting through the assistant on a bounded worker pool"""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    checkpoint = Checkpoint(checkpoint_path or output_dir / 'checkpoint.jsonl')
+    finished = checkpoint.completed_ids()
+    pending = [posting for posting in postings if posting['id'] not in finished]
+    skipped = len(postings) - len(pending)
+    if skipped:
+        print(f"Skipping {skipped} posting(s) already finished in {checkpoint.path}", file=out)
+    if not pending:
+        return {'completed': 0, 'failed': 0, 'skipped': skipped}
+
+    owns_assistant = assistant is None
+    if owns_assistant:
+        from assistant_manager import AssistantManager
+        assistant = AssistantManager()
+
+    # Workers beyond what the admission queue holds would be turned away instead of waiting
+    admission = getattr(assistant, 'admission', None)
+    if admission is not None:
+        capacity = admission.queue.max_concurrent + admission.queue.max_queued
+        if workers > capacity:
+            print(f"Limiting to {capacity} workers, the assistant's admission capacity", file=out)
+            workers = capacity
+
+    completed = failed = 0
+    start = time.perf_counter()
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(run_job, assistant, posting, resume_content,
+                            job_directory(output_dir, posting)): posting
+                for posting in pending
+            }
+            for future in as_completed(futures):
+                posting = futures[future]
+                done = completed + failed + 1
+                try:
+                    latency = future.result()
+                except Exception as e:
+                    failed += 1
+                    print(f"[{done}/{len(pending)}] FAILED {posting['job_name']} ({posting['id']}): {str(e)}",
+                          file=out)
+                    continue
+                completed += 1
+                job_dir = job_directory(output_dir, posting)
+                checkpoint.record(posting['id'], job_dir, latency)
+                print(f"[{done}/{len(pending)}] {posting['job_name']} ({posting['id']}) "
+                      f"in {latency:.2f}s -> {job_dir}", file=out)
+    finally:
+        if owns_assistant:
+            assistant.close()
+
+    elapsed = time.perf_counter() - start
+    print(f"Finished {completed} posting(s), {failed} failed, in {elapsed:.2f}s "
+          f"({completed / elapsed:.2f} jobs/s with {workers} workers)", file=out)
+    return {'completed': completed, 'failed': failed, 'skipped': skipped}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Generate resume packages for many job postings")
+    parser.add_argument('postings', type=Path, help="JSONL or CSV file of job postings")
+    parser.add_argument('--resume', type=Path, default=Path('resume.md'),
+                        help="Resume source (markdown, text, PDF or DOCX)")
+    parser.add_argument('--output-dir', type=Path, default=Path('output') / 'batch')
+    parser.add_argument('--workers', type=int, default=4, help="Maximum concurrent assistant runs")
+    parser.add_argument('--checkpoint', type=Path,
+                        help="Checkpoint file (default: <output-dir>/checkpoint.jsonl)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+    load_dotenv()
+
+    postings = read_postings(args.postings)
+    resume_content = read_resume(args.resume)
+    summary = run_batch(postings, resume_content, args.output_dir,
+                        workers=args.workers, checkpoint_path=args.checkpoint)
+    return 1 if summary['failed'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
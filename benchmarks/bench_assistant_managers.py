@@ -0,0 +1,101 @@
+"""Throughput of AssistantManager vs AsyncAssistantManager against the local fake API.
+
+Run from the project root:
+
+    python -m benchmarks.bench_assistant_managers --run-duration 0.5
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from tests.fake_assistants import FakeAssistantsServer
+from assistant_manager import AssistantManager, AsyncAssistantManager
+from src.config.settings import RATE_LIMIT, RESPONSE_CACHE
+
+PACKAGE = {
+    "cv": "# Jane Doe",
+    "structured_cv": {
+        "name": "Jane Doe",
+        "contact": ["jane@example.com"],
+        "professional_summary": "Data analyst with a decade of experience in analytics and reporting.",
+        "work_experience": [{"title": "Analyst", "company": "Acme", "dates": "2015-2024",
+                             "responsibilities": ["Built dashboards"]}],
+        "education": [{"degree": "BSc", "institution": "State University", "dates": "2011-2015",
+                       "details": ["Statistics"]}],
+        "skills": {"Technical": ["Python", "SQL"]}
+    },
+    "cover_letter": "Dear Hiring Manager,",
+    "analysis": "Good match."
+}
+
+INPUT = {
+    "language": "English",
+    "job_name": "Data Analyst",
+    "job_description": "Analyze data.",
+    "location": "Remote",
+    "employer_info": "Acme Corp.",
+    "resume_content": "# Jane Doe"
+}
+
+
+def bench_sync(concurrency: int, jobs: int) -> float:
+    manager = AssistantManager()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(lambda _: manager.generate_resume_package(INPUT), range(jobs)))
+    return time.perf_counter() - start
+
+
+def bench_async(concurrency: int, jobs: int) -> float:
+    async def run():
+        async with AsyncAssistantManager(max_concurrency=concurrency) as manager:
+            start = time.perf_counter()
+            await asyncio.gather(*(manager.generate_resume_package(INPUT) for _ in range(jobs)))
+            return time.perf_counter() - start
+
+    return asyncio.run(run())
+
+
+def serve(run_duration: float, ready, stop) -> None:
+    """Run the fake API in its own process so it doesn't compete for the client's GIL"""
+    with FakeAssistantsServer(reply=json.dumps(PACKAGE), run_duration=run_duration) as server:
+        ready.put(server.base_url)
+        stop.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--jobs-per-worker", type=int, default=3)
+    parser.add_argument("--run-duration", type=float, default=0.5,
+                        help="Seconds each fake run stays in progress")
+    args = parser.parse_args()
+
+    ready, stop = multiprocessing.Queue(), multiprocessing.Event()
+    server = multiprocessing.Process(target=serve, args=(args.run_duration, ready, stop), daemon=True)
+    server.start()
+    try:
+        os.environ.update({"OPENAI_API_KEY": "bench", "OPENAI_BASE_URL": ready.get(timeout=10),
+                           "agent_id": "asst_bench"})
+        # Measure the clients themselves, not cache hits or the client-side quotas
+        RESPONSE_CACHE["enabled"] = False
+        RATE_LIMIT["enabled"] = False
+
+        print(f"{'concurrency':>11} {'jobs':>5} {'sync jobs/s':>12} {'async jobs/s':>13}")
+        for concurrency in args.concurrency:
+            jobs = concurrency * args.jobs_per_worker
+            sync_elapsed = bench_sync(concurrency, jobs)
+            async_elapsed = bench_async(concurrency, jobs)
+            print(f"{concurrency:>11} {jobs:>5} {jobs / sync_elapsed:>12.1f} "
+                  f"{jobs / async_elapsed:>13.1f}")
+    finally:
+        stop.set()
+        server.join(timeout=5)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Throughput of bulk PDF rendering: one generate_resume_pdf call per CV vs render_many.
+
+    python -m benchmarks.bench_bulk_render --documents 200 --workers 4
+"""
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.synthetic_cv import make_structured_cv
+from src.exporters.bulk_renderer import DirectorySink, ZipSink, peak_rss_bytes, render_many
+from src.exporters.pdf_exporter import generate_resume_pdf
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--documents", type=int, default=200)
+    parser.add_argument("--jobs", type=int, default=8, help="Work experience entries per CV")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    cvs = [make_structured_cv(jobs=args.jobs, seed=idx) for idx in range(args.documents)]
+    print(f"{args.documents} CVs with {args.jobs} jobs each, {args.workers} worker(s), "
+          f"{os.cpu_count()} CPU(s)")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        out = Path(tmp) / "sequential"
+        out.mkdir()
+        start = time.perf_counter()
+        for idx, cv in enumerate(cvs):
+            generate_resume_pdf(cv, output_path=str(out / f"cv_{idx}.pdf"))
+        elapsed = time.perf_counter() - start
+        print(f"{'sequential generate_resume_pdf':<34} {args.documents / elapsed:>8.1f} docs/s  "
+              f"peak RSS {peak_rss_bytes() / 1024 / 1024:.1f}MB")
+
+        jobs = ((f"cv_{idx}", cv) for idx, cv in enumerate(cvs))
+        report = render_many(jobs, DirectorySink(Path(tmp) / "in_process"), workers=0)
+        print(f"{'render_many in-process':<34} {report.docs_per_sec:>8.1f} docs/s  "
+              f"peak RSS {report.peak_rss_bytes / 1024 / 1024:.1f}MB")
+
+        for label, sink in (("render_many -> directory", DirectorySink(Path(tmp) / "pool")),
+                            ("render_many -> zip", ZipSink(Path(tmp) / "resumes.zip"))):
+            jobs = ((f"cv_{idx}", cv) for idx, cv in enumerate(cvs))
+            report = render_many(jobs, sink, workers=args.workers)
+            print(f"{label:<34} {report.docs_per_sec:>8.1f} docs/s  "
+                  f"peak worker RSS {report.peak_rss_bytes / 1024 / 1024:.1f}MB")
+
+
+if __name__ == "__main__":
+    main()
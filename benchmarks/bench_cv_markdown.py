@@ -0,0 +1,85 @@
+"""CV markdown regeneration: string concatenation vs the incremental section renderer.
+
+    python -m benchmarks.bench_cv_markdown --jobs 50 --skills 200
+"""
+import argparse
+import timeit
+
+from benchmarks.synthetic_cv import make_structured_cv
+from src.exporters.cv_markdown import CVMarkdownRenderer
+
+
+def legacy_format_cv_from_structure(structured_cv):
+    """format_cv_from_structure before the incremental renderer"""
+    cv_text = f"# {structured_cv['name']}\n\n"
+
+    cv_text += "## Contact\n"
+    for contact_item in structured_cv['contact']:
+        cv_text += f"- {contact_item}\n"
+    cv_text += "\n"
+
+    cv_text += "## Professional Summary\n"
+    cv_text += structured_cv['professional_summary'] + "\n\n"
+
+    cv_text += "## Work Experience\n\n"
+    for job in structured_cv['work_experience']:
+        cv_text += f"### {job['title']}\n"
+        cv_text += f"**{job['company']}** | {job['dates']}\n"
+        for resp in job['responsibilities']:
+            cv_text += f"- {resp}\n"
+        cv_text += "\n"
+
+    cv_text += "## Education\n\n"
+    for edu in structured_cv['education']:
+        cv_text += f"### {edu['degree']}\n"
+        cv_text += f"**{edu['institution']}** | {edu['dates']}\n"
+        for detail in edu['details']:
+            cv_text += f"- {detail}\n"
+        cv_text += "\n"
+
+    cv_text += "## Skills\n\n"
+    for category, skills in structured_cv['skills'].items():
+        cv_text += f"### {category}\n"
+        for skill in skills:
+            cv_text += f"- {skill}\n"
+        cv_text += "\n"
+
+    return cv_text
+
+
+def _best(statement, number):
+    return min(timeit.repeat(statement, number=number, repeat=5)) / number
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=50)
+    parser.add_argument("--skills", type=int, default=200)
+    parser.add_argument("--number", type=int, default=200)
+    args = parser.parse_args()
+
+    cv = make_structured_cv(jobs=args.jobs, skills=args.skills)
+    renderer = CVMarkdownRenderer()
+    assert renderer.render(cv) == legacy_format_cv_from_structure(cv)
+    edits = iter(range(10 ** 9))
+
+    def edit_one_responsibility():
+        cv['work_experience'][args.jobs // 2]['responsibilities'][0] = f"Edited responsibility {next(edits)}"
+        return renderer.render(cv)
+
+    rows = [
+        ("concatenation (every update)", _best(lambda: legacy_format_cv_from_structure(cv), args.number)),
+        ("renderer, cold cache", _best(lambda: CVMarkdownRenderer().render(cv), args.number)),
+        ("renderer, nothing changed", _best(lambda: renderer.render(cv), args.number)),
+        ("renderer, one responsibility edited", _best(edit_one_responsibility, args.number)),
+    ]
+    assert renderer.render(cv) == legacy_format_cv_from_structure(cv)
+
+    print(f"CV with {args.jobs} jobs and {args.skills} skills, "
+          f"{len(legacy_format_cv_from_structure(cv)) / 1024:.0f}KB of markdown")
+    for label, seconds in rows:
+        print(f"{label:<38} {seconds * 1e6:>9.1f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Script-run time per resume-editor interaction: whole page vs lazy tabs vs section fragments.
+
+    python -m benchmarks.bench_editor_reruns --jobs 15 --skills 100
+
+Each interaction is replayed through streamlit's AppTest against three views:
+
+* ``whole page``  every tab is built on each run, as before lazy tabs
+* ``lazy tabs``   only the open (Resume) tab is built
+* ``fragment``    only the edited section, which is what a fragment rerun executes
+
+Buttons that change a list trigger a second run (``st.rerun``), so their
+timings cover the click run plus the rerun.
+"""
+import argparse
+import copy
+import statistics
+import time
+
+from streamlit.testing.v1 import AppTest
+
+from benchmarks.synthetic_cv import make_structured_cv
+
+
+def _editor_script(view, section):
+    import streamlit as st
+    import main
+
+    response = st.session_state.response
+    if view == "fragment":
+        getattr(main, section)(response['structured_cv'])
+    else:
+        tabs = main.lazy_tabs(main.RESULT_TABS) if view == "lazy tabs" else st.tabs(main.RESULT_TABS)
+        main.show_package(tabs, response, "English")
+
+
+def _package(cv):
+    return {"analysis": "Synthetic analysis.\n" * 20, "cv": "# Jordan Example\n" * 20,
+            "cover_letter": "Dear hiring team,\n" * 20, "structured_cv": copy.deepcopy(cv)}
+
+
+def _interactions(cv):
+    category = next(iter(cv['skills']))
+    return [
+        ("load results", "edit_skills", None),
+        ("edit a skill", "edit_skills",
+         lambda at: at.text_input(key=f"skill_{category}_0").input("Edited skill")),
+        ("delete a skill", "edit_skills",
+         lambda at: at.button(key=f"del_skill_{category}_0").click()),
+        ("add a responsibility", "edit_work_experience",
+         lambda at: at.button(key="add_resp_0_0").click()),
+        ("edit summary", "edit_professional_summary",
+         lambda at: at.text_area[0].input("New summary")),
+    ]
+
+
+def _time_interaction(cv, view, section, action, repeat):
+    samples = []
+    for _ in range(repeat):
+        at = AppTest.from_function(_editor_script, args=(view, section), default_timeout=60)
+        at.session_state["response"] = _package(cv)
+        at.session_state["active_tab"] = "Resume"
+        start = time.perf_counter()
+        at.run()
+        if action is not None:
+            start = time.perf_counter()
+            action(at).run()
+        samples.append(time.perf_counter() - start)
+        if at.exception:
+            raise RuntimeError(at.exception[0].message)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=15)
+    parser.add_argument("--skills", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    cv = make_structured_cv(jobs=args.jobs, skills=args.skills)
+    views = ("whole page", "lazy tabs", "fragment")
+    print(f"CV with {args.jobs} jobs and {args.skills} skills, median of {args.repeat} run(s)")
+    print(f"{'interaction':<22}" + "".join(f"{view:>14}" for view in views))
+    for label, section, action in _interactions(cv):
+        timings = [_time_interaction(cv, view, section, action, args.repeat) for view in views]
+        print(f"{label:<22}" + "".join(f"{seconds * 1000:>12.0f}ms" for seconds in timings))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Cold import time of the app's modules and start-up time of an ingestion worker.
+
+    python -m benchmarks.bench_import_time --runs 7
+    python -m benchmarks.bench_import_time --output benchmarks/results/import.json
+
+Every import is timed in a fresh interpreter so nothing is already in
+sys.modules, and ``-X importtime`` names the slowest direct imports behind
+each module. The worker figure is how much longer the first conversion on a
+new ingestion pool takes than a conversion on a warm one: process spawn plus
+the imports the worker needs.
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from benchmarks.suite import environment
+from src.core.ingestion import IngestionService
+
+ROOT = Path(__file__).resolve().parent.parent
+MODULES = ["src.config.settings", "src.core.ingestion", "src.exporters.export_cache",
+           "assistant_manager", "export_pdf", "export_docx", "main"]
+
+
+def _python(code: str, *flags: str) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, *flags, "-c", code], cwd=ROOT, capture_output=True,
+                          text=True, check=True)
+
+
+def cold_import_seconds(module: str) -> float:
+    """Seconds to import ``module`` in a fresh interpreter, excluding interpreter start-up"""
+    code = f"import time; start = time.perf_counter(); import {module}; print(time.perf_counter() - start)"
+    return float(_python(code).stdout.strip().splitlines()[-1])
+
+
+def slowest_imports(module: str, top: int = 5) -> List[Tuple[str, float]]:
+    """The direct imports of ``module`` that take longest, with their cumulative seconds"""
+    stderr = _python(f"import {module}", "-X", "importtime").stderr
+    children: List[Tuple[str, float]] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or not line.split("|")[1].strip().isdigit():
+            continue
+        _, cumulative, name = line.split("|")
+        # Entries are listed children first; a top-level entry closes the imports beneath it
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        if depth == 0:
+            if name.strip() == module:
+                break
+            children = []
+        elif depth == 1:
+            children.append((name.strip(), int(cumulative) / 1e6))
+    return sorted(children, key=lambda child: child[1], reverse=True)[:top]
+
+
+def worker_spawn_seconds() -> float:
+    """Extra seconds the first conversion on a new ingestion pool takes over a warm one"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "resume.md"
+        path.write_text("# Jordan Example\n\nData analyst with eight years of experience.\n")
+        with IngestionService(workers=1) as service:
+            start = time.perf_counter()
+            service.ingest_file(path)
+            cold = time.perf_counter() - start
+            start = time.perf_counter()
+            service.ingest_file(path)
+            warm = time.perf_counter() - start
+    return cold - warm
+
+
+def run(modules: List[str], runs: int) -> Dict:
+    results = {"environment": environment(), "imports": [], "worker_spawn": None}
+    for module in modules:
+        samples = [cold_import_seconds(module) for _ in range(runs)]
+        row = {"module": module, "median": statistics.median(samples), "min": min(samples),
+               "slowest_imports": slowest_imports(module)}
+        results["imports"].append(row)
+        slowest = ", ".join(f"{name} {seconds * 1000:.0f}ms" for name, seconds in row["slowest_imports"][:3])
+        print(f"{module:<28} {row['median'] * 1000:>8.1f}ms   {slowest}")
+
+    samples = [worker_spawn_seconds() for _ in range(runs)]
+    results["worker_spawn"] = {"median": statistics.median(samples), "min": min(samples)}
+    print(f"{'ingestion worker spawn':<28} {results['worker_spawn']['median'] * 1000:>8.1f}ms")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--modules", nargs="+", default=MODULES)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--output", type=Path, help="Write the results as JSON")
+    args = parser.parse_args()
+
+    results = run(args.modules, args.runs)
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(results, indent=2))
+        print(f"\nWrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""Render time of a ~10-page synthetic CV with metric wrapping vs the textwrap path.
+
+The legacy renderer is export_pdf.ResumePDF with its previous section methods:
+``textwrap.fill(width=120)`` per paragraph and one ``cell()`` per wrapped line.
+
+    python -m benchmarks.bench_pdf_layout --jobs 58
+"""
+import argparse
+import textwrap
+import timeit
+
+from fpdf.enums import XPos, YPos
+
+from benchmarks.synthetic_cv import make_structured_cv
+from export_pdf import ResumePDF, build_resume_pdf
+
+
+class LegacyResumePDF(ResumePDF):
+    """ResumePDF with the character-count wrapping it used before the layout engine"""
+
+    def add_contact_info(self, contact_info):
+        self.set_font('Times', '', 10)
+        for line in textwrap.fill(' | '.join(contact_info), width=120).split('\n'):
+            self.cell(0, 5, line, new_x=XPos.LMARGIN, new_y=YPos.NEXT, align='C')
+        self.ln(5)
+
+    def add_professional_summary(self, summary, spacing=3.5):
+        self.set_font('Times', '', 10)
+        for line in textwrap.fill(summary, width=120).split('\n'):
+            self.cell(0, spacing, line, new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+        self.ln(5)
+
+    def add_work_experience(self, experience, spacing=3.5):
+        for job in experience:
+            self.set_font('Times', 'B', 10)
+            self.cell(0, spacing, f"{job['title']}", new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+            self.set_font('Times', '', 10)
+            self.cell(0, spacing, f"{job['company']} | {job['dates']}", new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+            for resp in job['responsibilities']:
+                self.cell(5, spacing, '-', new_x=XPos.RIGHT)
+                for idx, line in enumerate(textwrap.fill(resp, width=120).split('\n')):
+                    if idx:
+                        self.cell(5, spacing, '', new_x=XPos.RIGHT)
+                    self.cell(0, spacing, line, new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+            self.ln(3)
+
+    def add_education(self, education, spacing=3.5):
+        for edu in education:
+            self.set_font('Times', 'B', 10)
+            self.cell(0, spacing, f"{edu['degree']}", new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+            self.set_font('Times', '', 10)
+            self.cell(0, spacing, f"{edu['institution']} | {edu['dates']}", new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+            for line in textwrap.fill(', '.join(edu['details']), width=120).split('\n'):
+                self.cell(5, spacing, '-', new_x=XPos.RIGHT)
+                self.cell(0, spacing, line, new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+            self.ln(3)
+
+    def add_skills(self, skills, spacing=3.5):
+        for category, skill_list in skills.items():
+            self.set_font('Times', 'B', 10)
+            self.cell(0, spacing, category, new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+            self.set_font('Times', '', 8)
+            for line in textwrap.fill(', '.join(skill_list), width=120).split('\n'):
+                self.cell(0, spacing, line, new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+            self.ln(3)
+
+
+def overflowing_lines(pdf_class, structured_cv):
+    """Count wrapped lines wider than the usable page width under the legacy wrapping"""
+    pdf = pdf_class()
+    pdf.set_font('Times', '', 10)
+    usable = pdf.w - pdf.l_margin - pdf.r_margin - 5
+    paragraphs = [resp for job in structured_cv['work_experience'] for resp in job['responsibilities']]
+    return sum(pdf.get_string_width(line) > usable
+               for paragraph in paragraphs
+               for line in textwrap.fill(paragraph, width=120).split('\n'))
+
+
+def render(pdf_class, structured_cv):
+    pdf = pdf_class()
+    pdf.add_header(structured_cv['name'])
+    pdf.add_contact_info(structured_cv['contact'])
+    for header, method, key in zip(
+            pdf.headers,
+            (pdf.add_professional_summary, pdf.add_work_experience, pdf.add_education, pdf.add_skills),
+            ('professional_summary', 'work_experience', 'education', 'skills')):
+        pdf.add_section_header(header)
+        method(structured_cv[key])
+    return pdf
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=58, help="Work experience entries (58 is ~10 pages)")
+    parser.add_argument("--number", type=int, default=5, help="Renders per timing repeat")
+    args = parser.parse_args()
+
+    structured_cv = make_structured_cv(jobs=args.jobs)
+    assert build_resume_pdf(structured_cv).pages_count == render(ResumePDF, structured_cv).pages_count
+
+    results = {}
+    for name, pdf_class in (("textwrap + cell per line", LegacyResumePDF),
+                            ("metric wrap + text()", ResumePDF)):
+        def run():
+            bytes(render(pdf_class, structured_cv).output())
+        seconds = min(timeit.repeat(run, number=args.number, repeat=3)) / args.number
+        pages = render(pdf_class, structured_cv).pages_count
+        results[name] = seconds
+        print(f"{name:<28} {seconds * 1000:>9.1f} ms  {pages:>3} pages")
+
+    legacy, metric = results.values()
+    print(f"metric wrapping is {legacy / metric:.2f}x the speed of the textwrap path")
+    print(f"legacy lines overflowing the usable width: {overflowing_lines(ResumePDF, structured_cv)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""Micro-benchmark of assistant reply extraction over the recorded reply corpus.
+
+Compares the shared single-pass extractor with the two paths it replaced:
+the split/regex/json.loads/isinstance chain of assistant_manager.py and the
+split/replace/json.loads/Pydantic round-trip of src/core/assistant.py.
+
+    python -m benchmarks.bench_response_parsing
+"""
+import argparse
+import json
+import re
+import timeit
+from pathlib import Path
+
+from src.core.response_parser import parse_resume_package
+from src.models.resume import ResumePackage
+
+CORPUS_DIR = Path(__file__).resolve().parent.parent / "tests" / "data" / "replies"
+
+
+def legacy_manager_parse(response):
+    """The parsing steps of AssistantManager.generate_resume_package before the shared extractor"""
+    response = response.strip()
+    if '```json' in response:
+        response = response.split('```json')[1].split('```')[0].strip()
+    elif '```' in response:
+        response = response.split('```')[1].split('```')[0].strip()
+    response = re.sub(r',(\s*[}\]])', r'\1', response)
+    parsed = json.loads(response)
+    missing = [key for key in ['cv', 'structured_cv', 'cover_letter', 'analysis'] if key not in parsed]
+    if missing:
+        raise ValueError(missing)
+    cv = parsed['structured_cv']
+    if not isinstance(cv, dict):
+        raise ValueError("structured_cv")
+    missing = [s for s in ['name', 'contact', 'professional_summary', 'work_experience',
+                           'education', 'skills'] if s not in cv]
+    if missing:
+        raise ValueError(missing)
+    if not isinstance(cv.get('name', ''), str):
+        raise ValueError("name")
+    if not isinstance(cv['contact'], list) or not all(isinstance(i, str) for i in cv['contact']):
+        raise ValueError("contact")
+    if not isinstance(cv.get('professional_summary', ''), str):
+        raise ValueError("summary")
+    for job in cv['work_experience']:
+        if not isinstance(job, dict) or any(f not in job for f in ['title', 'company', 'dates', 'responsibilities']):
+            raise ValueError("job")
+        if not isinstance(job['responsibilities'], list):
+            raise ValueError("responsibilities")
+    for edu in cv['education']:
+        if not isinstance(edu, dict) or any(f not in edu for f in ['degree', 'institution', 'dates', 'details']):
+            raise ValueError("education")
+        if not isinstance(edu['details'], list):
+            raise ValueError("details")
+    for skill_list in cv['skills'].values():
+        if not isinstance(skill_list, list) or not all(isinstance(s, str) for s in skill_list):
+            raise ValueError("skills")
+    return parsed
+
+
+def legacy_core_parse(response):
+    """src/core/assistant.py's _parse_response before the shared extractor"""
+    response = response.strip()
+    if '```json' in response:
+        response = response.split('```json')[1].split('```')[0].strip()
+    elif '```' in response:
+        response = response.split('```')[1].split('```')[0].strip()
+    response = response.replace(',}', '}').replace(',]', ']')
+    return ResumePackage(**json.loads(response)).dict()
+
+
+PARSERS = {
+    "shared": parse_resume_package,
+    "legacy manager": legacy_manager_parse,
+    "legacy core": legacy_core_parse,
+}
+
+
+def outcome(parser, reply):
+    try:
+        parser(reply)
+        return "ok"
+    except Exception:
+        return "error"
+
+
+def time_parser(parser, reply, number):
+    def run():
+        try:
+            parser(reply)
+        except Exception:
+            pass
+    return min(timeit.repeat(run, number=number, repeat=5)) / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=200, help="Calls per timing repeat")
+    args = parser.parse_args()
+
+    header = f"{'reply':<26}" + "".join(f"{name + ' (us)':>22}" for name in PARSERS)
+    print(header)
+    totals = dict.fromkeys(PARSERS, 0.0)
+    for path in sorted(CORPUS_DIR.glob("*.txt")):
+        reply = path.read_text()
+        cells = []
+        for name, fn in PARSERS.items():
+            micros = time_parser(fn, reply, args.number)
+            totals[name] += micros
+            cells.append(f"{micros:>14.1f} {outcome(fn, reply):>7}")
+        print(f"{path.stem:<26}" + "".join(cells))
+
+    print(f"{'total':<26}" + "".join(f"{totals[name]:>14.1f} {'':>7}" for name in PARSERS))
+    for name in PARSERS:
+        if name != "shared":
+            print(f"shared extractor is {totals[name] / totals['shared']:.1f}x faster than {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Offline throughput and tail latency of generate -> validate -> export on the stub LLM provider.
+
+    python -m benchmarks.bench_stub_pipeline --requests 200 --concurrency 1 8 32 --latency 0.5
+"""
+import argparse
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from assistant_manager import AssistantManager
+from src.config import settings
+from src.core.providers import StubProvider
+from src.exporters.pdf_exporter import render_resume_pdf
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
+
+
+def request(idx):
+    return {
+        "language": "English",
+        "job_name": f"Data Analyst {idx}",
+        "job_description": "Analyze data and build dashboards for the business teams.",
+        "location": "Remote",
+        "employer_info": f"Employer {idx}, a fast-growing analytics company.",
+        "resume_content": "# Jordan Example\n\nData analyst with eight years of experience."
+    }
+
+
+def run_pipeline(manager, input_data):
+    """One request end to end; returns (seconds, error)"""
+    start = time.perf_counter()
+    try:
+        package = manager.generate_resume_package(input_data)
+        render_resume_pdf(package['structured_cv'], language=input_data['language'])
+        return time.perf_counter() - start, None
+    except Exception as e:
+        return time.perf_counter() - start, type(e).__name__
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--latency", type=float, default=0.5, help="Median seconds per stub run")
+    parser.add_argument("--latency-sigma", type=float, default=0.4)
+    parser.add_argument("--failure-rate", type=float, default=0.02)
+    parser.add_argument("--chunk-size", type=int, default=200)
+    args = parser.parse_args()
+
+    # Injected failures are counted below rather than logged one by one
+    logging.disable(logging.ERROR)
+    # Every request is distinct, but keep on-disk cached packages out of the measurement
+    settings.RESPONSE_CACHE["enabled"] = False
+    print(f"{args.requests} requests, stub latency {args.latency}s (sigma {args.latency_sigma}), "
+          f"failure rate {args.failure_rate:.0%}")
+    print(f"{'concurrency':>11} {'req/s':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8} {'failed':>7}")
+    for concurrency in args.concurrency:
+        manager = AssistantManager(provider=StubProvider(
+            latency=args.latency, latency_sigma=args.latency_sigma,
+            failure_rate=args.failure_rate, chunk_size=args.chunk_size))
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            results = list(pool.map(lambda idx: run_pipeline(manager, request(idx)), range(args.requests)))
+        elapsed = time.perf_counter() - start
+        manager.close()
+
+        latencies = sorted(seconds for seconds, error in results if error is None)
+        failed = sum(1 for _, error in results if error is not None)
+        print(f"{concurrency:>11} {len(latencies) / elapsed:>8.1f} "
+              + " ".join(f"{percentile(latencies, q):>7.2f}s" for q in (0.5, 0.95, 0.99, 1.0))
+              + f" {failed:>7}")
+
+
+if __name__ == "__main__":
+    main()
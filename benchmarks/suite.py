@@ -0,0 +1,236 @@
+"""End-to-end benchmark suite: ingestion, generation, validation and export, with JSON results.
+
+    python -m benchmarks.suite                        # everything, results in benchmarks/results/
+    python -m benchmarks.suite --group export --jobs 1 50
+    python -m benchmarks.suite --compare benchmarks/results/<baseline>.json
+
+Every scenario runs on deterministic synthetic CVs of 1 to 50 jobs. Each is
+timed in rounds of enough calls to last ``--min-time``; the JSON keeps the
+per-call statistics of every scenario with the commit, Python and machine
+they were measured on. ``--compare`` prints the change in median time
+against an earlier results file and exits non-zero when any scenario got
+slower than ``--threshold``.
+"""
+import argparse
+import importlib.util
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional
+
+from benchmarks.synthetic_cv import make_package, make_structured_cv
+from src.config import settings
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+DEFAULT_JOBS = [1, 5, 10, 25, 50]
+
+
+class Scenario(NamedTuple):
+    group: str
+    name: str
+    func: Optional[Callable[[], object]]
+    params: Dict
+    skip: Optional[str] = None  # reason the scenario can't run here
+
+
+def _input_data(jobs: int) -> Dict[str, str]:
+    return {
+        "language": "English",
+        "job_name": f"Data Analyst ({jobs} jobs)",
+        "job_description": "Analyze data and build dashboards for the business teams.",
+        "location": "Remote",
+        "employer_info": "A fast-growing analytics company with a remote-first culture.",
+        "resume_content": "# Jordan Example\n\nData analyst with eight years of experience."
+    }
+
+
+def ingestion_scenarios(jobs_list: List[int], workdir: Path) -> Iterator[Scenario]:
+    from export_docx import render_resume_docx
+    from export_pdf import render_resume_pdf
+    from src.core.document_converter import DocumentConverter
+
+    converter = DocumentConverter()
+    markitdown_missing = None if importlib.util.find_spec("markitdown") else "markitdown is not installed"
+    for jobs in jobs_list:
+        cv = make_structured_cv(jobs=jobs)
+        pdf, docx = render_resume_pdf(cv), render_resume_docx(cv)
+        yield Scenario("ingestion", f"markitdown_pdf[{jobs}]", lambda data=pdf: converter.convert_uncached(data, ".pdf"),
+                       {"jobs": jobs, "bytes": len(pdf)}, markitdown_missing)
+        yield Scenario("ingestion", f"docx_to_markdown[{jobs}]", lambda data=docx: converter.convert_uncached(data, ".docx"),
+                       {"jobs": jobs, "bytes": len(docx)})
+
+
+def generation_scenarios(jobs_list: List[int], workdir: Path) -> Iterator[Scenario]:
+    from assistant_manager import AssistantManager
+    from src.core.providers import StubProvider
+    from src.core.response_parser import parse_resume_package
+    from src.models.resume import ResumePackage
+
+    for jobs in jobs_list:
+        package = make_package(jobs=jobs)
+        reply = f"Here is your package:\n```json\n{json.dumps(package, indent=2)}\n```"
+        manager = AssistantManager(provider=StubProvider(replies=[reply]))
+        manager.response_cache = None
+        input_data = _input_data(jobs)
+        yield Scenario("generation", f"generate_resume_package[{jobs}]",
+                       lambda manager=manager, input_data=input_data: manager.generate_resume_package(input_data),
+                       {"jobs": jobs, "reply_bytes": len(reply)})
+        yield Scenario("validation", f"parse_resume_package[{jobs}]",
+                       lambda reply=reply: parse_resume_package(reply), {"jobs": jobs})
+
+        # The Pydantic model expects technical/soft skill lists and at most five contact lines
+        skills = package["structured_cv"]["skills"]
+        model_payload = dict(package, structured_cv=dict(
+            package["structured_cv"], contact=package["structured_cv"]["contact"][:5],
+            skills={"technical": skills["Technical"] + skills["Tools"],
+                    "soft": skills["Soft Skills"] + skills["Analytics"]}))
+        yield Scenario("validation", f"pydantic_resume_package[{jobs}]",
+                       lambda payload=model_payload: ResumePackage(**payload), {"jobs": jobs})
+
+
+def export_scenarios(jobs_list: List[int], workdir: Path) -> Iterator[Scenario]:
+    from export_docx import generate_resume_docx
+    from export_pdf import generate_resume_pdf
+    from src.exporters.cv_markdown import CVMarkdownRenderer
+
+    for jobs in jobs_list:
+        cv = make_structured_cv(jobs=jobs)
+        warm = CVMarkdownRenderer()
+        warm.render(cv)
+        yield Scenario("export", f"format_cv_from_structure[{jobs}]",
+                       lambda cv=cv: CVMarkdownRenderer().render(cv), {"jobs": jobs, "cache": "cold"})
+        yield Scenario("export", f"format_cv_from_structure_unchanged[{jobs}]",
+                       lambda cv=cv, renderer=warm: renderer.render(cv), {"jobs": jobs, "cache": "warm"})
+        yield Scenario("export", f"generate_resume_pdf[{jobs}]",
+                       lambda cv=cv: generate_resume_pdf(cv, output_path=str(workdir / "resume.pdf")),
+                       {"jobs": jobs})
+        yield Scenario("export", f"generate_resume_docx[{jobs}]",
+                       lambda cv=cv: generate_resume_docx(cv, output_path=str(workdir / "resume.docx")),
+                       {"jobs": jobs})
+
+
+GROUPS = {
+    "ingestion": ingestion_scenarios,
+    "generation": generation_scenarios,  # also yields the validation scenarios
+    "export": export_scenarios,
+}
+
+
+def measure(func: Callable[[], object], min_time: float, rounds: int) -> Dict[str, float]:
+    """Per-call timing statistics over ``rounds`` rounds of at least ``min_time`` seconds each"""
+    func()  # warm-up: imports, font loading, first-call caches
+    calls = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(calls):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time / 10 or calls >= 1_000_000:
+            break
+        calls *= 10
+    calls = max(1, int(calls * (min_time / max(elapsed, 1e-9))))
+
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(calls):
+            func()
+        samples.append((time.perf_counter() - start) / calls)
+    return {
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "mean": statistics.fmean(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "rounds": rounds,
+        "calls_per_round": calls,
+    }
+
+
+def environment() -> Dict[str, object]:
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                                text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def compare(results: Dict, baseline_path: Path, threshold: float) -> int:
+    """Print median-time changes against a baseline; return how many scenarios regressed"""
+    baseline = json.loads(baseline_path.read_text())
+    before_by_name = {row["name"]: row for row in baseline["results"]}
+    regressions = 0
+    print(f"\nAgainst {baseline_path} (commit {baseline['environment']['commit']}):")
+    for row in results["results"]:
+        before = before_by_name.get(row["name"])
+        if "stats" not in row or before is None or "stats" not in before:
+            continue
+        change = row["stats"]["median"] / before["stats"]["median"] - 1
+        flag = ""
+        if change > threshold:
+            regressions += 1
+            flag = "  REGRESSION"
+        print(f"  {row['name']:<48} {change:>+8.1%}{flag}")
+    return regressions
+
+
+def run_suite(groups: List[str], jobs: List[int], min_time: float, rounds: int,
+              out=sys.stdout) -> Dict:
+    """Run the scenarios of ``groups`` and return the results document"""
+    results = {"environment": environment(), "results": []}
+    with tempfile.TemporaryDirectory() as tmp:
+        for group in groups:
+            for scenario in GROUPS[group](jobs, Path(tmp)):
+                row = {"group": scenario.group, "name": scenario.name, "params": scenario.params}
+                if scenario.skip:
+                    row["skipped"] = scenario.skip
+                    print(f"{scenario.name:<48} skipped: {scenario.skip}", file=out)
+                else:
+                    row["stats"] = measure(scenario.func, min_time, rounds)
+                    print(f"{scenario.name:<48} {row['stats']['median'] * 1000:>10.3f}ms "
+                          f"(±{row['stats']['stdev'] * 1000:.3f})", file=out)
+                results["results"].append(row)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--group", choices=sorted(GROUPS), nargs="+", default=sorted(GROUPS))
+    parser.add_argument("--jobs", type=int, nargs="+", default=DEFAULT_JOBS)
+    parser.add_argument("--min-time", type=float, default=0.2, help="Seconds per timing round")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--output", type=Path, help="Results file (default: benchmarks/results/<commit>.json)")
+    parser.add_argument("--compare", type=Path, help="Earlier results file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Slowdown counted as a regression")
+    args = parser.parse_args()
+
+    # Measure the work itself, not cached responses or per-request log lines
+    settings.RESPONSE_CACHE["enabled"] = False
+    logging.disable(logging.INFO)
+    results = run_suite(args.group, args.jobs, args.min_time, args.rounds)
+
+    output = args.output or RESULTS_DIR / f"{results['environment']['commit'] or 'results'}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2))
+    print(f"\nWrote {output}")
+
+    if args.compare and compare(results, args.compare, args.threshold):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Deterministic synthetic structured CVs for benchmarks."""
+import random
+
+from src.exporters.cv_markdown import CVMarkdownRenderer
+
+_VERBS = ["Led", "Built", "Designed", "Automated", "Migrated", "Optimized", "Delivered",
+          "Mentored", "Analyzed", "Launched", "Scaled", "Reduced", "Improved", "Owned"]
+_OBJECTS = ["data pipelines", "executive dashboards", "forecasting models", "ETL jobs",
+            "A/B testing framework", "customer segmentation", "reporting warehouse",
+            "pricing experiments", "churn analysis", "self-service BI platform"]
+_OUTCOMES = ["cutting reporting time by 40%", "serving 200+ stakeholders across four regions",
+             "saving $1.2M in annual infrastructure costs", "raising forecast accuracy to 94%",
+             "in partnership with finance, sales and product leadership",
+             "while reducing on-call incidents and manual reconciliation work"]
+_SKILLS = ["Python", "SQL", "Tableau", "Power BI", "Airflow", "dbt", "Spark", "Snowflake",
+           "Looker", "pandas", "scikit-learn", "Statistics", "Excel", "Git", "Docker", "AWS"]
+
+
+def _sentence(rng: random.Random, clauses: int) -> str:
+    parts = [f"{rng.choice(_VERBS)} {rng.choice(_OBJECTS)}"]
+    parts.extend(rng.choice(_OUTCOMES) for _ in range(clauses))
+    return ", ".join(parts) + "."
+
+
+def make_structured_cv(jobs: int = 10, responsibilities: int = 6, skills: int = 40,
+                       education: int = 2, seed: int = 0) -> dict:
+    """A structured CV in the assistant's schema with the given number of entries"""
+    rng = random.Random(seed)
+    return {
+        "name": "Jordan Example",
+        "contact": ["jordan@example.com", "LinkedIn: /in/jordan-example", "(555) 010-0000",
+                    "Madrid, Spain"],
+        "professional_summary": " ".join(_sentence(rng, 2) for _ in range(4)),
+        "work_experience": [
+            {
+                "title": f"Senior Data Analyst {idx + 1}",
+                "company": f"Company {idx + 1}",
+                "dates": f"{2024 - 2 * idx - 2}-{2024 - 2 * idx}",
+                "responsibilities": [_sentence(rng, rng.randint(1, 3)) for _ in range(responsibilities)]
+            }
+            for idx in range(jobs)
+        ],
+        "education": [
+            {
+                "degree": f"Master of Science {idx + 1}",
+                "institution": f"University {idx + 1}",
+                "dates": f"{2010 - 2 * idx}-{2012 - 2 * idx}",
+                "details": [_sentence(rng, 1) for _ in range(3)]
+            }
+            for idx in range(education)
+        ],
+        "skills": {
+            category: [f"{rng.choice(_SKILLS)} {n}" for n in range(skills // 4)]
+            for category in ("Technical", "Analytics", "Tools", "Soft Skills")
+        }
+    }
+
+
+def make_package(jobs: int = 10, seed: int = 0, **cv_options) -> dict:
+    """A full resume package around a synthetic structured CV, as the assistant returns it"""
+    rng = random.Random(seed)
+    structured_cv = make_structured_cv(jobs=jobs, seed=seed, **cv_options)
+    return {
+        "cv": CVMarkdownRenderer().render(structured_cv),
+        "structured_cv": structured_cv,
+        "cover_letter": "\n\n".join(_sentence(rng, 3) for _ in range(5)),
+        "analysis": "\n".join(f"- {_sentence(rng, 2)}" for _ in range(10 + jobs))
+    }
@@ -1,6 +1,7 @@
 from fpdf import FPDF
 from fpdf.enums import XPos, YPos
-import textwrap
+from src.exporters.text_layout import write_paragraph
+from src.utils.tracing import traced
 
 class ResumePDF(FPDF):
     def __init__(self, language="English", font_config=None, spacing_config=None):
@@ -28,10 +29,8 @@ class ResumePDF(FPDF):
         self.set_font('Times', '', 10)
         # Join all contact info with ' | ' separator
         contact_line = ' | '.join(contact_info)
-        # Wrap the contact line if it's too long
-        wrapped_contact = textwrap.fill(contact_line, width=120)
-        for line in wrapped_contact.split('\n'):
-            self.cell(0, 5, line, new_x=XPos.LMARGIN, new_y=YPos.NEXT, align='C')
+        # Wrap the contact line to the page width if it's too long
+        write_paragraph(self, contact_line, 5, align='C')
         self.ln(5)
 
     def add_section_header(self, title, spacing=3.5):
@@ -44,9 +43,7 @@ class ResumePDF(FPDF):
     def add_professional_summary(self, summary, spacing=3.5):
         """Add professional summary section"""
         self.set_font('Times', '', 10)
-        wrapped_text = textwrap.fill(summary, width=120)
-        for line in wrapped_text.split('\n'):
-            self.cell(0, spacing, line, new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+        write_paragraph(self, summary, spacing)
         self.ln(5)
 
     def add_work_experience(self, experience, spacing=3.5):
@@ -63,17 +60,9 @@ class ResumePDF(FPDF):
             # Responsibilities
             self.set_font('Times', '', 10)
             for resp in job['responsibilities']:
-                # Add dash instead of bullet point and indent
+                # Add dash instead of bullet point; wrapped lines keep the indent
                 self.cell(5, spacing, '-', new_x=XPos.RIGHT)
-                wrapped_text = textwrap.fill(resp, width=120)
-                first_line = True
-                for line in wrapped_text.split('\n'):
-                    if first_line:
-                        self.cell(0, spacing, line, new_x=XPos.LMARGIN, new_y=YPos.NEXT)
-                        first_line = False
-                    else:
-                        self.cell(5, spacing, '', new_x=XPos.RIGHT)  # Indent
-                        self.cell(0, spacing, line, new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+                write_paragraph(self, resp, spacing)
             self.ln(3)
 
     def add_education(self, education, spacing=3.5):
@@ -88,10 +77,8 @@ class ResumePDF(FPDF):
             self.set_font('Times', '', 10)
             #create a wrapped list of details
             details_text = ', '.join(edu['details'])
-            wrapped_details = textwrap.fill(details_text, width=120)
-            for line in wrapped_details.split('\n'):        
-                self.cell(5, spacing, '-', new_x=XPos.RIGHT)  # Changed bullet to dash
-                self.cell(0, spacing, line, new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+            self.cell(5, spacing, '-', new_x=XPos.RIGHT)  # Changed bullet to dash
+            write_paragraph(self, details_text, spacing)
             self.ln(3)
 
     def add_skills(self, skills, spacing=3.5):
@@ -103,35 +90,47 @@ class ResumePDF(FPDF):
             self.set_font('Times', '', 8)
             # Create a wrapped list of skills
             skills_text = ', '.join(skill_list)
-            wrapped_skills = textwrap.fill(skills_text, width=120)
-            for line in wrapped_skills.split('\n'):
-                self.cell(0, spacing, line, new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+            write_paragraph(self, skills_text, spacing)
             self.ln(3)
 
+def build_resume_pdf(structured_cv, language="English", font_config=None, spacing_config=None):
+    """Lay out the resume from structured CV data and return the FPDF document"""
+    # Initialize PDF with configurations and language
+    pdf = ResumePDF(language=language)
+    
+    # Add content sections with language-specific headers
+    pdf.add_header(structured_cv['name'])
+    pdf.add_contact_info(structured_cv['contact'])
+    
+    pdf.add_section_header(pdf.headers[0])
+    pdf.add_professional_summary(structured_cv['professional_summary'])
+    
+    pdf.add_section_header(pdf.headers[1])
+    pdf.add_work_experience(structured_cv['work_experience'])
+    
+    pdf.add_section_header(pdf.headers[2])
+    pdf.add_education(structured_cv['education'])
+    
+    pdf.add_section_header(pdf.headers[3])
+    pdf.add_skills(structured_cv['skills'])
+    return pdf
+
+@traced("export.render_pdf")
+def render_resume_pdf(structured_cv, language="English", font_config=None, spacing_config=None):
+    """Render the PDF resume into memory and return its bytes"""
+    pdf = build_resume_pdf(structured_cv, language=language,
+                           font_config=font_config, spacing_config=spacing_config)
+    return bytes(pdf.output())
+
 def generate_resume_pdf(structured_cv, language="English", output_path='resume.pdf', font_config=None, spacing_config=None):
     """Generate PDF resume from structured CV data with custom configurations"""
     try:
-        # Initialize PDF with configurations and language
-        pdf = ResumePDF(language=language)
-        
-        # Add content sections with language-specific headers
-        pdf.add_header(structured_cv['name'])
-        pdf.add_contact_info(structured_cv['contact'])
-        
-        pdf.add_section_header(pdf.headers[0])
-        pdf.add_professional_summary(structured_cv['professional_summary'])
-        
-        pdf.add_section_header(pdf.headers[1])
-        pdf.add_work_experience(structured_cv['work_experience'])
-        
-        pdf.add_section_header(pdf.headers[2])
-        pdf.add_education(structured_cv['education'])
-        
-        pdf.add_section_header(pdf.headers[3])
-        pdf.add_skills(structured_cv['skills'])
+        pdf_bytes = render_resume_pdf(structured_cv, language=language,
+                                      font_config=font_config, spacing_config=spacing_config)
         
         # Save the PDF
-        pdf.output(output_path)
+        with open(output_path, 'wb') as f:
+            f.write(pdf_bytes)
         return True
     except Exception as e:
         print(f"Error generating PDF: {str(e)}")
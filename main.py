@@ -1,33 +1,40 @@
 import streamlit as st
-import streamlit.components.v1 as components
+from streamlit.errors import StreamlitAPIException
 from dotenv import load_dotenv
 import os
+
+# Load environment variables before the settings read them
+load_dotenv()
+
 from assistant_manager import AssistantManager
+from src.core.jobs import COMPLETED, JobQueue
 from utils import read_markdown_file
-import re
-import html
-from markitdown import MarkItDown
-import tempfile
+from src.core.ingestion import IngestionService
+from src.exporters.export_cache import ExportCache
+from src.exporters.cv_markdown import CVMarkdownRenderer
+from src.exporters.package_bundle import build_package_zip, package_markdown, package_text
+from src.config.settings import JOBS, LLM_PROVIDER, SUPPORTED_FILE_TYPES
+from src.utils.metrics import start_metrics_server
+from src.utils.tracing import get_tracer, span
+from contextlib import contextmanager
 import logging
+import time
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Load environment variables
-load_dotenv()
-
 # Initialize AssistantManager
 @st.cache_resource
 def get_assistant():
     """Initialize and return the AssistantManager with error handling"""
     try:
         # Check for required environment variables
-        if not os.getenv("OPENAI_API_KEY"):
+        if LLM_PROVIDER["name"] == "openai" and not os.getenv("OPENAI_API_KEY"):
             st.error("OpenAI API key not found in environment variables")
             return None
             
-        if not os.getenv("agent_id"):
+        if LLM_PROVIDER["name"] == "openai" and not os.getenv("agent_id"):
             st.error("Assistant ID not found in environment variables")
             return None
             
@@ -41,6 +48,26 @@ def get_assistant():
         st.error(f"Failed to initialize the resume assistant. Please try again later. Error: {str(e)}")
         return None
 
+@st.cache_resource
+def get_job_queue(_assistant):
+    """Return the process-wide background job queue that generation runs on"""
+    return JobQueue.from_settings(_assistant)
+
+@st.cache_resource
+def get_ingestion_service():
+    """Return the process-wide ingestion service so its workers and cache survive reruns"""
+    return IngestionService.from_settings()
+
+@st.cache_resource
+def get_export_cache():
+    """Return the process-wide cache of rendered PDF/DOCX downloads"""
+    return ExportCache.from_settings()
+
+@st.cache_resource
+def get_metrics_server():
+    """Start the Prometheus metrics endpoint once per server process"""
+    return start_metrics_server()
+
 # Page configuration
 st.set_page_config(
     page_title="ATS Resume Generator",
@@ -55,8 +82,89 @@ st.set_page_config(
 # Configure Streamlit for development
 st.set_option('client.showErrorDetails', True)
 
+RESULT_TABS = ["Analysis", "Resume", "Cover Letter", "Download Files"]
+
+@contextmanager
+def timed_request(name, **attributes):
+    """Trace a request, keeping its per-stage timings for the timing breakdown"""
+    with span(name, **attributes) as request_span:
+        try:
+            yield request_span
+        finally:
+            st.session_state.setdefault('timings', {})[name] = request_span.trace
+
+def show_timings():
+    """Per-stage timing breakdown of the latest request of each kind"""
+    with st.expander("⏱️ Timing Breakdown", expanded=True):
+        timings = st.session_state.get('timings')
+        if not timings:
+            st.caption("No requests timed yet in this session")
+            return
+        for name, trace in timings.items():
+            st.markdown(f"**{name}**: {trace.spans[0].duration_ms:,.0f} ms")
+            st.dataframe(trace.breakdown(), use_container_width=True, hide_index=True)
+
+def remember_job(job_id):
+    """Keep the session's generation job, in the URL too so a reload reattaches to it"""
+    st.session_state.job_id = job_id
+    if hasattr(st, 'query_params'):
+        st.query_params['job'] = job_id
+
+def forget_job():
+    st.session_state.pop('job_id', None)
+    if hasattr(st, 'query_params'):
+        st.query_params.pop('job', None)
+
+def remembered_job():
+    job_id = st.session_state.get('job_id')
+    if job_id is None and hasattr(st, 'query_params'):
+        job_id = st.query_params.get('job')
+    return job_id
+
+def show_job_progress(job, sections):
+    """Status of a generation job in flight, with the sections finished so far in their placeholders"""
+    wait = f"{job.estimated_wait:,.0f}s" if (job.estimated_wait or 0) >= 1 else "a moment"
+    if job.position:
+        st.info(f"⏳ You're #{job.position} in line. Estimated wait: {wait}")
+    elif job.estimated_wait:
+        st.info(f"⏳ Waiting for the assistant's rate limit. Starting in about {wait}")
+    else:
+        st.info("⏳ Generating your resume package... You can keep working; it will appear here when ready.")
+    for section, key in zip(sections, ('analysis', 'cv', 'cover_letter')):
+        if key in job.partial:
+            section.markdown(job.partial[key])
+
+# Polls a job in flight without rerunning the rest of the app where Streamlit
+# supports timed fragments; older versions rerun the whole app on each check
+polling_fragment = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', None)
+
+def poll_job(job_queue, job_id, sections):
+    """Check on a job in flight, rerunning the whole app once it is done to collect it"""
+    job = job_queue.get(job_id)
+    if job is None or job.done:
+        st.rerun()
+    show_job_progress(job, sections)
+
+if polling_fragment is not None:
+    poll_job = polling_fragment(run_every=JOBS["poll_interval"])(poll_job)
+
+def collect_job(job):
+    """Take a finished job's package into the session, with its timing breakdown when traced here"""
+    forget_job()
+    if job.status != COMPLETED:
+        st.error(f"An error occurred: {job.error}")
+        return
+    st.session_state.response = job.result
+    trace = next((trace for trace in reversed(get_tracer().recent)
+                  if trace.spans[0].name == "job.run" and trace.spans[0].attributes.get("job") == job.id), None)
+    if trace is not None:
+        st.session_state.setdefault('timings', {})['generate_package'] = trace
+    st.success("✨ Resume package generated successfully!")
+    st.info("💡 Your resume has been optimized and formatted.")
+
 def main():
     st.title("VAM Resume Optimizer")
+    get_metrics_server()
 
     # Initialize the assistant
     assistant = get_assistant()
@@ -85,43 +193,12 @@ def main():
 
         if uploaded_file is not None:
             try:
-                file_type = uploaded_file.type
-                
-                if file_type == "application/pdf":
-                    # Create a temporary file to save the PDF
-                    with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp_file:
-                        tmp_file.write(uploaded_file.getvalue())
-                        pdf_path = tmp_file.name
-                    
-                    try:
-                        # Initialize Markitdown
-                        md = MarkItDown()
-                        # Convert PDF to markdown
-                        result = md.convert(pdf_path)
-                        if result and result.text_content:
-                            resume_content = result.text_content
-                            st.success("PDF successfully converted to text!")
-                        else:
-                            st.error("Could not extract text from PDF.")
-                            resume_content = default_resume_content
-                    finally:
-                        # Clean up temporary file
-                        if os.path.exists(pdf_path):
-                            os.unlink(pdf_path)
-                
-                elif file_type == "text/markdown" or file_type == "text/plain":
-                    resume_content = uploaded_file.getvalue().decode()
-                    st.success("File uploaded successfully!")
-                
-                elif file_type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
-                    # Handle DOCX files if needed
-                    st.error("DOCX support coming soon!")
-                    resume_content = default_resume_content
-                
-                else:
-                    st.error(f"Unsupported file type: {file_type}")
-                    resume_content = default_resume_content
-                    
+                # Detect the type and convert in a worker process, bounded by a timeout
+                with timed_request("ingest_upload", file=uploaded_file.name, bytes=uploaded_file.size):
+                    document = get_ingestion_service().ingest_bytes(
+                        uploaded_file.getvalue(), uploaded_file.name)
+                resume_content = document.markdown
+                st.success(f"{SUPPORTED_FILE_TYPES[document.file_type]} resume converted to text!")
             except Exception as e:
                 st.error(f"Error processing file: {str(e)}")
                 resume_content = default_resume_content
@@ -152,9 +229,10 @@ def main():
 
             submit_button = st.form_submit_button("Generate Resume Package")
 
+        show_timing = st.checkbox("⏱️ Show timing breakdown", help="Time each stage of generation, ingestion and export")
+
     # Create tabs outside of the submit button condition
-    tab1, tab2, tab3, tab4 = st.tabs(
-        ["Analysis", "Resume", "Cover Letter", "Download Files"])
+    tab1, tab2, tab3, tab4 = lazy_tabs(RESULT_TABS)
 
     # Initialize session state for storing response if not exists
     if 'response' not in st.session_state:
@@ -165,460 +243,501 @@ def main():
             st.error("Please fill in all required fields")
             return
 
-        with st.spinner("Generating your resume package..."):
-            # Prepare input data
-            input_data = {
-                "language": language,
-                "job_name": job_name,
-                "job_description": job_description,
-                "location": location,
-                "employer_info": employer_info,
-                "resume_content": resume_content
-            }
+        # Prepare input data
+        input_data = {
+            "language": language,
+            "job_name": job_name,
+            "job_description": job_description,
+            "location": location,
+            "employer_info": employer_info,
+            "resume_content": resume_content
+        }
+
+        # Generate in the background so reruns and reloads don't abandon the run
+        try:
+            remember_job(get_job_queue(assistant).submit(input_data))
+            st.session_state.response = None
+        except Exception as e:
+            st.error(f"An error occurred: {str(e)}")
+            return
 
-            # Generate content using the assistant
-            try:
-                st.session_state.response = assistant.generate_resume_package(input_data)
-                st.success("✨ Resume package generated successfully!")
-                st.info("💡 Your resume has been optimized and formatted.")
-            except Exception as e:
-                st.error(f"An error occurred: {str(e)}")
-                return
+    job = None
+    job_id = remembered_job()
+    if job_id is not None:
+        job = get_job_queue(assistant).get(job_id)
+        if job is None:
+            forget_job()
+        elif job.done:
+            collect_job(job)
+        else:
+            sections = [tab.empty() for tab in (tab1, tab2, tab3)]
+            if polling_fragment is not None:
+                poll_job(get_job_queue(assistant), job_id, sections)
+            else:
+                show_job_progress(job, sections)
 
     # Display content in tabs if response exists
     if st.session_state.response:
-        response = st.session_state.response
-        
-        with tab1:
-            st.markdown("### 📊 Resume Analysis")
-            
-            # Display full analysis if needed
-            with st.expander("📝 Full Analysis", expanded=False):
-                st.markdown("### Complete Analysis Report")
-                st.markdown(response['analysis'])
+        show_package((tab1, tab2, tab3, tab4), st.session_state.response, language)
 
-        with tab2:
-            st.title("📄 ATS-Optimized CV")
-            
-            # Personal Information Section
-            with st.expander("👤 Personal Information", expanded=True):
-                st.markdown("---")
-                col1, col2 = st.columns(2)
+    if show_timing:
+        show_timings()
+
+    if job is not None and not job.done and polling_fragment is None:
+        # Check on the job again shortly
+        time.sleep(JOBS["poll_interval"])
+        st.rerun()
+
+# Editor sections rerun on their own where Streamlit supports fragments;
+# older versions rerun the whole app on every edit
+editor_fragment = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', None) or (lambda func: func)
+
+def rerun_section():
+    """Rerun only the editor section that changed, or the whole app on older Streamlit"""
+    try:
+        st.rerun(scope="fragment")
+    except (TypeError, StreamlitAPIException):
+        # Streamlit without fragment reruns, or the section ran as part of a full run
+        st.rerun()
+
+def lazy_tabs(labels):
+    """Create tabs that report whether they are open, so hidden tabs can skip building widgets"""
+    try:
+        return st.tabs(labels, key="active_tab", on_change="rerun")
+    except TypeError:
+        # Streamlit without tab state: every tab is built on each run
+        return st.tabs(labels)
+
+def is_open(tab):
+    """Whether a tab's content should be built this run"""
+    return getattr(tab, 'open', None) is not False
+
+def show_analysis(response):
+    """Analysis tab"""
+    st.markdown("### 📊 Resume Analysis")
+
+    # Display full analysis if needed
+    with st.expander("📝 Full Analysis", expanded=False):
+        st.markdown("### Complete Analysis Report")
+        st.markdown(response['analysis'])
+
+@editor_fragment
+def edit_personal_information(structured_cv):
+    """Name and contact details"""
+    with st.expander("👤 Personal Information", expanded=True):
+        st.markdown("---")
+        col1, col2 = st.columns(2)
+        with col1:
+            structured_cv['name'] = st.text_input(
+                "🏷️ Name", 
+                structured_cv['name'],
+                help="Enter your full name"
+            )
+        with col2:
+            contact_text = st.text_area(
+                "📞 Contact Information", 
+                "\n".join(structured_cv['contact']),
+                help="Enter one contact detail per line"
+            )
+            structured_cv['contact'] = [
+                line.strip() for line in contact_text.split('\n') 
+                if line.strip()
+            ]
+
+@editor_fragment
+def edit_professional_summary(structured_cv):
+    """Professional summary"""
+    with st.expander("📋 Professional Summary", expanded=True):
+        st.markdown("---")
+        structured_cv['professional_summary'] = st.text_area(
+            "💼 Career Overview", 
+            structured_cv['professional_summary'],
+            height=150,
+            help="Write a compelling summary of your professional background"
+        )
+
+@editor_fragment
+def edit_work_experience(structured_cv):
+    """Positions and their responsibilities"""
+    with st.expander("💼 Work Experience", expanded=True):
+        st.markdown("---")
+        col1, col2 = st.columns([5,1])
+        with col1:
+            st.subheader("Work History")
+        with col2:
+            if st.button("➕ Add Position", type="secondary"):
+                structured_cv['work_experience'].append({
+                    'title': 'New Position',
+                    'company': 'Company Name',
+                    'dates': 'Start Date - End Date',
+                    'responsibilities': ['Add your responsibilities']
+                })
+                st.success("✅ New position added!")
+                rerun_section()
+
+        for idx, job in enumerate(structured_cv['work_experience']):
+            st.markdown(f"### Position {idx + 1}")
+            col1, col2, col3 = st.columns([4, 4, 1])
+
+            with col1:
+                job['title'] = st.text_input(
+                    "🏢 Job Title",
+                    job['title'],
+                    key=f"title_{idx}"
+                )
+                job['company'] = st.text_input(
+                    "🏪 Company",
+                    job['company'],
+                    key=f"company_{idx}"
+                )
+
+            with col2:
+                job['dates'] = st.text_input(
+                    "📅 Employment Period",
+                    job['dates'],
+                    key=f"dates_{idx}"
+                )
+
+            with col3:
+                st.markdown("#")  # Spacing
+                if st.button("🗑️", key=f"del_exp_{idx}", help="Delete this position"):
+                    structured_cv['work_experience'].pop(idx)
+                    st.success("🗑️ Position removed!")
+                    rerun_section()
+
+            st.markdown("#### Key Responsibilities:")
+            for resp_idx, resp in enumerate(job['responsibilities']):
+                col1, col2 = st.columns([8, 1])
                 with col1:
-                    response['structured_cv']['name'] = st.text_input(
-                        "🏷️ Name", 
-                        response['structured_cv']['name'],
-                        help="Enter your full name"
+                    new_resp = st.text_area(
+                        f"📝 Responsibility {resp_idx + 1}",
+                        resp,
+                        height=100,
+                        key=f"resp_{idx}_{resp_idx}"
                     )
+                    job['responsibilities'][resp_idx] = new_resp
                 with col2:
-                    contact_text = st.text_area(
-                        "📞 Contact Information", 
-                        "\n".join(response['structured_cv']['contact']),
-                        help="Enter one contact detail per line"
-                    )
-                    response['structured_cv']['contact'] = [
-                        line.strip() for line in contact_text.split('\n') 
-                        if line.strip()
-                    ]
-            
-            # Professional Summary Section
-            with st.expander("📋 Professional Summary", expanded=True):
-                st.markdown("---")
-                response['structured_cv']['professional_summary'] = st.text_area(
-                    "💼 Career Overview", 
-                    response['structured_cv']['professional_summary'],
-                    height=150,
-                    help="Write a compelling summary of your professional background"
+                    st.markdown("#")  # Spacing
+                    if st.button("➕", key=f"add_resp_{idx}_{resp_idx}"):
+                        job['responsibilities'].insert(resp_idx + 1, "New responsibility")
+                        rerun_section()
+                    if st.button("🗑️", key=f"del_resp_{idx}_{resp_idx}"):
+                        job['responsibilities'].pop(resp_idx)
+                        rerun_section()
+            st.markdown("---")
+
+@editor_fragment
+def edit_education(structured_cv):
+    """Education entries and their details"""
+    with st.expander("🎓 Education", expanded=True):
+        st.markdown("---")
+        col1, col2 = st.columns([3,1])
+        with col1:
+            st.subheader("Academic Background")
+        with col2:
+            if st.button("➕ Add Education", type="secondary"):
+                structured_cv['education'].append({
+                    'degree': 'New Degree',
+                    'institution': 'Institution Name',
+                    'dates': 'Start Date - End Date',
+                    'details': ['Add education details']
+                })
+                st.success("✅ New education entry added!")
+                rerun_section()
+
+        for idx, edu in enumerate(structured_cv['education']):
+            col1, col2, col3 = st.columns([0.85, 0.1, 0.05])
+            with col1:
+                st.subheader(f"Education {idx + 1}")
+                st.markdown(f"**{edu['degree']}**")
+                st.markdown(f"**{edu['institution']}**")
+                st.markdown(f"**{edu['dates']}**")
+            with col2:
+                if st.button("🗑️", key=f"del_edu_{idx}"):
+                    structured_cv['education'].pop(idx)
+                    st.success("Education entry removed!")
+                    rerun_section()
+
+            # Make details editable
+            st.markdown("**Details:**")
+            updated_details = []
+            for detail_idx, detail in enumerate(edu['details']):
+                new_detail = st.text_area(
+                    f"Detail {detail_idx + 1}",
+                    detail,
+                    height=100,
+                    key=f"detail_{idx}_{detail_idx}"
                 )
-            
-            # Work Experience Section
-            with st.expander("💼 Work Experience", expanded=True):
-                st.markdown("---")
-                col1, col2 = st.columns([5,1])
-                with col1:
-                    st.subheader("Work History")
-                with col2:
-                    if st.button("➕ Add Position", type="secondary"):
-                        response['structured_cv']['work_experience'].append({
-                            'title': 'New Position',
-                            'company': 'Company Name',
-                            'dates': 'Start Date - End Date',
-                            'responsibilities': ['Add your responsibilities']
-                        })
-                        st.success("✅ New position added!")
-                        st.rerun()
-
-                for idx, job in enumerate(response['structured_cv']['work_experience']):
-                    st.markdown(f"### Position {idx + 1}")
-                    col1, col2, col3 = st.columns([4, 4, 1])
-                    
-                    with col1:
-                        job['title'] = st.text_input(
-                            "🏢 Job Title",
-                            job['title'],
-                            key=f"title_{idx}"
-                        )
-                        job['company'] = st.text_input(
-                            "🏪 Company",
-                            job['company'],
-                            key=f"company_{idx}"
-                        )
-                    
-                    with col2:
-                        job['dates'] = st.text_input(
-                            "📅 Employment Period",
-                            job['dates'],
-                            key=f"dates_{idx}"
-                        )
-                    
-                    with col3:
-                        st.markdown("#")  # Spacing
-                        if st.button("🗑️", key=f"del_exp_{idx}", help="Delete this position"):
-                            response['structured_cv']['work_experience'].pop(idx)
-                            st.success("🗑️ Position removed!")
-                            st.rerun()
-                    
-                    st.markdown("#### Key Responsibilities:")
-                    for resp_idx, resp in enumerate(job['responsibilities']):
-                        col1, col2 = st.columns([8, 1])
-                        with col1:
-                            new_resp = st.text_area(
-                                f"📝 Responsibility {resp_idx + 1}",
-                                resp,
-                                height=100,
-                                key=f"resp_{idx}_{resp_idx}"
-                            )
-                            job['responsibilities'][resp_idx] = new_resp
-                        with col2:
-                            st.markdown("#")  # Spacing
-                            if st.button("➕", key=f"add_resp_{idx}_{resp_idx}"):
-                                job['responsibilities'].insert(resp_idx + 1, "New responsibility")
-                                st.rerun()
-                            if st.button("🗑️", key=f"del_resp_{idx}_{resp_idx}"):
-                                job['responsibilities'].pop(resp_idx)
-                                st.rerun()
-                    st.markdown("---")
-            
-            # Education Section
-            with st.expander("🎓 Education", expanded=True):
-                st.markdown("---")
-                col1, col2 = st.columns([3,1])
-                with col1:
-                    st.subheader("Academic Background")
-                with col2:
-                    if st.button("➕ Add Education", type="secondary"):
-                        response['structured_cv']['education'].append({
-                            'degree': 'New Degree',
-                            'institution': 'Institution Name',
-                            'dates': 'Start Date - End Date',
-                            'details': ['Add education details']
-                        })
-                        st.success("✅ New education entry added!")
-                        st.rerun()
-
-                for idx, edu in enumerate(response['structured_cv']['education']):
-                    col1, col2, col3 = st.columns([0.85, 0.1, 0.05])
-                    with col1:
-                        st.subheader(f"Education {idx + 1}")
-                        st.markdown(f"**{edu['degree']}**")
-                        st.markdown(f"**{edu['institution']}**")
-                        st.markdown(f"**{edu['dates']}**")
-                    with col2:
-                        if st.button("🗑️", key=f"del_edu_{idx}"):
-                            response['structured_cv']['education'].pop(idx)
-                            st.success("Education entry removed!")
-                            st.rerun()
-                    
-                    # Make details editable
-                    st.markdown("**Details:**")
-                    updated_details = []
-                    for detail_idx, detail in enumerate(edu['details']):
-                        new_detail = st.text_area(
-                            f"Detail {detail_idx + 1}",
-                            detail,
-                            height=100,
-                            key=f"detail_{idx}_{detail_idx}"
-                        )
-                        updated_details.append(new_detail)
-                    edu['details'] = updated_details
-                    st.divider()
-            
-            # Skills Section
-            with st.expander("🛠️ Skills", expanded=True):
-                st.markdown("---")
-                col1, col2 = st.columns([5,1])
+                updated_details.append(new_detail)
+            edu['details'] = updated_details
+            st.divider()
+
+@editor_fragment
+def edit_skills(structured_cv):
+    """Skill categories and skills"""
+    with st.expander("🛠️ Skills", expanded=True):
+        st.markdown("---")
+        col1, col2 = st.columns([5,1])
+        with col1:
+            st.subheader("Professional Skills")
+        with col2:
+            new_category = st.text_input("🏷️ New Category Name")
+            if st.button("➕ Add Category", type="secondary") and new_category:
+                if new_category not in structured_cv['skills']:
+                    structured_cv['skills'][new_category] = []
+                    st.success(f"✅ Added new category: {new_category}")
+                    rerun_section()
+
+        for category in list(structured_cv['skills'].keys()):
+            st.markdown(f"### {category}")
+            col1, col2 = st.columns([8,1])
+            with col1:
+                new_skill = st.text_input(
+                    "➕ Add skill",
+                    key=f"new_skill_{category}",
+                    placeholder="Enter new skill and press Add"
+                )
+            with col2:
+                if st.button("🗑️", key=f"del_cat_{category}"):
+                    del structured_cv['skills'][category]
+                    st.success(f"🗑️ Removed category: {category}")
+                    rerun_section()
+
+            if new_skill:
+                if st.button("Add", key=f"add_skill_{category}"):
+                    if new_skill not in structured_cv['skills'][category]:
+                        structured_cv['skills'][category].append(new_skill)
+                        st.success(f"✅ Added {new_skill} to {category}")
+                        rerun_section()
+
+            # Display existing skills
+            for skill_idx, skill in enumerate(structured_cv['skills'][category]):
+                col1, col2 = st.columns([8,1])
                 with col1:
-                    st.subheader("Professional Skills")
-                with col2:
-                    new_category = st.text_input("🏷️ New Category Name")
-                    if st.button("➕ Add Category", type="secondary") and new_category:
-                        if new_category not in response['structured_cv']['skills']:
-                            response['structured_cv']['skills'][new_category] = []
-                            st.success(f"✅ Added new category: {new_category}")
-                            st.rerun()
-
-                for category in list(response['structured_cv']['skills'].keys()):
-                    st.markdown(f"### {category}")
-                    col1, col2 = st.columns([8,1])
-                    with col1:
-                        new_skill = st.text_input(
-                            "➕ Add skill",
-                            key=f"new_skill_{category}",
-                            placeholder="Enter new skill and press Add"
-                        )
-                    with col2:
-                        if st.button("🗑️", key=f"del_cat_{category}"):
-                            del response['structured_cv']['skills'][category]
-                            st.success(f"🗑️ Removed category: {category}")
-                            st.rerun()
-                    
-                    if new_skill:
-                        if st.button("Add", key=f"add_skill_{category}"):
-                            if new_skill not in response['structured_cv']['skills'][category]:
-                                response['structured_cv']['skills'][category].append(new_skill)
-                                st.success(f"✅ Added {new_skill} to {category}")
-                                st.rerun()
-
-                    # Display existing skills
-                    for skill_idx, skill in enumerate(response['structured_cv']['skills'][category]):
-                        col1, col2 = st.columns([8,1])
-                        with col1:
-                            edited_skill = st.text_input(
-                                f"Skill {skill_idx + 1}",
-                                skill,
-                                key=f"skill_{category}_{skill_idx}"
-                            )
-                            response['structured_cv']['skills'][category][skill_idx] = edited_skill
-                        with col2:
-                            if st.button("🗑️", key=f"del_skill_{category}_{skill_idx}"):
-                                response['structured_cv']['skills'][category].pop(skill_idx)
-                                st.success("🗑️ Skill removed!")
-                                st.rerun()
-                    st.markdown("---")
-
-                # Update CV Button
-                st.markdown("---")
-                col1, col2 = st.columns([1,8])
+                    edited_skill = st.text_input(
+                        f"Skill {skill_idx + 1}",
+                        skill,
+                        key=f"skill_{category}_{skill_idx}"
+                    )
+                    structured_cv['skills'][category][skill_idx] = edited_skill
                 with col2:
-                    if st.button("🔄 Update CV", type="secondary", use_container_width=True):
-                        updated_cv = format_cv_from_structure(response['structured_cv'])
-                        response['cv'] = updated_cv
-                        st.session_state.response = response
-                        st.success("✨ CV has been updated!")
-                        st.markdown(updated_cv)
-
-        with tab3:
-            st.markdown("### Cover Letter")
-            # Make cover letter editable with sections
-            with st.expander("PreviewCover Letter", expanded=True):
-                edited_cover_letter = st.text_area(
-                    "Edit Cover Letter",
-                    response['cover_letter'],
-                    height=400,
-                    key="cover_letter_editor"
-                )
-                if st.button("Update Cover Letter"):
-                    response['cover_letter'] = edited_cover_letter
-                    st.session_state.response = response
-                    st.success("Cover Letter has been updated!")
-            
-            # Display the current version
-            st.markdown("### Current Version")
-            st.markdown(response['cover_letter'])
+                    if st.button("🗑️", key=f"del_skill_{category}_{skill_idx}"):
+                        structured_cv['skills'][category].pop(skill_idx)
+                        st.success("🗑️ Skill removed!")
+                        rerun_section()
+            st.markdown("---")
+
+def show_resume_editor(response):
+    """Resume tab: each section is its own fragment, so an edit reruns only that section"""
+    st.title("📄 ATS-Optimized CV")
+
+    edit_personal_information(response['structured_cv'])
+    edit_professional_summary(response['structured_cv'])
+    edit_work_experience(response['structured_cv'])
+    edit_education(response['structured_cv'])
+    edit_skills(response['structured_cv'])
+
+    # Outside the section fragments, so an update reruns the whole app and refreshes the downloads
+    st.markdown("---")
+    col1, col2 = st.columns([1,8])
+    with col2:
+        if st.button("🔄 Update CV", type="secondary", use_container_width=True):
+            updated_cv = format_cv_from_structure(response['structured_cv'])
+            response['cv'] = updated_cv
+            st.session_state.response = response
+            st.success("✨ CV has been updated!")
+            st.markdown(updated_cv)
+
+def show_cover_letter(response):
+    """Cover letter tab"""
+    st.markdown("### Cover Letter")
+    # Make cover letter editable with sections
+    with st.expander("PreviewCover Letter", expanded=True):
+        edited_cover_letter = st.text_area(
+            "Edit Cover Letter",
+            response['cover_letter'],
+            height=400,
+            key="cover_letter_editor"
+        )
+        if st.button("Update Cover Letter"):
+            response['cover_letter'] = edited_cover_letter
+            st.session_state.response = response
+            st.success("Cover Letter has been updated!")
+
+    # Display the current version
+    st.markdown("### Current Version")
+    st.markdown(response['cover_letter'])
+
+def show_downloads(response, language):
+    """Download tab"""
+    st.markdown("### Download Files")
+
+    # Create download section
+    st.subheader("Download Options")
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.download_button(
+            "📄 Download as Text",
+            package_text(response),
+            file_name="ats_resume_package.txt",
+            mime="text/plain",
+            use_container_width=True)
+
+    with col2:
+        st.download_button(
+            "📝 Download as Markdown",
+            package_markdown(response),
+            file_name="ats_resume_package.md",
+            mime="text/markdown",
+            use_container_width=True)
+
+    with col3:
+        with st.expander("📑 PDF Settings"):
+            st.subheader("Font Sizes")
+            font_config = {
+                'header': {
+                    'size': st.number_input('Header Font Size', 12, 36, 24),
+                    'style': 'B'
+                },
+                'contact': {
+                    'size': st.number_input('Contact Info Font Size', 8, 14, 10),
+                    'style': ''
+                },
+                'section_header': {
+                    'size': st.number_input('Section Headers Font Size', 10, 18, 14),
+                    'style': 'B'
+                },
+                'summary': {
+                    'size': st.number_input('Summary Font Size', 8, 14, 11),
+                    'style': ''
+                }
+            }
 
-        with tab4:
-            st.markdown("### Download Files")
-            
-            # Create combined text content with updated versions
-            combined_text = f"""
-ATS Resume Package
+            st.subheader("Spacing")
+            spacing_config = {
+                'header': st.number_input('Header Spacing', 5, 20, 10),
+                'contact': st.number_input('Contact Info Spacing', 3, 10, 5),
+                'section_header': st.number_input('Section Header Spacing', 5, 15, 10),
+                'section_gap': st.number_input('Section Gap', 3, 10, 5)
+            }
 
-ANALYSIS
---------
-{response['analysis']}
+        if st.button("Generate PDF Resume", use_container_width=True):
+            try:
+                from export_pdf import render_resume_pdf
+                # Rendered in memory and reused until the CV or layout changes
+                with timed_request("export_pdf"):
+                    pdf_bytes = get_export_cache().render(
+                        render_resume_pdf,
+                        response['structured_cv'],
+                        language=language,
+                        font_config=font_config,
+                        spacing_config=spacing_config
+                    )
 
-RESUME
-------
-{response['cv']}
+                st.download_button(
+                    label="📥 Download PDF",
+                    data=pdf_bytes,
+                    file_name="resume.pdf",
+                    mime="application/pdf",
+                    use_container_width=True
+                )
+                st.success("PDF Resume generated successfully!")
+            except Exception as e:
+                st.error(f"Error generating PDF: {str(e)}")
+
+    with col4:
+        with st.expander("📘 DOCX Settings"):
+            st.subheader("Font Sizes")
+            docx_config = {
+                'name_size': st.number_input('Name Size', 12, 36, 12),
+                'contact_size': st.number_input('Contact Size', 8, 14, 10),
+                'heading_size': st.number_input('Heading Size', 10, 18, 12),
+                'title_size': st.number_input('Job Title Size', 10, 16, 12),
+                'body_size': st.number_input('Body Text Size', 8, 14, 10),
+                'margins': st.number_input('Margins (inches)', 0.3, 2.0, 0.5, step=0.1),
+                'line_spacing': st.number_input('Line Spacing', 0.75, 2.0, 1.0, step=0.05) #this means minimum is 0.3, maximum is 2.0, default is 1.15, and step is 0.05
+            }
 
-COVER LETTER
------------
-{response['cover_letter']}
-"""
+        if st.button("Generate DOCX Resume", use_container_width=True):
+            try:
+                from export_docx import render_resume_docx
+                with timed_request("export_docx"):
+                    docx_bytes = get_export_cache().render(
+                        render_resume_docx,
+                        response['structured_cv'],
+                        language=language,
+                        config=docx_config
+                    )
 
-            # Create markdown content with updated versions
-            markdown_content = f"""
-# ATS Resume Package
+                st.download_button(
+                    label="📥 Download DOCX",
+                    data=docx_bytes,
+                    file_name="resume.docx",
+                    mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+                    use_container_width=True
+                )
+                st.success("DOCX Resume generated successfully!")
+            except Exception as e:
+                st.error(f"Error generating DOCX: {str(e)}")
 
-## Analysis
-{response['analysis']}
+    st.subheader("Download Everything")
+    st.caption("Analysis, resume and cover letter as markdown and text, plus the PDF and DOCX resumes")
+    if st.button("🗂️ Build ZIP Bundle", use_container_width=True):
+        try:
+            from export_pdf import render_resume_pdf
+            from export_docx import render_resume_docx
+            # Each member is generated only as it is written into the zip
+            with timed_request("export_bundle"):
+                bundle = build_package_zip(
+                    response,
+                    render_pdf=lambda: get_export_cache().render(
+                        render_resume_pdf,
+                        response['structured_cv'],
+                        language=language,
+                        font_config=font_config,
+                        spacing_config=spacing_config
+                    ),
+                    render_docx=lambda: get_export_cache().render(
+                        render_resume_docx,
+                        response['structured_cv'],
+                        language=language,
+                        config=docx_config
+                    )
+                )
 
-## Resume
-{response['cv']}
+            st.download_button(
+                label="📦 Download ZIP",
+                data=bundle,
+                file_name="ats_resume_package.zip",
+                mime="application/zip",
+                use_container_width=True
+            )
+        except Exception as e:
+            st.error(f"Error building ZIP bundle: {str(e)}")
 
-## Cover Letter
-{response['cover_letter']}
-"""
-            
-            # Create download section
-            st.subheader("Download Options")
-            col1, col2, col3, col4 = st.columns(4)
-            
-            with col1:
-                st.download_button(
-                    "📄 Download as Text",
-                    combined_text,
-                    file_name="ats_resume_package.txt",
-                    mime="text/plain",
-                    use_container_width=True)
-            
-            with col2:
-                st.download_button(
-                    "📝 Download as Markdown",
-                    markdown_content,
-                    file_name="ats_resume_package.md",
-                    mime="text/markdown",
-                    use_container_width=True)
-            
-            with col3:
-                with st.expander("📑 PDF Settings"):
-                    st.subheader("Font Sizes")
-                    font_config = {
-                        'header': {
-                            'size': st.number_input('Header Font Size', 12, 36, 24),
-                            'style': 'B'
-                        },
-                        'contact': {
-                            'size': st.number_input('Contact Info Font Size', 8, 14, 10),
-                            'style': ''
-                        },
-                        'section_header': {
-                            'size': st.number_input('Section Headers Font Size', 10, 18, 14),
-                            'style': 'B'
-                        },
-                        'summary': {
-                            'size': st.number_input('Summary Font Size', 8, 14, 11),
-                            'style': ''
-                        }
-                    }
-                    
-                    st.subheader("Spacing")
-                    spacing_config = {
-                        'header': st.number_input('Header Spacing', 5, 20, 10),
-                        'contact': st.number_input('Contact Info Spacing', 3, 10, 5),
-                        'section_header': st.number_input('Section Header Spacing', 5, 15, 10),
-                        'section_gap': st.number_input('Section Gap', 3, 10, 5)
-                    }
-
-                if st.button("Generate PDF Resume", use_container_width=True):
-                    try:
-                        from export_pdf import generate_resume_pdf
-                        success = generate_resume_pdf(
-                            response['structured_cv'],
-                            language=language,
-                            output_path='resume.pdf',
-                            font_config=font_config,
-                            spacing_config=spacing_config
-                        )
-                        
-                        if success:
-                            with open('resume.pdf', 'rb') as pdf_file:
-                                pdf_bytes = pdf_file.read()
-                            
-                            st.download_button(
-                                label="📥 Download PDF",
-                                data=pdf_bytes,
-                                file_name="resume.pdf",
-                                mime="application/pdf",
-                                use_container_width=True
-                            )
-                            st.success("PDF Resume generated successfully!")
-                        else:
-                            st.error("Failed to generate PDF Resume")
-                    except Exception as e:
-                        st.error(f"Error generating PDF: {str(e)}")
-
-            with col4:
-                with st.expander("📘 DOCX Settings"):
-                    st.subheader("Font Sizes")
-                    docx_config = {
-                        'name_size': st.number_input('Name Size', 12, 36, 12),
-                        'contact_size': st.number_input('Contact Size', 8, 14, 10),
-                        'heading_size': st.number_input('Heading Size', 10, 18, 12),
-                        'title_size': st.number_input('Job Title Size', 10, 16, 12),
-                        'body_size': st.number_input('Body Text Size', 8, 14, 10),
-                        'margins': st.number_input('Margins (inches)', 0.3, 2.0, 0.5, step=0.1),
-                        'line_spacing': st.number_input('Line Spacing', 0.75, 2.0, 1.0, step=0.05) #this means minimum is 0.3, maximum is 2.0, default is 1.15, and step is 0.05
-                    }
-
-                if st.button("Generate DOCX Resume", use_container_width=True):
-                    try:
-                        from export_docx import generate_resume_docx
-                        success = generate_resume_docx(
-                            structured_cv=response['structured_cv'],
-                            language=language,
-                            output_path='resume.docx',
-                            config=docx_config
-                        )
-                        
-                        if success:
-                            with open('resume.docx', 'rb') as docx_file:
-                                docx_bytes = docx_file.read()
-                            
-                            st.download_button(
-                                label="📥 Download DOCX",
-                                data=docx_bytes,
-                                file_name="resume.docx",
-                                mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-                                use_container_width=True
-                            )
-                            st.success("DOCX Resume generated successfully!")
-                        else:
-                            st.error("Failed to generate DOCX Resume")
-                    except Exception as e:
-                        st.error(f"Error generating DOCX: {str(e)}")
+def show_package(tabs, response, language):
+    """Build the content of the open tab(s) for a generated package"""
+    tab1, tab2, tab3, tab4 = tabs
+    if is_open(tab1):
+        with tab1:
+            show_analysis(response)
+    if is_open(tab2):
+        with tab2:
+            show_resume_editor(response)
+    if is_open(tab3):
+        with tab3:
+            show_cover_letter(response)
+    if is_open(tab4):
+        with tab4:
+            show_downloads(response, language)
 
 def format_cv_from_structure(structured_cv):
     """Helper function to format CV text from structured data"""
-    cv_text = f"# {structured_cv['name']}\n\n"
-    
-    # Add contact information
-    cv_text += "## Contact\n"
-    for contact_item in structured_cv['contact']:
-        cv_text += f"- {contact_item}\n"
-    cv_text += "\n"
-    
-    # Add professional summary
-    cv_text += "## Professional Summary\n"
-    cv_text += structured_cv['professional_summary'] + "\n\n"
-    
-    # Add work experience
-    cv_text += "## Work Experience\n\n"
-    for job in structured_cv['work_experience']:
-        cv_text += f"### {job['title']}\n"
-        cv_text += f"**{job['company']}** | {job['dates']}\n"
-        for resp in job['responsibilities']:
-            cv_text += f"- {resp}\n"
-        cv_text += "\n"
-    
-    # Add education
-    cv_text += "## Education\n\n"
-    for edu in structured_cv['education']:
-        cv_text += f"### {edu['degree']}\n"
-        cv_text += f"**{edu['institution']}** | {edu['dates']}\n"
-        for detail in edu['details']:
-            cv_text += f"- {detail}\n"
-        cv_text += "\n"
-    
-    # Add skills
-    cv_text += "## Skills\n\n"
-    for category, skills in structured_cv['skills'].items():
-        cv_text += f"### {category}\n"
-        for skill in skills:
-            cv_text += f"- {skill}\n"
-        cv_text += "\n"
-    
-    return cv_text
+    # One renderer per session, so "Update CV" only re-renders the sections edited since the last update
+    if 'cv_renderer' not in st.session_state:
+        st.session_state.cv_renderer = CVMarkdownRenderer()
+    return st.session_state.cv_renderer.render(structured_cv)
 
 def process_resume(resume_text):
     """Process the resume text and return structured data"""
@@ -1,21 +1,149 @@
 from pathlib import Path
 from typing import Dict, List
 import os
+import threading
 
 # Project paths
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 TEMPLATES_DIR = PROJECT_ROOT / "templates"
 OUTPUT_DIR = PROJECT_ROOT / "output"
 LOGS_DIR = PROJECT_ROOT / "logs"
+CACHE_DIR = OUTPUT_DIR / "cache"
 
-# Create necessary directories
-for directory in [TEMPLATES_DIR, OUTPUT_DIR, LOGS_DIR]:
-    directory.mkdir(exist_ok=True)
+
+def ensure_dir(path: Path) -> Path:
+    """Create a directory the first time something writes into it"""
+    path.mkdir(parents=True, exist_ok=True)
+    return path
 
 # OpenAI settings
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 ASSISTANT_ID = os.getenv("ASSISTANT_ID")
 
+# Assistant run settings
+RUN_TIMEOUT = 300  # seconds
+STREAM_RUNS = os.getenv("STREAM_RUNS", "true").lower() != "false"
+POLL_SETTINGS = {
+    "initial_interval": 0.2,  # seconds
+    "max_interval": 2.0,
+    "backoff_factor": 1.5
+}
+
+# Connection pool shared by every OpenAI client in the process
+HTTP_CLIENT = {
+    "http2": os.getenv("HTTP2", "true").lower() != "false",  # needs the h2 package
+    "max_connections": int(os.getenv("HTTP_MAX_CONNECTIONS", "100")),
+    "max_keepalive_connections": 20,
+    "keepalive_expiry": 60.0,  # seconds an idle connection stays open
+    "connect_timeout": 5.0,  # seconds
+    "read_timeout": 60.0,  # between bytes; streamed runs pass the run timeout
+    "write_timeout": 30.0,
+    "pool_timeout": 10.0  # waiting for a free connection
+}
+
+# Retries of failed assistant API calls (5xx, 429, timeouts, dropped connections)
+RETRY = {
+    "max_attempts": int(os.getenv("RETRY_MAX_ATTEMPTS", "4")),  # per call, including the first
+    "initial_delay": 0.5,  # seconds; the ceiling doubles per retry and waits are jittered below it
+    "max_delay": 8.0,
+    "multiplier": 2.0,
+    "max_retry_after": 30.0,  # give up rather than honor a longer Retry-After
+    "budget": int(os.getenv("RETRY_BUDGET", "6"))  # retries per resume request, across all its calls
+}
+
+# Admission control and client-side quotas for assistant runs (OpenAI provider only)
+RATE_LIMIT = {
+    "enabled": os.getenv("RATE_LIMIT", "true").lower() != "false",
+    "requests_per_minute": int(os.getenv("RATE_LIMIT_RPM", "30")),  # resume requests; 0: unlimited
+    "tokens_per_minute": int(os.getenv("RATE_LIMIT_TPM", "200000")),  # estimated prompt + reply tokens
+    "completion_tokens": 2000,  # expected reply size counted against tokens_per_minute
+    "burst_seconds": 10,  # a bucket holds this many seconds of quota
+    "max_concurrent_runs": int(os.getenv("MAX_CONCURRENT_RUNS", "8")),
+    "max_queued": int(os.getenv("MAX_QUEUED_RUNS", "32")),  # further requests are turned away
+    "expected_run_seconds": 30.0,  # wait estimate until runs have been timed
+    "backend": os.getenv("RATE_LIMIT_BACKEND", "memory"),  # "memory", or "sqlite" to share across replicas
+    "sqlite_path": Path(os.getenv("RATE_LIMIT_PATH", CACHE_DIR / "rate_limit.sqlite3"))
+}
+
+# Background generation jobs, kept in SQLite so they outlive Streamlit reruns
+JOBS = {
+    "workers": int(os.getenv("JOB_WORKERS", "4")),
+    "path": Path(os.getenv("JOBS_PATH", OUTPUT_DIR / "jobs.sqlite3")),  # share it to let replicas take over jobs
+    "lease_seconds": 60.0,  # in-flight jobs of a process silent this long are picked up by another
+    "keep_seconds": 7 * 24 * 3600,  # finished jobs are deleted after this long
+    "poll_interval": 1.0  # seconds between status checks in the UI
+}
+
+# Assistants thread pool settings
+THREAD_POOL = {
+    "size": int(os.getenv("THREAD_POOL_SIZE", "4")),  # threads kept warm
+    "warm_up": True,  # pre-create threads in the background at startup
+    "cleanup": "delete"  # "delete" used threads, or "keep" them server-side
+}
+
+# LLM backend: "openai" (Assistants API) or "stub" (in-process, no network)
+LLM_PROVIDER = {
+    "name": os.getenv("LLM_PROVIDER", "openai"),
+    "stub": {
+        "replies": os.getenv("STUB_REPLIES"),  # JSONL of recorded replies; synthetic when unset
+        "latency": float(os.getenv("STUB_LATENCY", "0")),  # median seconds per run
+        "latency_sigma": float(os.getenv("STUB_LATENCY_SIGMA", "0")),  # log-normal spread of latencies
+        "failure_rate": float(os.getenv("STUB_FAILURE_RATE", "0")),
+        "chunk_size": int(os.getenv("STUB_CHUNK_SIZE", "0")),  # stream replies in chunks; 0: one piece
+        "seed": int(os.getenv("STUB_SEED", "0"))
+    }
+}
+
+# Response cache settings
+RESPONSE_CACHE = {
+    "enabled": os.getenv("RESPONSE_CACHE", "true").lower() != "false",
+    "max_entries": 128,
+    "ttl": 7 * 24 * 3600,  # seconds
+    "disk": os.getenv("RESPONSE_CACHE_DISK", "true").lower() != "false",
+    "disk_max_entries": 1000,
+    "disk_max_bytes": 50 * 1024 * 1024  # 50MB
+}
+
+# Uploaded document conversion cache settings
+CONVERSION_CACHE = {
+    "enabled": os.getenv("CONVERSION_CACHE", "true").lower() != "false",
+    "max_entries": 32,
+    "max_bytes": 20 * 1024 * 1024,  # 20MB of markdown in memory
+    "ttl": 30 * 24 * 3600,  # seconds
+    "disk": os.getenv("CONVERSION_CACHE_DISK", "true").lower() != "false",
+    "disk_max_entries": 500,
+    "disk_max_bytes": 100 * 1024 * 1024  # 100MB
+}
+
+# Rendered PDF/DOCX export cache settings
+EXPORT_CACHE = {
+    "enabled": os.getenv("EXPORT_CACHE", "true").lower() != "false",
+    "max_entries": 256,
+    "max_bytes": 64 * 1024 * 1024  # 64MB of rendered documents
+}
+
+# Resume ingestion settings
+INGESTION = {
+    "workers": int(os.getenv("INGESTION_WORKERS", "0")) or None,  # None: one per CPU
+    "timeout": 60,  # seconds per file
+    "memory_limit_mb": 1024  # address-space cap per worker process
+}
+
+# Per-stage tracing of requests
+TRACING = {
+    "exporter": os.getenv("TRACING_EXPORTER", "none"),  # "none", "jsonl" or "otlp"
+    "jsonl_path": Path(os.getenv("TRACING_JSONL_PATH", LOGS_DIR / "traces.jsonl")),
+    "otlp_endpoint": os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT", "http://localhost:4318"),  # OTLP/HTTP collector
+    "service_name": os.getenv("OTEL_SERVICE_NAME", "resume-generator")
+}
+
+# Prometheus metrics endpoint served next to the app
+METRICS = {
+    "enabled": os.getenv("METRICS", "true").lower() != "false",
+    "addr": os.getenv("METRICS_ADDR", "127.0.0.1"),
+    "port": int(os.getenv("METRICS_PORT", "9464"))  # give each replica its own port
+}
+
 # File processing settings
 MAX_FILE_SIZE = 5 * 1024 * 1024  # 5MB
 SUPPORTED_FILE_TYPES = {
@@ -70,4 +198,20 @@ LOGGING_CONFIG = {
         "level": "INFO",
         "handlers": ["file", "console"]
     }
-} 
\ No newline at end of file
+} 
+
+_logging_lock = threading.Lock()
+_logging_configured = False
+
+
+def configure_logging() -> None:
+    """Apply LOGGING_CONFIG once per process, creating the logs directory it writes to"""
+    global _logging_configured
+    import logging.config
+
+    with _logging_lock:
+        if _logging_configured:
+            return
+        ensure_dir(LOGS_DIR)
+        logging.config.dictConfig(LOGGING_CONFIG)
+        _logging_configured = True
@@ -0,0 +1,156 @@
+import math
+import time
+import logging
+import threading
+import contextlib
+from collections import deque
+from typing import Any, Callable, Dict, Iterator, NamedTuple, Optional
+from .rate_limit import RateLimiter
+from ..config.settings import RATE_LIMIT
+from ..utils.metrics import ADMISSION_WAIT
+from ..utils.tracing import span
+
+logger = logging.getLogger(__name__)
+
+
+class AdmissionRejected(Exception):
+    """Raised when the admission queue is full and a request is turned away"""
+
+
+class QueueStatus(NamedTuple):
+    """Where a waiting request stands: its place in line (0 once admitted) and the expected wait"""
+    position: int
+    estimated_wait: float
+
+
+class AdmissionQueue:
+    """Bounded FIFO queue in front of at most ``max_concurrent`` runs.
+
+    Up to ``max_queued`` requests wait in line; more are rejected right away
+    rather than piling up. The expected wait is worked out from the recent
+    run time, which is smoothed over finished runs.
+    """
+
+    def __init__(self, max_concurrent: int = 8, max_queued: int = 32,
+                 expected_run_seconds: float = 30.0, smoothing: float = 0.2):
+        self.max_concurrent = max_concurrent
+        self.max_queued = max_queued
+        self.run_seconds = expected_run_seconds
+        self.smoothing = smoothing
+        self._waiting = deque()
+        self._active = 0
+        self._cond = threading.Condition()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return {'active': self._active, 'queued': len(self._waiting),
+                    'run_seconds': self.run_seconds}
+
+    def _status(self, ticket) -> QueueStatus:
+        position = self._waiting.index(ticket) + 1
+        # Runs that must finish before this one gets a slot, each wave taking a run's time
+        finishing = position - (self.max_concurrent - self._active)
+        waves = math.ceil(finishing / self.max_concurrent) if finishing > 0 else 0
+        return QueueStatus(position, waves * self.run_seconds)
+
+    def _admissible(self, ticket) -> bool:
+        return self._waiting[0] is ticket and self._active < self.max_concurrent
+
+    @contextlib.contextmanager
+    def admit(self, on_wait: Optional[Callable[[QueueStatus], None]] = None) -> Iterator[None]:
+        """Hold a run slot for the block, waiting in line for one first.
+
+        ``on_wait`` is called with the request's QueueStatus when it starts
+        waiting and again whenever its place or expected wait changes.
+        """
+        ticket = object()
+        with self._cond:
+            if len(self._waiting) >= self.max_queued and self._active >= self.max_concurrent:
+                raise AdmissionRejected(f"The assistant is busy with {len(self._waiting)} requests waiting; "
+                                        "please try again in a minute")
+            self._waiting.append(ticket)
+            try:
+                reported = None
+                while not self._admissible(ticket):
+                    status = self._status(ticket)
+                    if on_wait is not None and status != reported:
+                        reported = status
+                        # Report outside the lock so a slow callback holds up nobody else
+                        self._cond.release()
+                        try:
+                            on_wait(status)
+                        finally:
+                            self._cond.acquire()
+                        continue
+                    self._cond.wait()
+            except BaseException:
+                self._waiting.remove(ticket)
+                self._cond.notify_all()
+                raise
+            self._waiting.popleft()
+            self._active += 1
+            self._cond.notify_all()
+
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            elapsed = time.monotonic() - start
+            with self._cond:
+                self._active -= 1
+                self.run_seconds += self.smoothing * (elapsed - self.run_seconds)
+                self._cond.notify_all()
+
+
+class AdmissionController:
+    """Admission queue and rate limiter that every assistant run passes through"""
+
+    def __init__(self, queue: AdmissionQueue, limiter: Optional[RateLimiter] = None,
+                 sleep: Callable[[float], None] = time.sleep):
+        self.queue = queue
+        self.limiter = limiter
+        self.sleep = sleep
+
+    @classmethod
+    def from_settings(cls, settings: Dict[str, Any] = RATE_LIMIT) -> Optional["AdmissionController"]:
+        """Build the controller described by RATE_LIMIT, or None when it is disabled"""
+        if not settings["enabled"]:
+            return None
+        queue = AdmissionQueue(settings["max_concurrent_runs"], settings["max_queued"],
+                               settings["expected_run_seconds"])
+        return cls(queue, RateLimiter.from_settings(settings))
+
+    @contextlib.contextmanager
+    def admit(self, content: str, on_wait: Optional[Callable[[QueueStatus], None]] = None) -> Iterator[None]:
+        """Wait for a run slot and for the quotas to cover ``content``, then hold the slot for the block.
+
+        A request that had to wait is reported once more with
+        ``QueueStatus(0, 0.0)`` when its run starts.
+        """
+        start = time.monotonic()
+        tokens = self.limiter.cost(content) if self.limiter is not None else 0
+        waited_in_line = False
+
+        def report(status: QueueStatus):
+            nonlocal waited_in_line
+            waited_in_line = True
+            # The quotas may hold the request up further once it is admitted
+            if on_wait is not None:
+                extra = self.limiter.peek(tokens) if self.limiter is not None else 0.0
+                on_wait(status._replace(estimated_wait=status.estimated_wait + extra))
+
+        with contextlib.ExitStack() as slot:
+            with span("admission.wait", tokens=tokens) as wait_span:
+                slot.enter_context(self.queue.admit(report))
+                wait = self.limiter.reserve(tokens) if self.limiter is not None else 0.0
+                if wait > 0:
+                    logger.info(f"Rate limit reached; holding the run for {wait:.1f}s")
+                    if on_wait is not None:
+                        on_wait(QueueStatus(0, wait))
+                    self.sleep(wait)
+                waited = time.monotonic() - start
+                wait_span.set(waited_ms=round(waited * 1000, 3), rate_limited_ms=round(wait * 1000, 3))
+            ADMISSION_WAIT.observe(waited)
+            if on_wait is not None and (waited_in_line or wait > 0):
+                on_wait(QueueStatus(0, 0.0))
+            yield
@@ -1,84 +1,67 @@
-from openai import OpenAI
 import os
-import time
 import json
 import logging
 from typing import Dict, Any
-from ..models.resume import ResumePackage, JobDetails
-from ..config.settings import OPENAI_API_KEY, ASSISTANT_ID, LOGGING_CONFIG
+from ..models.resume import JobDetails
+from .completion import PollBackoff, complete_run, poll_run
+from .http_client import get_openai_client
+from .response_cache import ResponseCache
+from .response_parser import ResponseFormatError, parse_resume_package
+from .retry import RetryPolicy, retry_budget
+from .thread_pool import AssistantThreadPool
+from ..config.settings import (
+    OPENAI_API_KEY, ASSISTANT_ID, RUN_TIMEOUT, STREAM_RUNS, POLL_SETTINGS, THREAD_POOL,
+    configure_logging
+)
 
-# Configure logging
-logging.config.dictConfig(LOGGING_CONFIG)
 logger = logging.getLogger(__name__)
 
 class AssistantManager:
     def __init__(self):
         """Initialize the OpenAI assistant with proper error handling"""
+        configure_logging()
         if not OPENAI_API_KEY:
             raise ValueError("OpenAI API key not found in environment variables")
         
-        self.client = OpenAI(api_key=OPENAI_API_KEY)
+        self.client = get_openai_client(OPENAI_API_KEY)
+        self.retry = RetryPolicy.from_settings()
         try:
-            self.assistant = self.client.beta.assistants.retrieve(ASSISTANT_ID)
+            self.assistant = self.retry.call(self.client.beta.assistants.retrieve, ASSISTANT_ID,
+                                             operation="assistants.retrieve")
             logger.info("Successfully initialized OpenAI assistant")
         except Exception as e:
             logger.error(f"Failed to initialize OpenAI assistant: {str(e)}")
             raise
 
+        self.response_cache = ResponseCache.from_settings()
+        self.thread_pool = AssistantThreadPool(self.client, retry=self.retry, **THREAD_POOL)
+        self.backoff = PollBackoff(
+            initial=POLL_SETTINGS["initial_interval"],
+            maximum=POLL_SETTINGS["max_interval"],
+            factor=POLL_SETTINGS["backoff_factor"]
+        )
+
     def _create_thread(self) -> str:
-        """Create a new thread for the conversation"""
+        """Take a fresh thread for the conversation from the thread pool"""
         try:
-            thread = self.client.beta.threads.create()
-            return thread.id
+            return self.thread_pool.acquire()
         except Exception as e:
             logger.error(f"Failed to create thread: {str(e)}")
             raise
 
-    def _wait_for_completion(self, thread_id: str, run_id: str, timeout: int = 300) -> None:
+    def _wait_for_completion(self, thread_id: str, run_id: str, timeout: int = RUN_TIMEOUT) -> None:
         """Wait for the assistant to complete processing with timeout"""
-        start_time = time.time()
-        
-        while True:
-            if time.time() - start_time > timeout:
-                raise TimeoutError("Assistant response timeout after 5 minutes")
-
-            try:
-                run_status = self.client.beta.threads.runs.retrieve(
-                    thread_id=thread_id, run_id=run_id)
-                
-                if run_status.status == 'completed':
-                    break
-                elif run_status.status == 'failed':
-                    raise Exception(f"Assistant run failed: {run_status.last_error}")
-                
-                time.sleep(1)
-            except Exception as e:
-                logger.error(f"Error checking run status: {str(e)}")
-                raise
+        try:
+            poll_run(self.client, thread_id, run_id, timeout=timeout, backoff=self.backoff, retry=self.retry)
+        except Exception as e:
+            logger.error(f"Error checking run status: {str(e)}")
+            raise
 
     def _parse_response(self, response: str) -> Dict[str, Any]:
         """Parse and validate the assistant's response"""
         try:
-            # Clean up the response string
-            response = response.strip()
-            if '```json' in response:
-                response = response.split('```json')[1].split('```')[0].strip()
-            elif '```' in response:
-                response = response.split('```')[1].split('```')[0].strip()
-            
-            # Remove trailing commas
-            response = response.replace(',}', '}').replace(',]', ']')
-            
-            # Parse JSON
-            parsed_response = json.loads(response)
-            
-            # Validate using Pydantic model
-            return ResumePackage(**parsed_response).dict()
-            
-        except json.JSONDecodeError as e:
-            logger.error(f"JSON parsing error: {str(e)}")
-            raise ValueError(f"Failed to parse assistant response: {str(e)}")
-        except Exception as e:
+            return parse_resume_package(response)
+        except ResponseFormatError as e:
             logger.error(f"Error parsing response: {str(e)}")
             raise
 
@@ -87,36 +70,47 @@ class AssistantManager:
         try:
             # Validate input data
             job_details = JobDetails(**input_data)
+
+            cache_key = None
+            if self.response_cache is not None:
+                cache_key = self.response_cache.key(input_data, self.assistant)
+                cached = self.response_cache.get(cache_key)
+                if cached is not None:
+                    return cached
             
-            # Create thread and send message
-            thread_id = self._create_thread()
-            self.client.beta.threads.messages.create(
-                thread_id=thread_id,
-                role="user",
-                content=json.dumps(input_data)
-            )
-            
-            # Run the assistant
-            run = self.client.beta.threads.runs.create(
-                thread_id=thread_id,
-                assistant_id=self.assistant.id
-            )
-            
-            # Wait for completion
-            self._wait_for_completion(thread_id, run.id)
-            
-            # Get the response
-            messages = self.client.beta.threads.messages.list(thread_id=thread_id)
-            if not messages.data:
-                raise ValueError("No response received from assistant")
-            
-            response = messages.data[0].content[0].text.value
+            # Take a thread and send message; retries share the request's budget
+            with retry_budget():
+                thread_id = self._create_thread()
+                try:
+                    self.retry.call(
+                        self.client.beta.threads.messages.create,
+                        thread_id=thread_id,
+                        role="user",
+                        content=json.dumps(input_data),
+                        operation="messages.create"
+                    )
+
+                    # Run the assistant and wait for its reply
+                    response = complete_run(
+                        self.client, thread_id, self.assistant.id,
+                        timeout=RUN_TIMEOUT, stream=STREAM_RUNS, backoff=self.backoff,
+                        retry=self.retry
+                    )
+                finally:
+                    self.thread_pool.release(thread_id)
             if not response or not response.strip():
                 raise ValueError("Empty response received from assistant")
             
             # Parse and validate the response
-            return self._parse_response(response)
+            package = self._parse_response(response)
+            if cache_key is not None:
+                self.response_cache.put(cache_key, package)
+            return package
             
         except Exception as e:
             logger.error(f"Error generating resume package: {str(e)}")
-            raise 
\ No newline at end of file
+            raise
+
+    def close(self):
+        """Delete pooled threads and wait for background thread management to finish"""
+        self.thread_pool.close() 
@@ -0,0 +1,240 @@
+import time
+import asyncio
+import logging
+from typing import Callable, Iterator, Optional
+from .retry import RetryPolicy
+from ..utils.metrics import RUN_POLLS
+from ..utils.tracing import add_event
+
+logger = logging.getLogger(__name__)
+
+# Run statuses that end a run without a usable reply
+FAILED_RUN_STATUSES = ('failed', 'cancelled', 'expired', 'incomplete', 'requires_action')
+
+
+class RunFailedError(Exception):
+    """Raised when an assistant run ends without producing a reply"""
+
+
+class PollBackoff:
+    """Adaptive polling intervals: short at first, growing up to a cap"""
+
+    def __init__(self, initial: float = 0.2, maximum: float = 2.0, factor: float = 1.5):
+        self.initial = initial
+        self.maximum = maximum
+        self.factor = factor
+
+    def __iter__(self) -> Iterator[float]:
+        interval = self.initial
+        while True:
+            yield interval
+            interval = min(interval * self.factor, self.maximum)
+
+
+def _check_run_status(run) -> bool:
+    """Return True once the run completed, raise if it ended without a reply"""
+    if run.status == 'completed':
+        return True
+    if run.status in FAILED_RUN_STATUSES:
+        raise RunFailedError(f"Assistant run {run.status}: {run.last_error}")
+    return False
+
+
+def poll_run(client, thread_id: str, run_id: str, timeout: float = 300,
+             backoff: Optional[PollBackoff] = None,
+             sleep: Callable[[float], None] = time.sleep, retry: Optional[RetryPolicy] = None):
+    """Poll a run with adaptive backoff until it completes or times out"""
+    return _poll_until(client, thread_id, run_id, time.monotonic() + timeout, timeout,
+                       backoff or PollBackoff(), sleep, retry or RetryPolicy.from_settings())
+
+
+def _poll_until(client, thread_id: str, run_id: str, deadline: float, timeout: float,
+                backoff: PollBackoff, sleep: Callable[[float], None], retry: RetryPolicy):
+    polls = 0
+    try:
+        for interval in backoff:
+            run = retry.call(client.beta.threads.runs.retrieve, thread_id=thread_id, run_id=run_id,
+                             operation='runs.retrieve', deadline=deadline)
+            polls += 1
+            add_event("run.poll", status=run.status)
+            if _check_run_status(run):
+                logger.info(f"Run {run_id} completed after {polls} status checks")
+                return run
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"Assistant response timeout after {timeout} seconds")
+            sleep(min(interval, remaining))
+    finally:
+        RUN_POLLS.observe(polls)
+
+
+class _StreamResult:
+    def __init__(self):
+        self.run_id = None
+        self.text = None
+
+
+def _handle_stream_event(event, result: _StreamResult) -> bool:
+    """Record a run event, returning True once the reply is available"""
+    if event.event == 'thread.run.created':
+        result.run_id = event.data.id
+    elif event.event == 'thread.message.completed' and event.data.role == 'assistant':
+        result.text = ''.join(
+            part.text.value for part in event.data.content if part.type == 'text')
+        return True
+    elif event.event.startswith('thread.run.') and '.step.' not in event.event:
+        return _check_run_status(event.data)
+    return False
+
+
+def _delta_text(event) -> str:
+    """Text carried by a ``thread.message.delta`` event"""
+    return ''.join(part.text.value for part in event.data.delta.content or []
+                   if part.type == 'text' and part.text is not None and part.text.value)
+
+
+def iter_run_text(client, thread_id: str, assistant_id: str, timeout: float = 300,
+                  stream: bool = True, backoff: Optional[PollBackoff] = None,
+                  retry: Optional[RetryPolicy] = None) -> Iterator[str]:
+    """Run the assistant on a thread and yield its reply text as it arrives.
+
+    When streaming, each message delta is yielded as soon as it is received. If
+    streaming is unavailable the run is polled with adaptive backoff and the
+    rest of the reply is yielded in one piece. The chunks always join to the
+    text of the final message. Transient API errors are retried under ``retry``.
+    """
+    deadline = time.monotonic() + timeout
+    retry = retry or RetryPolicy.from_settings()
+    result = _StreamResult()
+    emitted = 0
+
+    if stream:
+        try:
+            events = retry.call(client.beta.threads.runs.create, thread_id=thread_id,
+                                assistant_id=assistant_id, stream=True, timeout=timeout,
+                                operation='runs.create', deadline=deadline)
+            with events:
+                for event in events:
+                    if time.monotonic() > deadline:
+                        raise TimeoutError(f"Assistant response timeout after {timeout} seconds")
+                    if event.event == 'thread.message.delta':
+                        text = _delta_text(event)
+                        if text:
+                            if not emitted:
+                                add_event("run.first_delta")
+                            emitted += len(text)
+                            yield text
+                    else:
+                        if '.step.' not in event.event:
+                            add_event(event.event)
+                        if _handle_stream_event(event, result):
+                            break
+        except (TimeoutError, RunFailedError):
+            raise
+        except Exception as e:
+            logger.warning(f"Run streaming unavailable, falling back to polling: {str(e)}")
+            add_event("run.stream_fallback", error=str(e))
+
+    if result.text is None:
+        if result.run_id is None:
+            run = retry.call(client.beta.threads.runs.create, thread_id=thread_id,
+                             assistant_id=assistant_id, operation='runs.create', deadline=deadline)
+            result.run_id = run.id
+
+        _poll_until(client, thread_id, result.run_id, deadline, timeout,
+                    backoff or PollBackoff(), time.sleep, retry)
+
+        messages = retry.call(client.beta.threads.messages.list, thread_id=thread_id,
+                              operation='messages.list', deadline=deadline)
+        if not messages.data:
+            raise ValueError("No response received from assistant")
+        result.text = messages.data[0].content[0].text.value
+
+    if len(result.text) > emitted:
+        yield result.text[emitted:]
+
+
+def complete_run(client, thread_id: str, assistant_id: str, timeout: float = 300,
+                 stream: bool = True, backoff: Optional[PollBackoff] = None,
+                 retry: Optional[RetryPolicy] = None) -> str:
+    """Run the assistant on a thread and return the text of its reply.
+
+    When streaming, the run's events are consumed as they arrive and the reply is
+    returned as soon as the final message is done. If streaming is unavailable the
+    run is polled with adaptive backoff instead.
+    """
+    return ''.join(iter_run_text(client, thread_id, assistant_id, timeout=timeout,
+                                 stream=stream, backoff=backoff, retry=retry))
+
+
+async def _poll_until_async(client, thread_id: str, run_id: str, deadline: float,
+                            timeout: float, backoff: PollBackoff, retry: RetryPolicy):
+    polls = 0
+    try:
+        for interval in backoff:
+            run = await retry.call_async(client.beta.threads.runs.retrieve, thread_id=thread_id,
+                                         run_id=run_id, operation='runs.retrieve', deadline=deadline)
+            polls += 1
+            if _check_run_status(run):
+                logger.info(f"Run {run_id} completed after {polls} status checks")
+                return run
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"Assistant response timeout after {timeout} seconds")
+            await asyncio.sleep(min(interval, remaining))
+    finally:
+        RUN_POLLS.observe(polls)
+
+
+async def poll_run_async(client, thread_id: str, run_id: str, timeout: float = 300,
+                         backoff: Optional[PollBackoff] = None, retry: Optional[RetryPolicy] = None):
+    """Async variant of poll_run for an AsyncOpenAI client"""
+    return await _poll_until_async(client, thread_id, run_id, time.monotonic() + timeout,
+                                   timeout, backoff or PollBackoff(), retry or RetryPolicy.from_settings())
+
+
+async def _consume_run_stream_async(stream, result: _StreamResult, deadline: float,
+                                    timeout: float) -> None:
+    async with stream:
+        async for event in stream:
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Assistant response timeout after {timeout} seconds")
+            if _handle_stream_event(event, result):
+                return
+
+
+async def complete_run_async(client, thread_id: str, assistant_id: str, timeout: float = 300,
+                             stream: bool = True, backoff: Optional[PollBackoff] = None,
+                             retry: Optional[RetryPolicy] = None) -> str:
+    """Async variant of complete_run for an AsyncOpenAI client"""
+    deadline = time.monotonic() + timeout
+    retry = retry or RetryPolicy.from_settings()
+    result = _StreamResult()
+
+    if stream:
+        try:
+            events = await retry.call_async(client.beta.threads.runs.create, thread_id=thread_id,
+                                            assistant_id=assistant_id, stream=True, timeout=timeout,
+                                            operation='runs.create', deadline=deadline)
+            await _consume_run_stream_async(events, result, deadline, timeout)
+        except (TimeoutError, RunFailedError):
+            raise
+        except Exception as e:
+            logger.warning(f"Run streaming unavailable, falling back to polling: {str(e)}")
+
+    if result.text is not None:
+        return result.text
+
+    if result.run_id is None:
+        run = await retry.call_async(client.beta.threads.runs.create, thread_id=thread_id,
+                                     assistant_id=assistant_id, operation='runs.create', deadline=deadline)
+        result.run_id = run.id
+
+    await _poll_until_async(client, thread_id, result.run_id, deadline, timeout,
+                            backoff or PollBackoff(), retry)
+
+    messages = await retry.call_async(client.beta.threads.messages.list, thread_id=thread_id,
+                                      operation='messages.list', deadline=deadline)
+    if not messages.data:
+        raise ValueError("No response received from assistant")
+    return messages.data[0].content[0].text.value
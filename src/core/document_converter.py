@@ -0,0 +1,157 @@
+import io
+import re
+import hashlib
+import logging
+import threading
+import unicodedata
+from typing import Any, Dict, Optional
+from ..utils.cache import LRUCache, SQLiteCache, TieredCache
+from ..utils.metrics import record_lookup
+from ..config.settings import CACHE_DIR, CONVERSION_CACHE
+
+logger = logging.getLogger(__name__)
+
+TEXT_EXTENSIONS = ('.md', '.markdown', '.txt')
+
+_CONTROL_CHARS = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]')
+_BLANK_LINE_RUNS = re.compile(r'\n{3,}')
+_HEADING_STYLE = re.compile(r'Heading (\d)')
+
+
+def normalize_markdown(text: str) -> str:
+    """Normalize newlines, unicode, stray control characters and blank-line runs"""
+    text = text.replace('\r\n', '\n').replace('\r', '\n').replace('\u00a0', ' ')
+    text = _CONTROL_CHARS.sub('', unicodedata.normalize('NFC', text))
+    text = '\n'.join(line.rstrip() for line in text.split('\n'))
+    return _BLANK_LINE_RUNS.sub('\n\n', text).strip()
+
+
+def decode_text(data: bytes) -> str:
+    """Decode an uploaded text file, falling back to Latin-1 for non-UTF-8 input"""
+    try:
+        return data.decode('utf-8-sig')
+    except UnicodeDecodeError:
+        return data.decode('latin-1')
+
+
+def _paragraph_markdown(paragraph) -> str:
+    text = paragraph.text.strip()
+    if not text:
+        return ''
+    style = paragraph.style.name if paragraph.style is not None else ''
+    if style == 'Title':
+        return f"# {text}"
+    heading = _HEADING_STYLE.match(style)
+    if heading:
+        return f"{'#' * min(int(heading.group(1)), 6)} {text}"
+    if style.startswith('List Bullet'):
+        return f"- {text}"
+    if style.startswith('List Number'):
+        return f"1. {text}"
+    return text
+
+
+def _table_markdown(table) -> str:
+    rows = [[cell.text.strip().replace('\n', ' ') for cell in row.cells] for row in table.rows]
+    if not rows:
+        return ''
+    lines = ['| ' + ' | '.join(rows[0]) + ' |', '|' + ' --- |' * len(rows[0])]
+    lines.extend('| ' + ' | '.join(row) + ' |' for row in rows[1:])
+    return '\n'.join(lines)
+
+
+def docx_to_markdown(data: bytes) -> str:
+    """Convert a DOCX document to markdown, keeping headings, lists and tables in order"""
+    from docx import Document
+    from docx.table import Table
+    from docx.text.paragraph import Paragraph
+
+    document = Document(io.BytesIO(data))
+    blocks = []
+    for element in document.element.body.iterchildren():
+        tag = element.tag.rsplit('}', 1)[-1]
+        if tag == 'p':
+            block = _paragraph_markdown(Paragraph(element, document))
+        elif tag == 'tbl':
+            block = _table_markdown(Table(element, document))
+        else:
+            continue
+        if block:
+            blocks.append(block)
+    return '\n\n'.join(blocks)
+
+
+class DocumentConverter:
+    """Converts uploaded documents to normalized markdown, caching by content.
+
+    PDFs go through MarkItDown, DOCX through python-docx and text files are
+    decoded. Results are keyed by the SHA-256 of the document bytes, so
+    re-uploading or re-running with the same file never converts it twice.
+    Documents are converted from an in-memory stream by a single MarkItDown
+    instance shared across calls.
+    """
+
+    def __init__(self, cache: Optional[TieredCache] = None, markitdown=None):
+        self.cache = cache
+        self._markitdown = markitdown
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, settings: Dict[str, Any] = CONVERSION_CACHE) -> "DocumentConverter":
+        """Build a converter with the cache described by CONVERSION_CACHE"""
+        if not settings["enabled"]:
+            return cls()
+        disk = None
+        if settings["disk"]:
+            disk = SQLiteCache(
+                CACHE_DIR / "conversions.sqlite3",
+                max_entries=settings["disk_max_entries"],
+                max_bytes=settings["disk_max_bytes"],
+                ttl=settings["ttl"])
+        memory = LRUCache(max_entries=settings["max_entries"],
+                          max_bytes=settings["max_bytes"], ttl=settings["ttl"])
+        return cls(TieredCache(memory, disk))
+
+    @property
+    def markitdown(self):
+        """The shared MarkItDown instance, created on first use"""
+        with self._lock:
+            if self._markitdown is None:
+                from markitdown import MarkItDown
+                self._markitdown = MarkItDown()
+            return self._markitdown
+
+    @staticmethod
+    def key(data: bytes) -> str:
+        return hashlib.sha256(data).hexdigest()
+
+    def convert(self, data: bytes, extension: str) -> str:
+        """Return the markdown text of a document given its bytes and file extension"""
+        key = self.key(data)
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            record_lookup('conversion', cached is not None)
+            if cached is not None:
+                logger.info("Serving converted document from conversion cache")
+                return cached
+
+        text = normalize_markdown(self.convert_uncached(data, extension))
+        if not text:
+            raise ValueError("Could not extract text from document")
+
+        if self.cache is not None:
+            self.cache.set(key, text)
+        return text
+
+    def convert_uncached(self, data: bytes, extension: str) -> str:
+        """Convert a document without consulting the cache or normalizing the result"""
+        extension = extension.lower()
+        if extension in TEXT_EXTENSIONS:
+            return decode_text(data)
+        if extension == '.docx':
+            return docx_to_markdown(data)
+        result = self.markitdown.convert_stream(io.BytesIO(data), file_extension=extension)
+        return result.text_content if result else ''
+
+    def stats(self) -> Dict[str, Any]:
+        return self.cache.stats() if self.cache is not None else {}
@@ -0,0 +1,104 @@
+import os
+import logging
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+from ..config.settings import HTTP_CLIENT
+
+if TYPE_CHECKING:
+    import httpx
+    from openai import OpenAI
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_http_client: Optional["httpx.Client"] = None
+_openai_clients: Dict[Tuple[Optional[str], Optional[str]], "OpenAI"] = {}
+
+
+def http2_available() -> bool:
+    """Whether the h2 package that httpx needs for HTTP/2 is installed"""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def timeout(settings: Dict[str, Any] = HTTP_CLIENT) -> "httpx.Timeout":
+    """Per-phase request timeouts from HTTP_CLIENT"""
+    import httpx
+
+    return httpx.Timeout(connect=settings["connect_timeout"], read=settings["read_timeout"],
+                         write=settings["write_timeout"], pool=settings["pool_timeout"])
+
+
+def client_options(settings: Dict[str, Any] = HTTP_CLIENT, max_connections: Optional[int] = None,
+                   max_keepalive_connections: Optional[int] = None) -> Dict[str, Any]:
+    """httpx client arguments for the pool described by HTTP_CLIENT"""
+    import httpx
+
+    max_connections = max_connections or settings["max_connections"]
+    max_keepalive_connections = max_keepalive_connections or settings["max_keepalive_connections"]
+    http2 = settings["http2"]
+    if http2 and not http2_available():
+        logger.warning("HTTP/2 requested but the h2 package is not installed; using HTTP/1.1")
+        http2 = False
+    return {
+        "http2": http2,
+        "timeout": timeout(settings),
+        "limits": httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=min(max_keepalive_connections, max_connections),
+            keepalive_expiry=settings["keepalive_expiry"]),
+    }
+
+
+def get_http_client() -> "httpx.Client":
+    """The process-wide connection pool that every synchronous OpenAI client sends through"""
+    global _http_client
+    with _lock:
+        if _http_client is None:
+            from openai import DefaultHttpxClient
+
+            _http_client = DefaultHttpxClient(**client_options())
+        return _http_client
+
+
+def create_async_http_client(max_connections: Optional[int] = None) -> "httpx.AsyncClient":
+    """A connection pool configured like the shared one, for a single event loop.
+
+    Async connections belong to the loop they were opened on, so each async
+    manager owns its pool instead of sharing the process-wide one. A pool
+    sized for ``max_connections`` concurrent runs keeps all of them alive.
+    """
+    from openai import DefaultAsyncHttpxClient
+
+    return DefaultAsyncHttpxClient(**client_options(
+        max_connections=max_connections, max_keepalive_connections=max_connections))
+
+
+def get_openai_client(api_key: Optional[str] = None, base_url: Optional[str] = None) -> "OpenAI":
+    """The process-wide OpenAI client for an API key and base URL, on the shared connection pool"""
+    from openai import OpenAI
+
+    api_key = api_key or os.getenv("OPENAI_API_KEY")
+    base_url = base_url or os.getenv("OPENAI_BASE_URL")
+    http_client = get_http_client()
+    with _lock:
+        client = _openai_clients.get((api_key, base_url))
+        if client is None:
+            # Retries are left to src.core.retry, which enforces a budget per request
+            client = OpenAI(api_key=api_key, base_url=base_url, http_client=http_client,
+                            timeout=timeout(), max_retries=0)
+            _openai_clients[(api_key, base_url)] = client
+        return client
+
+
+def close_http_client() -> None:
+    """Close the shared pool; the next client asked for opens a new one"""
+    global _http_client
+    with _lock:
+        client, _http_client = _http_client, None
+        _openai_clients.clear()
+    if client is not None:
+        client.close()
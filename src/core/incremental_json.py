@@ -0,0 +1,189 @@
+import re
+import json
+import logging
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+from .response_parser import strip_trailing_commas
+
+logger = logging.getLogger(__name__)
+
+# Next character that can end or escape a JSON string
+_STRING_SPECIAL = re.compile(r'["\\]')
+
+
+class PartialValue(NamedTuple):
+    """A top-level key of a streamed object and its value so far.
+
+    ``complete`` is False for string values that are still streaming in.
+    """
+    key: Optional[str]
+    value: Any
+    complete: bool
+
+
+def _decode_partial_string(raw: str) -> Tuple[str, int]:
+    """Decode the body of an unterminated JSON string as far as it goes; returns (text, characters used).
+
+    A cut-off escape, or a surrogate pair whose second half has not arrived
+    yet, is left unused for the next call.
+    """
+    end = len(raw)
+    while end > 0:
+        try:
+            text = json.loads(f'"{raw[:end]}"')
+        except json.JSONDecodeError:
+            text = None
+        if text is not None and not '\ud800' <= text[-1:] <= '\udbff':
+            return text, end
+        end = raw.rfind('\\', 0, end)
+    return '', 0
+
+
+class IncrementalJSONParser:
+    """Parse the top-level object of a JSON reply as it arrives in chunks.
+
+    ``feed`` returns a PartialValue for every top-level key whose value completed
+    in that chunk, and (with ``partial_strings``) the text so far of a string
+    value still in progress. Leading prose or a ```json fence before the object
+    is skipped. Each character is scanned once, a string still in progress is
+    decoded only as far as it is new, and completed values are decoded with
+    ``json`` and dropped from the buffer.
+    """
+
+    def __init__(self, partial_strings: bool = True):
+        self.partial_strings = partial_strings
+        self.values: Dict[str, Any] = {}
+        self.done = False
+        self._buf = ''
+        self._pos = 0
+        self._started = False
+        self._depth = 0
+        self._in_string = False
+        self._expect = 'key'
+        self._key = None
+        self._key_start = None
+        self._value_start = None
+        self._value_is_string = False
+        self._partial_text = ''
+        self._partial_used = 0
+
+    def feed(self, chunk: str) -> List[PartialValue]:
+        """Consume the next chunk of text and return the updates it produced"""
+        if self.done or not chunk:
+            return []
+        self._buf += chunk
+        updates: List[PartialValue] = []
+
+        if not self._started:
+            brace = self._buf.find('{')
+            if brace == -1:
+                self._buf = ''
+                return updates
+            self._buf = self._buf[brace + 1:]
+            self._started = True
+            self._depth = 1
+
+        buf = self._buf
+        n = len(buf)
+        pos = self._pos
+        while pos < n:
+            if self._in_string:
+                match = _STRING_SPECIAL.search(buf, pos)
+                if match is None:
+                    pos = n
+                    break
+                pos = match.start()
+                if buf[pos] == '\\':
+                    if pos + 1 >= n:
+                        break
+                    pos += 2
+                    continue
+                self._in_string = False
+                pos += 1
+                if self._depth == 1:
+                    if self._expect == 'key':
+                        self._key = json.loads(buf[self._key_start:pos])
+                        self._expect = 'colon'
+                    elif self._expect == 'value':
+                        self._emit(buf, self._value_start, pos, updates)
+                continue
+
+            char = buf[pos]
+            if char in ' \t\r\n':
+                pos += 1
+                continue
+            at_value = self._depth == 1 and self._expect == 'value' and self._value_start is None
+            if char == '"':
+                self._in_string = True
+                if self._depth == 1 and self._expect == 'key':
+                    self._key_start = pos
+                elif at_value:
+                    self._value_start = pos
+                    self._value_is_string = True
+                    self._partial_text, self._partial_used = '', 0
+            elif at_value:
+                self._value_start = pos
+                self._value_is_string = False
+
+            if char in '{[':
+                self._depth += 1
+            elif char in '}]':
+                self._depth -= 1
+                if self._depth == 1 and self._expect == 'value':
+                    self._emit(buf, self._value_start, pos + 1, updates)
+                elif self._depth == 0:
+                    if self._expect == 'value' and self._value_start is not None:
+                        self._emit(buf, self._value_start, pos, updates)
+                    self.done = True
+                    pos += 1
+                    break
+            elif self._depth == 1 and char == ':' and self._expect == 'colon':
+                self._expect = 'value'
+                self._value_start = None
+            elif self._depth == 1 and char == ',':
+                if self._expect == 'value' and self._value_start is not None:
+                    self._emit(buf, self._value_start, pos, updates)
+                self._expect = 'key'
+            pos += 1
+
+        if self.partial_strings and not self.done and self._in_string and self._depth == 1 \
+                and self._expect == 'value' and self._value_is_string:
+            # Only the text that arrived since the last update is decoded
+            text, used = _decode_partial_string(buf[self._value_start + 1 + self._partial_used:pos])
+            if used:
+                self._partial_text += text
+                self._partial_used += used
+                updates.append(PartialValue(self._key, self._partial_text, False))
+
+        self._trim(pos)
+        return updates
+
+    def _emit(self, buf: str, start: int, end: int, updates: List[PartialValue]) -> None:
+        raw = buf[start:end]
+        try:
+            value = json.loads(raw)
+        except json.JSONDecodeError:
+            try:
+                value = json.loads(strip_trailing_commas(raw))
+            except json.JSONDecodeError as e:
+                logger.debug(f"Could not decode streamed value for {self._key!r}: {str(e)}")
+                self._expect = 'after_value'
+                return
+        self.values[self._key] = value
+        self._expect = 'after_value'
+        updates.append(PartialValue(self._key, value, True))
+
+    def _trim(self, pos: int) -> None:
+        """Drop buffered text that no longer belongs to a key or value in progress"""
+        keep = pos
+        if self._in_string and self._expect == 'key' and self._key_start is not None:
+            keep = min(keep, self._key_start)
+        if self._expect == 'value' and self._value_start is not None:
+            keep = min(keep, self._value_start)
+        if keep:
+            self._buf = self._buf[keep:]
+            pos -= keep
+            if self._key_start is not None:
+                self._key_start -= keep
+            if self._value_start is not None:
+                self._value_start -= keep
+        self._pos = pos
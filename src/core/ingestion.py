@@ -0,0 +1,229 @@
+import os
+import signal
+import logging
+import threading
+import multiprocessing
+from collections import deque
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
+from .document_converter import DocumentConverter, normalize_markdown
+from ..utils.cache import LRUCache, TieredCache
+from ..utils.helpers import cleanup_temp_file, create_temp_file, validate_file
+from ..utils.metrics import record_lookup
+from ..utils.tracing import span
+from ..config.settings import INGESTION, SUPPORTED_FILE_TYPES
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+# Extension handed to the converter for each detected MIME type
+FILE_EXTENSIONS = {
+    "application/pdf": ".pdf",
+    "text/markdown": ".md",
+    "text/plain": ".txt",
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document": ".docx"
+}
+
+
+class IngestionError(ValueError):
+    """Raised when a resume cannot be turned into markdown"""
+
+
+class IngestedDocument(NamedTuple):
+    """Outcome of ingesting one file; ``error`` is set instead of ``markdown`` on failure"""
+    source: str
+    file_type: Optional[str] = None
+    markdown: str = ''
+    error: Optional[str] = None
+
+
+_worker_converter = None
+
+
+def _init_worker(memory_limit: Optional[int]) -> None:
+    """Cap the worker's address space and create its MarkItDown-backed converter"""
+    global _worker_converter
+    if memory_limit and resource is not None:
+        try:
+            resource.setrlimit(resource.RLIMIT_AS, (memory_limit, memory_limit))
+        except (ValueError, OSError) as e:
+            logger.warning(f"Could not apply ingestion memory limit: {str(e)}")
+    _worker_converter = DocumentConverter()
+
+
+def _expire(timeout: float):
+    def handler(signum, frame):
+        raise IngestionError(f"Conversion timed out after {timeout} seconds")
+    return handler
+
+
+def _convert_in_worker(path: str, extension: str, timeout: float) -> str:
+    """Convert one file inside a worker process, bounded by ``timeout`` seconds"""
+    use_alarm = hasattr(signal, 'setitimer')
+    if use_alarm:
+        signal.signal(signal.SIGALRM, _expire(timeout))
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        data = Path(path).read_bytes()
+        return normalize_markdown(_worker_converter.convert_uncached(data, extension))
+    except IngestionError:
+        raise
+    except MemoryError:
+        raise IngestionError("Conversion exceeded the worker memory limit") from None
+    except Exception as e:
+        # Re-raise as a picklable error so it reaches the parent intact
+        raise IngestionError(f"{type(e).__name__}: {str(e)}") from None
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+
+class IngestionService:
+    """Turns uploaded resumes into normalized markdown on a pool of worker processes.
+
+    Files are type-checked with ``validate_file`` and converted in separate
+    processes, so a large PDF never holds the caller's GIL. Each conversion is
+    bounded by a timeout (enforced in the worker, with the pool restarted as a
+    last resort) and each worker by an address-space cap. Converted text is
+    cached by content hash when a cache is given.
+    """
+    # Extra seconds the parent waits before treating a worker as stuck
+    HARD_TIMEOUT_GRACE = 5
+
+    def __init__(self, workers: Optional[int] = None, timeout: float = 60,
+                 memory_limit_mb: Optional[int] = 1024, cache: Optional[TieredCache] = None):
+        self.workers = workers or os.cpu_count() or 1
+        self.timeout = timeout
+        self.memory_limit = memory_limit_mb * 1024 * 1024 if memory_limit_mb else None
+        self.cache = cache
+        # Detected type of each cached document, so a repeat upload skips validation too
+        self._file_types = LRUCache(max_entries=1024)
+        self._pool = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, settings: Dict[str, Any] = INGESTION) -> "IngestionService":
+        """Build the service described by INGESTION, sharing the conversion cache"""
+        return cls(workers=settings["workers"], timeout=settings["timeout"],
+                   memory_limit_mb=settings["memory_limit_mb"],
+                   cache=DocumentConverter.from_settings().cache)
+
+    def ingest_bytes(self, data: bytes, filename: str = '') -> IngestedDocument:
+        """Convert an uploaded file held in memory, straight from the cache if these bytes were seen before"""
+        if self.cache is not None:
+            key = DocumentConverter.key(data)
+            file_type = self._file_types.get(key)
+            cached = self.cache.get(key) if file_type is not None else None
+            if cached is not None:
+                record_lookup('conversion', True)
+                return IngestedDocument(filename, file_type, cached)
+        path = create_temp_file(data, Path(filename).suffix)
+        try:
+            return self._raise_on_error(self._ingest([(filename or path.name, path)])[0])
+        finally:
+            cleanup_temp_file(path)
+
+    def ingest_file(self, path: Union[str, Path]) -> IngestedDocument:
+        """Convert a file on disk"""
+        return self._raise_on_error(self._ingest([(str(path), Path(path))])[0])
+
+    def ingest_directory(self, directory: Union[str, Path], pattern: str = '*') -> List[IngestedDocument]:
+        """Convert every matching file in a directory across all workers.
+
+        Failures are reported per file in ``IngestedDocument.error`` rather than raised.
+        """
+        paths = sorted(path for path in Path(directory).glob(pattern) if path.is_file())
+        return self._ingest([(str(path), path) for path in paths])
+
+    def close(self) -> None:
+        """Stop the worker processes"""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @staticmethod
+    def _raise_on_error(document: IngestedDocument) -> IngestedDocument:
+        if document.error is not None:
+            raise IngestionError(document.error)
+        return document
+
+    def _get_pool(self):
+        with self._lock:
+            if self._pool is None:
+                context = multiprocessing.get_context('spawn')
+                self._pool = context.Pool(self.workers, initializer=_init_worker,
+                                          initargs=(self.memory_limit,))
+            return self._pool
+
+    def _restart_pool(self) -> None:
+        """Kill every worker, e.g. after one got stuck past its timeout"""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+
+    def _ingest(self, sources: List[Tuple[str, Path]]) -> List[IngestedDocument]:
+        with span("ingestion.ingest", files=len(sources)) as ingest_span:
+            results: List[Optional[IngestedDocument]] = [None] * len(sources)
+            pending = []
+            for idx, (source, path) in enumerate(sources):
+                try:
+                    file_type = validate_file(path)
+                except Exception as e:
+                    results[idx] = IngestedDocument(source, error=str(e))
+                    continue
+                key = DocumentConverter.key(path.read_bytes()) if self.cache is not None else None
+                cached = self.cache.get(key) if key is not None else None
+                if key is not None:
+                    self._file_types.set(key, file_type)
+                    record_lookup('conversion', cached is not None)
+                if cached is not None:
+                    results[idx] = IngestedDocument(source, file_type, cached)
+                else:
+                    pending.append((idx, source, path, file_type, key))
+            ingest_span.set(converted=len(pending))
+
+            queue = deque((item, self._submit(item)) for item in pending)
+            while queue:
+                item, async_result = queue.popleft()
+                idx, source, path, file_type, key = item
+                try:
+                    markdown = async_result.get(self.timeout + self.HARD_TIMEOUT_GRACE)
+                except multiprocessing.TimeoutError:
+                    logger.error(f"Worker stuck converting {source}; restarting ingestion pool")
+                    self._restart_pool()
+                    queue = deque((other, self._submit(other)) for other, _ in queue)
+                    results[idx] = IngestedDocument(
+                        source, file_type, error=f"Conversion timed out after {self.timeout} seconds")
+                    continue
+                except Exception as e:
+                    logger.error(f"Error converting {source}: {str(e)}")
+                    results[idx] = IngestedDocument(source, file_type, error=str(e))
+                    continue
+
+                if not markdown:
+                    results[idx] = IngestedDocument(
+                        source, file_type, error=f"Could not extract text from {SUPPORTED_FILE_TYPES[file_type]} file")
+                    continue
+                if key is not None:
+                    self.cache.set(key, markdown)
+                results[idx] = IngestedDocument(source, file_type, markdown)
+            return results
+
+    def _submit(self, item):
+        _, _, path, file_type, _ = item
+        return self._get_pool().apply_async(
+            _convert_in_worker, (str(path), FILE_EXTENSIONS[file_type], self.timeout))
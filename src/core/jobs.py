@@ -0,0 +1,256 @@
+import json
+import time
+import contextlib
+import uuid
+import sqlite3
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
+from ..config.settings import JOBS
+from ..utils.cache import canonical_hash
+from ..utils.metrics import JOBS_SUBMITTED
+from ..utils.tracing import span
+
+logger = logging.getLogger(__name__)
+
+QUEUED, RUNNING, COMPLETED, FAILED = 'queued', 'running', 'completed', 'failed'
+IN_FLIGHT_STATUSES = (QUEUED, RUNNING)
+
+
+class Job(NamedTuple):
+    """A resume package request and how far it has got"""
+    id: str
+    status: str
+    result: Optional[Dict[str, Any]]  # the package once completed
+    error: Optional[str]
+    partial: Dict[str, Any]  # top-level sections finished so far
+    position: Optional[int]  # place in the admission queue while waiting for a run slot
+    estimated_wait: Optional[float]
+    created_at: float
+    started_at: Optional[float]
+    finished_at: Optional[float]
+
+    @property
+    def done(self) -> bool:
+        return self.status in (COMPLETED, FAILED)
+
+
+class JobStore:
+    """Job table in a SQLite file, shared by every process that opens it.
+
+    Each job row records its inputs, status, progress and result. In-flight
+    jobs carry the id of the process running them and a lease that process
+    keeps renewing, so another process can take over jobs whose owner died.
+    """
+
+    _COLUMNS = ("id, status, result, error, partial, position, estimated_wait, "
+                "created_at, started_at, finished_at")
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            " id TEXT PRIMARY KEY, input_key TEXT NOT NULL, input TEXT NOT NULL, status TEXT NOT NULL,"
+            " result TEXT, error TEXT, partial TEXT NOT NULL DEFAULT '{}', position INTEGER, estimated_wait REAL,"
+            " owner TEXT, lease_until REAL, created_at REAL NOT NULL, started_at REAL, finished_at REAL)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS jobs_input ON jobs (input_key, status)")
+
+    @contextlib.contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """BEGIN IMMEDIATE ... COMMIT, so concurrent processes never claim the same job"""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def submit(self, input_key: str, input_data: Dict[str, Any], owner: str, lease: float) -> Tuple[str, bool]:
+        """Add a queued job, or return the in-flight job for the same inputs.
+
+        Returns (id, owned): ``owned`` is True when the job is new, or was left
+        behind by an owner whose lease expired and has just been taken over,
+        so the caller must run it.
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT id, lease_until FROM jobs WHERE input_key = ? AND status IN (?, ?)"
+                " ORDER BY created_at LIMIT 1", (input_key, *IN_FLIGHT_STATUSES)).fetchone()
+            if row is not None:
+                job_id, lease_until = row
+                if lease_until is not None and lease_until >= now:
+                    return job_id, False
+                conn.execute(
+                    "UPDATE jobs SET status = ?, owner = ?, lease_until = ?, position = NULL, estimated_wait = NULL"
+                    " WHERE id = ?", (QUEUED, owner, now + lease, job_id))
+                return job_id, True
+            job_id = uuid.uuid4().hex
+            conn.execute(
+                "INSERT INTO jobs (id, input_key, input, status, owner, lease_until, created_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (job_id, input_key, json.dumps(input_data), QUEUED, owner, now + lease, now))
+        return job_id, True
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            row = self._conn.execute(f"SELECT {self._COLUMNS} FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+        job_id, status, result, error, partial, *rest = row
+        return Job(job_id, status, json.loads(result) if result else None, error, json.loads(partial), *rest)
+
+    def claim_stale(self, owner: str, lease: float) -> List[Tuple[str, Dict[str, Any]]]:
+        """Take over in-flight jobs whose owner stopped renewing its lease; returns their ids and inputs"""
+        now = time.time()
+        with self._transaction() as conn:
+            rows = conn.execute(
+                "SELECT id, input FROM jobs WHERE status IN (?, ?) AND lease_until < ? ORDER BY created_at",
+                (*IN_FLIGHT_STATUSES, now)).fetchall()
+            conn.executemany(
+                "UPDATE jobs SET status = ?, owner = ?, lease_until = ?, position = NULL, estimated_wait = NULL"
+                " WHERE id = ?", [(QUEUED, owner, now + lease, job_id) for job_id, _ in rows])
+        return [(job_id, json.loads(input_data)) for job_id, input_data in rows]
+
+    def renew(self, owner: str, lease: float) -> None:
+        with self._transaction() as conn:
+            conn.execute("UPDATE jobs SET lease_until = ? WHERE owner = ? AND status IN (?, ?)",
+                         (time.time() + lease, owner, *IN_FLIGHT_STATUSES))
+
+    def start(self, job_id: str) -> None:
+        with self._transaction() as conn:
+            conn.execute("UPDATE jobs SET status = ?, started_at = ? WHERE id = ?", (RUNNING, time.time(), job_id))
+
+    def set_position(self, job_id: str, position: Optional[int], estimated_wait: Optional[float]) -> None:
+        with self._transaction() as conn:
+            conn.execute("UPDATE jobs SET position = ?, estimated_wait = ? WHERE id = ?",
+                         (position, estimated_wait, job_id))
+
+    def add_partial(self, job_id: str, key: str, value: Any) -> None:
+        with self._transaction() as conn:
+            conn.execute("UPDATE jobs SET partial = json_set(partial, ?, json(?)) WHERE id = ?",
+                         (f'$."{key}"', json.dumps(value), job_id))
+
+    def finish(self, job_id: str, result: Optional[Dict[str, Any]] = None, error: Optional[str] = None) -> None:
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE jobs SET status = ?, result = ?, error = ?, finished_at = ?, owner = NULL,"
+                " lease_until = NULL, position = NULL, estimated_wait = NULL WHERE id = ?",
+                (FAILED if error is not None else COMPLETED, json.dumps(result) if result is not None else None,
+                 error, time.time(), job_id))
+
+    def prune(self, older_than: float) -> int:
+        """Delete finished jobs that ended more than ``older_than`` seconds ago"""
+        with self._transaction() as conn:
+            return conn.execute("DELETE FROM jobs WHERE status IN (?, ?) AND finished_at < ?",
+                                (COMPLETED, FAILED, time.time() - older_than)).rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class JobQueue:
+    """Runs resume package requests on a worker pool, outside any Streamlit script run.
+
+    ``submit`` returns a job id at once; callers poll ``get`` for progress
+    and the result, so a rerun or a reload can reattach to the job. Submitting
+    the same inputs while a job for them is queued or running returns that
+    job instead of starting another. Jobs are kept in a JobStore, and jobs left
+    behind by a process that stopped are picked up again by the next queue to
+    look: on start, on every lease renewal, or on a submit for the same inputs.
+    """
+
+    def __init__(self, assistant, store: JobStore, workers: int = 4, lease: float = 60.0,
+                 keep: Optional[float] = None):
+        self.assistant = assistant
+        self.store = store
+        self.lease = lease
+        self.owner = uuid.uuid4().hex
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='resume-job')
+        self._stop = threading.Event()
+        self._heartbeat = threading.Thread(target=self._renew_leases, name='resume-job-leases', daemon=True)
+        self._heartbeat.start()
+        if keep is not None:
+            store.prune(keep)
+        self.recover()
+
+    @classmethod
+    def from_settings(cls, assistant, settings: Dict[str, Any] = JOBS) -> "JobQueue":
+        return cls(assistant, JobStore(settings["path"]), workers=settings["workers"],
+                   lease=settings["lease_seconds"], keep=settings["keep_seconds"])
+
+    def submit(self, input_data: Dict[str, Any]) -> str:
+        """Queue a request and return its job id, joining an in-flight job for the same inputs"""
+        input_key = canonical_hash(input_data)
+        job_id, owned = self.store.submit(input_key, input_data, self.owner, self.lease)
+        JOBS_SUBMITTED.inc(result='queued' if owned else 'coalesced')
+        if owned:
+            self._executor.submit(self._run, job_id, input_data)
+        else:
+            logger.info(f"Request joined in-flight job {job_id}")
+        return job_id
+
+    def get(self, job_id: str) -> Optional[Job]:
+        return self.store.get(job_id)
+
+    def wait(self, job_id: str, timeout: float = 300, interval: float = 0.1) -> Job:
+        """Poll until the job is done; raises TimeoutError after ``timeout`` seconds"""
+        deadline = time.monotonic() + timeout
+        while True:
+            job = self.store.get(job_id)
+            if job is None or job.done:
+                return job
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"Job {job_id} still {job.status} after {timeout} seconds")
+            time.sleep(interval)
+
+    def recover(self) -> int:
+        """Re-run in-flight jobs whose process stopped renewing them; returns how many"""
+        claimed = self.store.claim_stale(self.owner, self.lease)
+        for job_id, input_data in claimed:
+            logger.info(f"Resuming job {job_id} left behind by a stopped process")
+            self._executor.submit(self._run, job_id, input_data)
+        return len(claimed)
+
+    def close(self) -> None:
+        """Stop taking jobs and wait for the running ones to finish"""
+        self._stop.set()
+        # The heartbeat may be recovering jobs, which must reach the executor before it shuts down
+        self._heartbeat.join()
+        self._executor.shutdown(wait=True)
+
+    def _renew_leases(self) -> None:
+        while not self._stop.wait(self.lease / 3):
+            try:
+                self.store.renew(self.owner, self.lease)
+                self.recover()
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to renew job leases: {str(e)}")
+
+    def _run(self, job_id: str, input_data: Dict[str, Any]) -> None:
+        def on_wait(status):
+            self.store.set_position(job_id, status.position or None, status.estimated_wait or None)
+
+        with span("job.run", job=job_id):
+            self.store.start(job_id)
+            try:
+                package = None
+                for update in self.assistant.stream_resume_package(input_data, on_wait=on_wait):
+                    if update.key is None:
+                        package = update.value
+                    elif update.complete:
+                        self.store.add_partial(job_id, update.key, update.value)
+            except Exception as e:
+                logger.error(f"Job {job_id} failed: {str(e)}")
+                self.store.finish(job_id, error=str(e) or type(e).__name__)
+                return
+            self.store.finish(job_id, result=package)
@@ -0,0 +1,295 @@
+import os
+import json
+import time
+import random
+import hashlib
+import logging
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+from .completion import PollBackoff, RunFailedError, iter_run_text
+from .http_client import get_openai_client
+from .retry import RetryPolicy
+from .thread_pool import AssistantThreadPool
+from ..exporters.cv_markdown import CVMarkdownRenderer
+from ..utils.metrics import INIT_RETRIES
+from ..utils.tracing import span
+from ..config.settings import LLM_PROVIDER, THREAD_POOL
+
+if TYPE_CHECKING:
+    from openai import OpenAI
+
+logger = logging.getLogger(__name__)
+
+
+class ProviderRun(NamedTuple):
+    """One request in flight on a provider"""
+    thread_id: str
+    content: str
+    attempt: int = 0  # earlier runs of the same content on this provider
+
+
+class LLMProvider(ABC):
+    """Backend that answers resume requests.
+
+    ``create_run`` submits a request, ``iter_reply`` waits for the run and
+    yields its reply text as it arrives, and ``finish_run`` releases whatever
+    the run held, whether or not it succeeded. ``id`` and ``model`` identify
+    the backend in response cache keys; ``rate_limited`` backends have quotas
+    that runs are admitted against.
+    """
+    id: str = ''
+    model: Optional[str] = None
+    rate_limited: bool = False
+
+    @abstractmethod
+    def create_run(self, content: str) -> ProviderRun:
+        """Submit a request and return the run answering it"""
+
+    @abstractmethod
+    def iter_reply(self, run: ProviderRun) -> Iterator[str]:
+        """Wait for the run and yield its reply text as it arrives"""
+
+    def get_reply(self, run: ProviderRun) -> str:
+        """Wait for the run and return its whole reply"""
+        return ''.join(self.iter_reply(run))
+
+    def finish_run(self, run: ProviderRun) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class OpenAIAssistantsProvider(LLMProvider):
+    """The OpenAI Assistants API: each run takes a warm thread from the pool and streams or polls its reply"""
+    rate_limited = True
+
+    def __init__(self, client: Optional["OpenAI"] = None, agent_id: Optional[str] = None,
+                 timeout: float = 300, stream: bool = True, backoff: Optional[PollBackoff] = None,
+                 max_retries: int = 3, retry_delay: float = 2, thread_pool: Dict[str, Any] = THREAD_POOL,
+                 retry: Optional[RetryPolicy] = None):
+        self.client = None
+        self.assistant = None
+        self.timeout = timeout
+        self.stream = stream
+        self.backoff = backoff
+        self.retry = retry or RetryPolicy.from_settings()
+        self._initialize_with_retry(client, agent_id or os.getenv("agent_id"), max_retries, retry_delay)
+        self.thread_pool = AssistantThreadPool(self.client, retry=self.retry, **thread_pool)
+
+    def _initialize_with_retry(self, client, agent_id, max_retries, retry_delay):
+        """Initialize the OpenAI client and retrieve the assistant with retry logic"""
+        for attempt in range(max_retries):
+            try:
+                # One client for all attempts, sending through the process-wide connection pool
+                if self.client is None:
+                    self.client = client or get_openai_client()
+
+                if not agent_id:
+                    raise ValueError("agent_id not found in environment variables")
+
+                self.assistant = self.client.beta.assistants.retrieve(agent_id)
+                logger.info(f"Successfully initialized AssistantManager with assistant: {self.assistant.id}")
+                return
+
+            except Exception as e:
+                logger.error(f"Attempt {attempt + 1} failed: {str(e)}")
+                if attempt < max_retries - 1:
+                    logger.info(f"Retrying in {retry_delay} seconds...")
+                    INIT_RETRIES.inc()
+                    time.sleep(retry_delay)
+                else:
+                    raise Exception(f"Failed to initialize AssistantManager after {max_retries} attempts: {str(e)}")
+
+    @property
+    def id(self) -> str:
+        return self.assistant.id
+
+    @property
+    def model(self) -> Optional[str]:
+        return getattr(self.assistant, 'model', None)
+
+    def create_run(self, content: str) -> ProviderRun:
+        # Take a pre-created thread from the pool and add the request to it
+        with span("thread_pool.acquire"):
+            thread_id = self.thread_pool.acquire()
+        try:
+            with span("messages.create", bytes=len(content)):
+                self.retry.call(self.client.beta.threads.messages.create, thread_id=thread_id, role="user",
+                                content=content, operation='messages.create')
+        except Exception:
+            self.thread_pool.release(thread_id)
+            raise
+        return ProviderRun(thread_id, content)
+
+    def iter_reply(self, run: ProviderRun) -> Iterator[str]:
+        return iter_run_text(self.client, run.thread_id, self.assistant.id, timeout=self.timeout,
+                             stream=self.stream, backoff=self.backoff, retry=self.retry)
+
+    def finish_run(self, run: ProviderRun) -> None:
+        self.thread_pool.release(run.thread_id)
+
+    def close(self) -> None:
+        """Delete pooled threads and stop background thread management"""
+        self.thread_pool.close()
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def load_replies(path: str) -> List[str]:
+    """Recorded assistant replies from a JSONL file, one reply string or package object per line"""
+    replies = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            value = json.loads(line)
+            replies.append(value if isinstance(value, str) else json.dumps(value, ensure_ascii=False))
+    if not replies:
+        raise ValueError(f"No recorded replies found in {path}")
+    return replies
+
+
+_SKILLS = ["Python", "SQL", "Tableau", "Power BI", "Airflow", "dbt", "Spark", "Excel", "Looker", "AWS"]
+_SOFT_SKILLS = ["Communication", "Stakeholder management", "Mentoring", "Problem solving"]
+
+
+def synthetic_package(input_data: Dict[str, Any], seed: int = 0) -> Dict[str, Any]:
+    """A valid resume package addressed to the request's job, for offline runs"""
+    rng = random.Random(f"{seed}:{_digest(json.dumps(input_data, sort_keys=True))}")
+    job = input_data.get('job_name') or 'Data Analyst'
+    employer = ((input_data.get('employer_info') or '').strip() or 'the hiring team').splitlines()[0][:80]
+    headings = [line.lstrip('#').strip() for line in (input_data.get('resume_content') or '').splitlines()
+                if line.startswith('# ')]
+    name = headings[0] if headings else 'Alex Candidate'
+
+    structured_cv = {
+        "name": name,
+        "contact": [f"{name.lower().replace(' ', '.')}@example.com", input_data.get('location') or 'Remote'],
+        "professional_summary": (f"{job} with {rng.randint(4, 12)} years of experience turning data into "
+                                 f"decisions, now bringing that experience to {employer}."),
+        "work_experience": [
+            {
+                "title": title,
+                "company": f"Company {idx + 1}",
+                "dates": f"{2024 - 3 * idx - 3}-{2024 - 3 * idx}",
+                "responsibilities": [
+                    f"Delivered {rng.choice(_SKILLS)} projects for {rng.randint(2, 40)} stakeholders"
+                    for _ in range(rng.randint(2, 4))
+                ]
+            }
+            for idx, title in enumerate((f"Senior {job}", job, f"Junior {job}"))
+        ],
+        "education": [{"degree": "BSc Statistics", "institution": "State University",
+                       "dates": "2010-2014", "details": ["Graduated with honours"]}],
+        "skills": {"Technical": rng.sample(_SKILLS, 5), "Soft Skills": rng.sample(_SOFT_SKILLS, 2)}
+    }
+    return {
+        "cv": CVMarkdownRenderer().render(structured_cv),
+        "structured_cv": structured_cv,
+        "cover_letter": f"Dear {employer},\n\nI am applying for the {job} role.\n\nSincerely,\n{name}",
+        "analysis": f"The resume matches {rng.randint(60, 95)}% of the {job} requirements."
+    }
+
+
+class StubProvider(LLMProvider):
+    """Deterministic in-process provider for offline tests, load tests and benchmarks.
+
+    Replies are picked from the recorded ``replies`` by request, or built with
+    ``synthetic_package``. Each run takes ``latency`` seconds, scaled by a
+    log-normal factor with spread ``latency_sigma`` to give a realistic tail,
+    and fails with RunFailedError at ``failure_rate``. Runs slower than
+    ``timeout`` raise TimeoutError. Draws are seeded by ``seed``, the request
+    and how many times it was sent before, so the same requests see the same
+    latencies and failures however concurrent runs interleave, and a retry
+    gets a fresh draw. Attempts are forgotten once a request succeeds, and
+    only the ``max_tracked`` most recent requests are remembered.
+    """
+    id = 'stub'
+    model = 'stub'
+    max_tracked = 4096
+
+    def __init__(self, replies: Optional[List[str]] = None, latency: float = 0.0,
+                 latency_sigma: float = 0.0, failure_rate: float = 0.0, chunk_size: int = 0,
+                 seed: int = 0, timeout: float = 300, sleep: Callable[[float], None] = time.sleep):
+        self.replies = replies
+        self.latency = latency
+        self.latency_sigma = latency_sigma
+        self.failure_rate = failure_rate
+        self.chunk_size = chunk_size
+        self.seed = seed
+        self.timeout = timeout
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._attempts: "OrderedDict[str, int]" = OrderedDict()
+        self.runs = 0
+
+    @classmethod
+    def from_settings(cls, settings: Dict[str, Any] = LLM_PROVIDER["stub"], **options) -> "StubProvider":
+        """Build the stub described by LLM_PROVIDER["stub"]"""
+        replies = load_replies(settings["replies"]) if settings["replies"] else None
+        return cls(replies=replies, latency=settings["latency"], latency_sigma=settings["latency_sigma"],
+                   failure_rate=settings["failure_rate"], chunk_size=settings["chunk_size"],
+                   seed=settings["seed"], **options)
+
+    def create_run(self, content: str) -> ProviderRun:
+        digest = _digest(content)
+        with self._lock:
+            self.runs += 1
+            attempt = self._attempts.pop(digest, 0)
+            self._attempts[digest] = attempt + 1
+            if len(self._attempts) > self.max_tracked:
+                self._attempts.popitem(last=False)
+            number = self.runs
+        return ProviderRun(f"stub_thread_{number}", content, attempt)
+
+    def plan(self, run: ProviderRun) -> Tuple[float, bool]:
+        """The latency and whether the run fails"""
+        rng = random.Random(f"{self.seed}:{_digest(run.content)}:{run.attempt}")
+        latency = self.latency
+        if self.latency_sigma:
+            latency *= rng.lognormvariate(0, self.latency_sigma)
+        return latency, rng.random() < self.failure_rate
+
+    def reply_for(self, content: str) -> str:
+        if self.replies:
+            return self.replies[int(_digest(content), 16) % len(self.replies)]
+        try:
+            input_data = json.loads(content)
+        except ValueError:
+            input_data = {}
+        return json.dumps(synthetic_package(input_data if isinstance(input_data, dict) else {}, self.seed),
+                          ensure_ascii=False)
+
+    def iter_reply(self, run: ProviderRun) -> Iterator[str]:
+        latency, failed = self.plan(run)
+        if latency > self.timeout:
+            self._sleep(self.timeout)
+            raise TimeoutError(f"Assistant response timeout after {self.timeout} seconds")
+        if failed:
+            self._sleep(latency)
+            raise RunFailedError("Assistant run failed: injected stub failure")
+
+        reply = self.reply_for(run.content)
+        size = self.chunk_size or len(reply) or 1
+        chunks = [reply[i:i + size] for i in range(0, len(reply), size)] or ['']
+        for chunk in chunks:
+            self._sleep(latency / len(chunks))
+            yield chunk
+        with self._lock:
+            self._attempts.pop(_digest(run.content), None)
+
+
+def create_provider(settings: Dict[str, Any] = LLM_PROVIDER, timeout: float = 300,
+                    **openai_options) -> LLMProvider:
+    """Build the provider named in LLM_PROVIDER; ``openai_options`` only apply to the OpenAI provider"""
+    name = settings["name"]
+    if name == "openai":
+        return OpenAIAssistantsProvider(timeout=timeout, **openai_options)
+    if name == "stub":
+        return StubProvider.from_settings(settings["stub"], timeout=timeout)
+    raise ValueError(f"Unknown LLM provider: {name}")
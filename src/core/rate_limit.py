@@ -0,0 +1,149 @@
+import time
+import sqlite3
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+from ..config.settings import RATE_LIMIT
+
+logger = logging.getLogger(__name__)
+
+# Rough size of an English token in characters, enough to budget tokens per minute
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(content: str, completion_tokens: int = 0) -> int:
+    """Tokens a request is likely to consume: its prompt plus the expected reply"""
+    return len(content) // CHARS_PER_TOKEN + 1 + completion_tokens
+
+
+def _take(tokens: float, updated: float, now: float, rate: float, capacity: float,
+          amount: float) -> Tuple[float, float]:
+    """Refill a bucket up to ``now`` and take ``amount``; returns (tokens left, seconds to wait)"""
+    tokens = min(capacity, tokens + max(now - updated, 0) * rate)
+    tokens -= amount
+    # A negative level is a reservation: the caller waits until the refill covers it
+    return tokens, max(-tokens / rate, 0.0)
+
+
+class TokenBucket:
+    """Token bucket refilled at ``per_minute`` tokens a minute, holding at most ``capacity``.
+
+    ``reserve`` always succeeds and returns how long the caller must wait
+    before using what it took, so waiting callers are served in order and the
+    wait can be shown to users up front.
+    """
+
+    def __init__(self, per_minute: float, capacity: Optional[float] = None, clock=time.monotonic):
+        self.rate = per_minute / 60
+        self.capacity = capacity if capacity is not None else per_minute
+        self.clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self, amount: float = 1) -> float:
+        with self._lock:
+            now = self.clock()
+            self._tokens, wait = _take(self._tokens, self._updated, now, self.rate, self.capacity, amount)
+            self._updated = now
+        return wait
+
+    def peek(self, amount: float = 1) -> float:
+        """Seconds ``reserve(amount)`` would wait right now, without taking anything"""
+        with self._lock:
+            return _take(self._tokens, self._updated, self.clock(), self.rate, self.capacity, amount)[1]
+
+
+class SQLiteTokenBucket:
+    """TokenBucket whose level lives in a SQLite file, shared by every process using it.
+
+    Each reservation runs in an immediate transaction, so replicas on the same
+    host (or sharing the file) draw from one quota.
+    """
+
+    def __init__(self, path: Union[str, Path], name: str, per_minute: float,
+                 capacity: Optional[float] = None):
+        self.path = Path(path)
+        self.name = name
+        self.rate = per_minute / 60
+        self.capacity = capacity if capacity is not None else per_minute
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS buckets (name TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL)")
+
+    def _update(self, amount: float, commit: bool) -> float:
+        # Wall-clock time, since the level is shared between processes
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute("SELECT tokens, updated FROM buckets WHERE name = ?",
+                                         (self.name,)).fetchone()
+                tokens, updated = row if row is not None else (self.capacity, now)
+                tokens, wait = _take(tokens, updated, now, self.rate, self.capacity, amount)
+                if commit:
+                    self._conn.execute("INSERT OR REPLACE INTO buckets (name, tokens, updated) VALUES (?, ?, ?)",
+                                       (self.name, tokens, now))
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return wait
+
+    def reserve(self, amount: float = 1) -> float:
+        return self._update(amount, commit=True)
+
+    def peek(self, amount: float = 1) -> float:
+        return self._update(amount, commit=False)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class RateLimiter:
+    """Requests-per-minute and tokens-per-minute quotas for assistant runs"""
+
+    def __init__(self, requests: Optional[TokenBucket] = None, tokens: Optional[TokenBucket] = None,
+                 completion_tokens: int = 0):
+        self.requests = requests
+        self.tokens = tokens
+        self.completion_tokens = completion_tokens
+
+    @classmethod
+    def from_settings(cls, settings: Dict[str, Any] = RATE_LIMIT) -> "RateLimiter":
+        """Build the buckets described by RATE_LIMIT, in memory or in its shared SQLite file"""
+        backend = settings["backend"]
+        burst = settings["burst_seconds"] / 60
+
+        def bucket(name, per_minute):
+            if not per_minute:
+                return None
+            if backend == "memory":
+                return TokenBucket(per_minute, capacity=per_minute * burst)
+            if backend == "sqlite":
+                return SQLiteTokenBucket(settings["sqlite_path"], name, per_minute, capacity=per_minute * burst)
+            raise ValueError(f"Unknown rate limit backend: {backend}")
+
+        return cls(bucket("requests", settings["requests_per_minute"]),
+                   bucket("tokens", settings["tokens_per_minute"]),
+                   completion_tokens=settings["completion_tokens"])
+
+    def cost(self, content: str) -> int:
+        return estimate_tokens(content, self.completion_tokens)
+
+    def reserve(self, tokens: int) -> float:
+        """Take one request and ``tokens`` from the quotas; returns seconds to wait before sending"""
+        waits = [bucket.reserve(amount) for bucket, amount in ((self.requests, 1), (self.tokens, tokens))
+                 if bucket is not None]
+        return max(waits, default=0.0)
+
+    def peek(self, tokens: int) -> float:
+        """Seconds a request of ``tokens`` would wait for the quotas right now"""
+        waits = [bucket.peek(amount) for bucket, amount in ((self.requests, 1), (self.tokens, tokens))
+                 if bucket is not None]
+        return max(waits, default=0.0)
@@ -0,0 +1,54 @@
+import json
+import logging
+from typing import Any, Dict, Optional
+from ..utils.cache import LRUCache, SQLiteCache, TieredCache, canonical_hash
+from ..utils.metrics import record_lookup
+from ..config.settings import CACHE_DIR, RESPONSE_CACHE
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """Content-addressed cache of validated resume packages.
+
+    Keys are a canonical hash of the request's ``input_data`` together with the
+    assistant id and model, so any change to the inputs or the assistant is a miss.
+    Packages are stored as JSON and decoded on every hit, so callers are free to
+    mutate what they get back.
+    """
+
+    def __init__(self, cache: TieredCache):
+        self.cache = cache
+
+    @classmethod
+    def from_settings(cls, settings: Dict[str, Any] = RESPONSE_CACHE) -> Optional["ResponseCache"]:
+        """Build the cache described by RESPONSE_CACHE, or None when it is disabled"""
+        if not settings["enabled"]:
+            return None
+        disk = None
+        if settings["disk"]:
+            disk = SQLiteCache(
+                CACHE_DIR / "responses.sqlite3",
+                max_entries=settings["disk_max_entries"],
+                max_bytes=settings["disk_max_bytes"],
+                ttl=settings["ttl"])
+        memory = LRUCache(max_entries=settings["max_entries"], ttl=settings["ttl"])
+        return cls(TieredCache(memory, disk))
+
+    @staticmethod
+    def key(input_data: Dict[str, Any], assistant) -> str:
+        return canonical_hash(input_data, assistant.id, getattr(assistant, 'model', None))
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        payload = self.cache.get(key)
+        record_lookup('response', payload is not None)
+        if payload is None:
+            return None
+        logger.info("Serving resume package from response cache")
+        return json.loads(payload)
+
+    def put(self, key: str, package: Dict[str, Any]) -> None:
+        self.cache.set(key, json.dumps(package, ensure_ascii=False))
+
+    def stats(self) -> Dict[str, Any]:
+        return self.cache.stats()
@@ -0,0 +1,172 @@
+import re
+import json
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+from ..config.settings import REQUIRED_CV_SECTIONS
+from ..utils.tracing import add_event, span
+
+logger = logging.getLogger(__name__)
+
+REQUIRED_PACKAGE_KEYS = ['cv', 'structured_cv', 'cover_letter', 'analysis']
+REQUIRED_JOB_FIELDS = ['title', 'company', 'dates', 'responsibilities']
+REQUIRED_EDUCATION_FIELDS = ['degree', 'institution', 'dates', 'details']
+
+_decoder = json.JSONDecoder()
+# Matches either a complete JSON string (kept as-is) or a trailing comma before a closer
+_TRAILING_COMMA = re.compile(r'("(?:[^"\\]|\\.)*")|,(\s*[}\]])', re.S)
+
+
+class ResponseFormatError(ValueError):
+    """Assistant reply that is not a valid resume package.
+
+    ``path`` locates schema errors inside the package (e.g.
+    ``structured_cv.work_experience[2].dates``); ``line`` and ``column`` locate
+    JSON syntax errors in the original reply text.
+    """
+
+    def __init__(self, message: str, path: Optional[str] = None,
+                 line: Optional[int] = None, column: Optional[int] = None):
+        super().__init__(message)
+        self.path = path
+        self.line = line
+        self.column = column
+
+
+def _keep_string_or_bracket(match) -> str:
+    return match.group(1) if match.group(1) is not None else match.group(2)
+
+
+def locate_json(reply: str) -> Tuple[int, int]:
+    """Return the ``[start, end)`` span of the JSON object in a reply.
+
+    Prefers a ```json fence, then any ``` fence, then the bare text; the span
+    starts at the first ``{`` so surrounding prose is ignored.
+    """
+    start, end = 0, len(reply)
+    fence = reply.find('```json')
+    if fence != -1:
+        start = fence + len('```json')
+    else:
+        fence = reply.find('```')
+        if fence != -1:
+            # Skip an optional language tag on the opening fence line
+            newline = reply.find('\n', fence)
+            start = newline + 1 if newline != -1 else fence + 3
+    if fence != -1:
+        closing = reply.find('```', start)
+        if closing != -1:
+            end = closing
+
+    brace = reply.find('{', start, end)
+    if brace == -1:
+        raise ResponseFormatError("No JSON object found in assistant response")
+    return brace, end
+
+
+def strip_trailing_commas(text: str, start: int = 0, end: Optional[int] = None) -> str:
+    """Remove commas directly before ``}`` or ``]``, leaving string contents untouched"""
+    return _TRAILING_COMMA.sub(_keep_string_or_bracket, text[start:end])
+
+
+def extract_json(reply: str) -> Any:
+    """Decode the JSON object embedded in an assistant reply.
+
+    The object is decoded in place, so well-formed replies are scanned once with
+    no intermediate copies. Only when that fails is a trailing-comma repair
+    attempted; errors are reported against the original reply's line and column.
+    """
+    start, end = locate_json(reply)
+    try:
+        return _decoder.raw_decode(reply, start)[0]
+    except json.JSONDecodeError as original_error:
+        add_event("extract_json.trailing_comma_repair")
+        repaired = strip_trailing_commas(reply, start, end)
+        try:
+            return _decoder.raw_decode(repaired)[0]
+        except json.JSONDecodeError:
+            pass
+        # Split on '\n' alone, as the decoder does when counting lines
+        context = reply.split('\n')[original_error.lineno - 1]
+        raise ResponseFormatError(
+            f"Failed to parse assistant response as JSON. Error at line {original_error.lineno}, "
+            f"column {original_error.colno}: {original_error.msg}. Context: {context.strip()}",
+            line=original_error.lineno, column=original_error.colno)
+
+
+def _fail(path: str, message: str):
+    raise ResponseFormatError(f"{path}: {message}" if path else message, path=path)
+
+
+def _require_keys(value: Dict, keys: List[str], path: str, what: str) -> None:
+    missing = [key for key in keys if key not in value]
+    if missing:
+        _fail(path, f"missing required {what}: {', '.join(missing)}")
+
+
+def _require_str_list(value: Any, path: str) -> None:
+    if not isinstance(value, list):
+        _fail(path, "must be a list")
+    for idx, item in enumerate(value):
+        if not isinstance(item, str):
+            _fail(f"{path}[{idx}]", "must be a string")
+
+
+def validate_resume_package(package: Any) -> Dict[str, Any]:
+    """Check the structure of a decoded resume package, raising ResponseFormatError"""
+    if not isinstance(package, dict):
+        _fail('', "Assistant response must be a JSON object")
+    _require_keys(package, REQUIRED_PACKAGE_KEYS, '', "keys in response")
+    for key in ('cv', 'cover_letter', 'analysis'):
+        if not isinstance(package[key], str):
+            _fail(key, "must be a string")
+
+    cv = package['structured_cv']
+    if not isinstance(cv, dict):
+        _fail('structured_cv', "must be a dictionary")
+    _require_keys(cv, REQUIRED_CV_SECTIONS, 'structured_cv', "sections")
+
+    if not isinstance(cv['name'], str):
+        _fail('structured_cv.name', "must be a string")
+    _require_str_list(cv['contact'], 'structured_cv.contact')
+    if not isinstance(cv['professional_summary'], str):
+        _fail('structured_cv.professional_summary', "must be a string")
+
+    jobs = cv['work_experience']
+    if not isinstance(jobs, list):
+        _fail('structured_cv.work_experience', "must be a list")
+    for idx, job in enumerate(jobs):
+        path = f'structured_cv.work_experience[{idx}]'
+        if not isinstance(job, dict):
+            _fail(path, "must be a dictionary")
+        _require_keys(job, REQUIRED_JOB_FIELDS, path, "fields")
+        if not isinstance(job['responsibilities'], list):
+            _fail(f'{path}.responsibilities', "must be a list")
+
+    education = cv['education']
+    if not isinstance(education, list):
+        _fail('structured_cv.education', "must be a list")
+    for idx, edu in enumerate(education):
+        path = f'structured_cv.education[{idx}]'
+        if not isinstance(edu, dict):
+            _fail(path, "must be a dictionary")
+        _require_keys(edu, REQUIRED_EDUCATION_FIELDS, path, "fields")
+        if not isinstance(edu['details'], list):
+            _fail(f'{path}.details', "must be a list")
+
+    skills = cv['skills']
+    if not isinstance(skills, dict):
+        _fail('structured_cv.skills', "must be a dictionary")
+    for category, skill_list in skills.items():
+        _require_str_list(skill_list, f'structured_cv.skills[{json.dumps(category)}]')
+
+    return package
+
+
+def parse_resume_package(reply: str) -> Dict[str, Any]:
+    """Extract, repair and validate the resume package in an assistant reply"""
+    if not reply or not reply.strip():
+        raise ResponseFormatError("Empty response received from assistant")
+    with span("extract_json"):
+        package = extract_json(reply)
+    with span("validate_resume_package"):
+        return validate_resume_package(package)
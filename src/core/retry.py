@@ -0,0 +1,202 @@
+import time
+import random
+import asyncio
+import logging
+import contextlib
+import contextvars
+import threading
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Iterator, Optional
+from ..config.settings import RETRY
+from ..utils.metrics import RETRIES, RETRY_GIVE_UPS
+from ..utils.tracing import add_event
+
+logger = logging.getLogger(__name__)
+
+# Statuses worth retrying: timeouts, conflicts on a busy thread, rate limits and server errors
+RETRYABLE_STATUSES = (408, 409, 429)
+
+
+class RetryBudget:
+    """Retries a single request may spend across all of its API calls.
+
+    A request that has already burned through its budget fails on the next
+    error instead of retrying, so an outage cannot multiply every request
+    into a storm of attempts.
+    """
+
+    def __init__(self, retries: int):
+        self.retries = retries
+        self.spent = 0
+        self._lock = threading.Lock()
+
+    @property
+    def remaining(self) -> int:
+        return max(self.retries - self.spent, 0)
+
+    def try_spend(self) -> bool:
+        with self._lock:
+            if self.spent >= self.retries:
+                return False
+            self.spent += 1
+            return True
+
+
+_budget: contextvars.ContextVar[Optional[RetryBudget]] = contextvars.ContextVar('retry_budget', default=None)
+
+
+def current_budget() -> Optional[RetryBudget]:
+    return _budget.get()
+
+
+@contextlib.contextmanager
+def retry_budget(retries: Optional[int] = None) -> Iterator[RetryBudget]:
+    """Share one retry budget between the API calls made inside the block"""
+    budget = RetryBudget(RETRY["budget"] if retries is None else retries)
+    previous = _budget.get()
+    token = _budget.set(budget)
+    try:
+        yield budget
+    finally:
+        try:
+            _budget.reset(token)
+        except ValueError:
+            # Ended from another context, e.g. a generator closed elsewhere
+            _budget.set(previous)
+
+
+def _status_code(error: BaseException) -> Optional[int]:
+    return getattr(error, 'status_code', None)
+
+
+def _headers(error: BaseException):
+    response = getattr(error, 'response', None)
+    return getattr(response, 'headers', None) or {}
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Whether a failed API call may succeed if it is sent again"""
+    import httpx
+    from openai import APIConnectionError
+
+    should_retry = _headers(error).get('x-should-retry')
+    if should_retry in ('true', 'false'):
+        return should_retry == 'true'
+    if isinstance(error, (APIConnectionError, httpx.TransportError)):
+        return True
+    status = _status_code(error)
+    return status is not None and (status in RETRYABLE_STATUSES or status >= 500)
+
+
+def retry_after(error: BaseException) -> Optional[float]:
+    """Seconds the server asked us to wait before retrying, if it said"""
+    headers = _headers(error)
+    try:
+        if headers.get('retry-after-ms') is not None:
+            return max(float(headers['retry-after-ms']) / 1000, 0.0)
+        value = headers.get('retry-after')
+        if value is None:
+            return None
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def _reason(error: BaseException) -> str:
+    status = _status_code(error)
+    return str(status) if status is not None else 'connection'
+
+
+class RetryPolicy:
+    """Jittered exponential backoff for transient API errors.
+
+    Each call is attempted at most ``max_attempts`` times. Waits grow from
+    ``initial_delay`` by ``multiplier`` up to ``max_delay`` and are drawn
+    uniformly below that ceiling (full jitter) so clients that failed together
+    do not retry together. A ``Retry-After`` from the server replaces the
+    computed wait; a call gives up rather than wait longer than
+    ``max_retry_after``.
+    """
+
+    def __init__(self, max_attempts: int = 4, initial_delay: float = 0.5, max_delay: float = 8.0,
+                 multiplier: float = 2.0, max_retry_after: float = 30.0,
+                 sleep: Callable[[float], None] = time.sleep, rng: Optional[random.Random] = None):
+        self.max_attempts = max_attempts
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.max_retry_after = max_retry_after
+        self.sleep = sleep
+        self.rng = rng or random.Random()
+
+    @classmethod
+    def from_settings(cls, settings: Dict[str, Any] = RETRY, **overrides) -> "RetryPolicy":
+        options = {name: settings[name] for name in
+                   ('max_attempts', 'initial_delay', 'max_delay', 'multiplier', 'max_retry_after')}
+        return cls(**dict(options, **overrides))
+
+    def backoff(self, retry: int) -> float:
+        """Jittered wait before retry number ``retry`` (0 for the first)"""
+        ceiling = min(self.initial_delay * self.multiplier ** retry, self.max_delay)
+        return self.rng.uniform(0, ceiling)
+
+    def _next_delay(self, error: BaseException, attempt: int, operation: str,
+                    deadline: Optional[float]) -> Optional[float]:
+        """Wait before the next attempt, or None when the error should be raised"""
+        if not is_retryable(error):
+            return None
+        if attempt >= self.max_attempts:
+            return self._give_up(operation, 'attempts', error)
+        delay = retry_after(error)
+        if delay is None:
+            delay = self.backoff(attempt - 1)
+        elif delay > self.max_retry_after:
+            return self._give_up(operation, 'retry_after', error)
+        if deadline is not None and time.monotonic() + delay >= deadline:
+            return self._give_up(operation, 'deadline', error)
+        budget = current_budget()
+        if budget is not None and not budget.try_spend():
+            return self._give_up(operation, 'budget', error)
+        reason = _reason(error)
+        RETRIES.inc(operation=operation, reason=reason)
+        add_event("retry", operation=operation, attempt=attempt, reason=reason, delay=round(delay, 3))
+        logger.warning(f"{operation} failed ({str(error)}); retry {attempt} in {delay:.2f}s")
+        return delay
+
+    def _give_up(self, operation: str, why: str, error: BaseException) -> None:
+        RETRY_GIVE_UPS.inc(reason=why)
+        add_event("retry.give_up", operation=operation, reason=why)
+        logger.error(f"{operation} failed, not retrying ({why}): {str(error)}")
+        return None
+
+    def call(self, fn: Callable, *args, operation: str = '', deadline: Optional[float] = None, **kwargs):
+        """Call ``fn`` and retry it on transient errors"""
+        operation = operation or getattr(fn, '__qualname__', 'api_call')
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                return fn(*args, **kwargs)
+            except Exception as e:
+                delay = self._next_delay(e, attempt, operation, deadline)
+                if delay is None:
+                    raise
+            self.sleep(delay)
+
+    async def call_async(self, fn: Callable, *args, operation: str = '',
+                         deadline: Optional[float] = None, **kwargs):
+        """Async variant of call for coroutine functions"""
+        operation = operation or getattr(fn, '__qualname__', 'api_call')
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                return await fn(*args, **kwargs)
+            except Exception as e:
+                delay = self._next_delay(e, attempt, operation, deadline)
+                if delay is None:
+                    raise
+            await asyncio.sleep(delay)
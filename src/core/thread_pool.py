@@ -0,0 +1,210 @@
+import asyncio
+import logging
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional, Set
+from .retry import RetryPolicy
+
+logger = logging.getLogger(__name__)
+
+CLEANUP_POLICIES = ('delete', 'keep')
+
+
+class _PoolState:
+    """Bookkeeping shared by the sync and async thread pools"""
+
+    def __init__(self, size: int, cleanup: str):
+        if cleanup not in CLEANUP_POLICIES:
+            raise ValueError(f"cleanup must be one of {', '.join(CLEANUP_POLICIES)}")
+        self.size = size
+        self.cleanup = cleanup
+        self.idle = deque()
+        self.pending = 0
+        self.closed = False
+        self.counters = {'created': 0, 'deleted': 0, 'warm_hits': 0, 'cold_misses': 0}
+
+    def take_idle(self):
+        if self.idle:
+            self.counters['warm_hits'] += 1
+            return self.idle.popleft()
+        self.counters['cold_misses'] += 1
+        return None
+
+    def reserve_refills(self) -> int:
+        """Number of threads to create so that idle + in-flight reaches the pool size"""
+        if self.closed:
+            return 0
+        missing = max(self.size - len(self.idle) - self.pending, 0)
+        self.pending += missing
+        return missing
+
+    def stats(self) -> Dict[str, Any]:
+        return dict(self.counters, idle=len(self.idle), pending=self.pending, size=self.size)
+
+
+class AssistantThreadPool:
+    """Pool of pre-created Assistants threads for a sync OpenAI client.
+
+    Threads are created in the background up to ``size`` and handed out by
+    ``acquire``; used threads are deleted in the background by ``release`` so
+    neither creation nor cleanup sits on the request's critical path.
+    """
+
+    def __init__(self, client, size: int = 4, warm_up: bool = True, cleanup: str = 'delete',
+                 retry: Optional[RetryPolicy] = None):
+        self.client = client
+        self.retry = retry or RetryPolicy.from_settings()
+        self._state = _PoolState(size, cleanup)
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='assistant-thread-pool')
+        if warm_up:
+            self._schedule_refill()
+
+    def acquire(self) -> str:
+        """Return the id of a fresh thread, creating one inline if none is warm"""
+        with self._lock:
+            thread_id = self._state.take_idle()
+        if thread_id is None:
+            thread_id = self._create()
+        self._schedule_refill()
+        return thread_id
+
+    def release(self, thread_id: str) -> None:
+        """Hand back a used thread; it is never given out again"""
+        if self._state.cleanup == 'delete':
+            self._submit(self._delete, thread_id)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return self._state.stats()
+
+    def close(self) -> None:
+        """Delete idle threads and wait for background work to finish"""
+        with self._lock:
+            self._state.closed = True
+            idle = list(self._state.idle)
+            self._state.idle.clear()
+        for thread_id in idle:
+            self._submit(self._delete, thread_id)
+        self._executor.shutdown(wait=True)
+
+    def _submit(self, fn, *args) -> None:
+        try:
+            self._executor.submit(fn, *args)
+        except RuntimeError:
+            # Executor already shut down; do the work inline
+            fn(*args)
+
+    def _schedule_refill(self) -> None:
+        with self._lock:
+            missing = self._state.reserve_refills()
+        for _ in range(missing):
+            self._submit(self._refill_one)
+
+    def _create(self) -> str:
+        thread_id = self.retry.call(self.client.beta.threads.create, operation='threads.create').id
+        with self._lock:
+            self._state.counters['created'] += 1
+        return thread_id
+
+    def _delete(self, thread_id: str) -> None:
+        try:
+            self.retry.call(self.client.beta.threads.delete, thread_id, operation='threads.delete')
+            with self._lock:
+                self._state.counters['deleted'] += 1
+        except Exception as e:
+            logger.warning(f"Failed to delete thread {thread_id}: {str(e)}")
+
+    def _refill_one(self) -> None:
+        try:
+            thread_id = self._create()
+        except Exception as e:
+            logger.warning(f"Failed to pre-create thread: {str(e)}")
+            with self._lock:
+                self._state.pending -= 1
+            return
+        with self._lock:
+            self._state.pending -= 1
+            closed = self._state.closed
+            if not closed:
+                self._state.idle.append(thread_id)
+        if closed:
+            self._delete(thread_id)
+
+
+class AsyncAssistantThreadPool:
+    """AssistantThreadPool counterpart for an AsyncOpenAI client.
+
+    Background creation and deletion run as tasks on the running event loop, so
+    warm-up starts on ``start()`` or the first ``acquire()``.
+    """
+
+    def __init__(self, client, size: int = 4, warm_up: bool = True, cleanup: str = 'delete',
+                 retry: Optional[RetryPolicy] = None):
+        self.client = client
+        self.retry = retry or RetryPolicy.from_settings()
+        self.warm_up = warm_up
+        self._state = _PoolState(size, cleanup)
+        self._tasks: Set[asyncio.Task] = set()
+
+    def start(self) -> None:
+        if self.warm_up:
+            self._schedule_refill()
+
+    async def acquire(self) -> str:
+        thread_id = self._state.take_idle()
+        if thread_id is None:
+            thread_id = await self._create()
+        self._schedule_refill()
+        return thread_id
+
+    def release(self, thread_id: str) -> None:
+        if self._state.cleanup == 'delete':
+            self._spawn(self._delete(thread_id))
+
+    def stats(self) -> Dict[str, Any]:
+        return self._state.stats()
+
+    async def close(self) -> None:
+        self._state.closed = True
+        idle = list(self._state.idle)
+        self._state.idle.clear()
+        for thread_id in idle:
+            self._spawn(self._delete(thread_id))
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _spawn(self, coro) -> None:
+        task = asyncio.get_running_loop().create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _schedule_refill(self) -> None:
+        for _ in range(self._state.reserve_refills()):
+            self._spawn(self._refill_one())
+
+    async def _create(self) -> str:
+        thread = await self.retry.call_async(self.client.beta.threads.create, operation='threads.create')
+        self._state.counters['created'] += 1
+        return thread.id
+
+    async def _delete(self, thread_id: str) -> None:
+        try:
+            await self.retry.call_async(self.client.beta.threads.delete, thread_id, operation='threads.delete')
+            self._state.counters['deleted'] += 1
+        except Exception as e:
+            logger.warning(f"Failed to delete thread {thread_id}: {str(e)}")
+
+    async def _refill_one(self) -> None:
+        try:
+            thread_id = await self._create()
+        except Exception as e:
+            logger.warning(f"Failed to pre-create thread: {str(e)}")
+            return
+        finally:
+            self._state.pending -= 1
+        if self._state.closed:
+            await self._delete(thread_id)
+        else:
+            self._state.idle.append(thread_id)
@@ -0,0 +1,184 @@
+import sys
+import time
+import logging
+import zipfile
+import multiprocessing
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+from .pdf_exporter import render_resume_pdf
+from ..utils.helpers import sanitize_filename
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+# Small CV rendered once per worker so fonts, glyph widths and imports are warm
+_WARM_UP_CV = {
+    "name": "Warm Up",
+    "contact": ["warm@example.com"],
+    "professional_summary": "Warm-up document rendered when a worker starts.",
+    "work_experience": [{"title": "Title", "company": "Company", "dates": "2020-2024",
+                         "responsibilities": ["Responsibility"]}],
+    "education": [{"degree": "Degree", "institution": "Institution", "dates": "2016-2020",
+                   "details": ["Detail"]}],
+    "skills": {"Technical": ["Skill"]}
+}
+
+
+class RenderJob(NamedTuple):
+    """One document to render; ``name`` becomes its file name in the sink"""
+    name: str
+    structured_cv: Dict[str, Any]
+    language: str = "English"
+
+
+class BulkRenderReport(NamedTuple):
+    documents: int
+    failed: List[Tuple[str, str]]
+    elapsed: float
+    peak_rss_bytes: int  # largest worker (or in-process) peak resident set size
+
+    @property
+    def docs_per_sec(self) -> float:
+        return self.documents / self.elapsed if self.elapsed else 0.0
+
+    def summary(self) -> str:
+        return (f"Rendered {self.documents} document(s), {len(self.failed)} failed, in {self.elapsed:.2f}s "
+                f"({self.docs_per_sec:.1f} docs/s, peak RSS {self.peak_rss_bytes / 1024 / 1024:.1f}MB)")
+
+
+def peak_rss_bytes() -> int:
+    """Peak resident set size of the current process, or 0 where unavailable"""
+    if resource is None:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+class DirectorySink:
+    """Writes each PDF to ``<directory>/<name>.pdf``"""
+
+    def __init__(self, directory: Union[str, Path]):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._names = set()
+
+    def write(self, name: str, data: bytes) -> None:
+        (self.directory / _unique_pdf_name(name, self._names)).write_bytes(data)
+
+    def close(self) -> None:
+        pass
+
+
+class ZipSink:
+    """Streams each PDF into a zip archive as it finishes"""
+
+    def __init__(self, path: Union[str, Path]):
+        # PDFs are already compressed, so entries are stored as-is
+        self._zip = zipfile.ZipFile(path, 'w', compression=zipfile.ZIP_STORED)
+        self._names = set()
+
+    def write(self, name: str, data: bytes) -> None:
+        self._zip.writestr(_unique_pdf_name(name, self._names), data)
+
+    def close(self) -> None:
+        self._zip.close()
+
+
+class CallbackSink:
+    """Hands each PDF to ``callback(name, data)``"""
+
+    def __init__(self, callback: Callable[[str, bytes], None]):
+        self.callback = callback
+
+    def write(self, name: str, data: bytes) -> None:
+        self.callback(name, data)
+
+    def close(self) -> None:
+        pass
+
+
+def _pdf_name(name: str) -> str:
+    name = sanitize_filename(name)
+    return name if name.lower().endswith('.pdf') else f"{name}.pdf"
+
+
+def _unique_pdf_name(name: str, taken: set) -> str:
+    """``_pdf_name`` suffixed with -2, -3, ... when an earlier document already took it"""
+    pdf_name = candidate = _pdf_name(name)
+    count = 1
+    # Compared case-insensitively, as on the file systems people unzip onto
+    while candidate.lower() in taken:
+        count += 1
+        candidate = f"{pdf_name[:-4]}-{count}{pdf_name[-4:]}"
+    taken.add(candidate.lower())
+    return candidate
+
+
+_worker_render = None
+
+
+def _init_worker(render: Callable[..., bytes]) -> None:
+    global _worker_render
+    _worker_render = render
+    render(_WARM_UP_CV, language="English")
+
+
+def _render_job(job: RenderJob) -> Tuple[str, Optional[bytes], Optional[str], int]:
+    try:
+        data = _worker_render(job.structured_cv, language=job.language)
+        error = None
+    except Exception as e:
+        data, error = None, f"{type(e).__name__}: {str(e)}"
+    return job.name, data, error, peak_rss_bytes()
+
+
+def render_many(jobs: Iterable[Union[RenderJob, Tuple]], sink, workers: Optional[int] = None,
+                render: Callable[..., bytes] = render_resume_pdf, chunksize: int = 4) -> BulkRenderReport:
+    """Render many structured CVs to PDF across a pool of warm worker processes.
+
+    ``jobs`` may be a generator; documents are handed to ``sink.write`` in
+    completion order as they finish, so memory stays flat however many are
+    rendered. ``render`` must be a module-level function (it is sent to the
+    workers by reference). With ``workers=0`` everything runs in-process.
+    The sink is closed when rendering ends.
+    """
+    jobs = (job if isinstance(job, RenderJob) else RenderJob(*job) for job in jobs)
+    documents = 0
+    failed: List[Tuple[str, str]] = []
+    peak = 0
+    start = time.perf_counter()
+    try:
+        if workers == 0:
+            _init_worker(render)
+            results = map(_render_job, jobs)
+            pool = None
+        else:
+            context = multiprocessing.get_context('spawn')
+            pool = context.Pool(workers, initializer=_init_worker, initargs=(render,))
+            results = pool.imap_unordered(_render_job, jobs, chunksize=chunksize)
+        try:
+            for name, data, error, worker_peak in results:
+                peak = max(peak, worker_peak)
+                if error is not None:
+                    logger.error(f"Failed to render {name}: {error}")
+                    failed.append((name, error))
+                    continue
+                sink.write(name, data)
+                documents += 1
+        except BaseException:
+            # Don't wait for the rest of the batch if the sink or caller failed
+            if pool is not None:
+                pool.terminate()
+            raise
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+    finally:
+        sink.close()
+    return BulkRenderReport(documents, failed, time.perf_counter() - start, peak)
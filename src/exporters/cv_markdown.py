@@ -0,0 +1,77 @@
+from typing import Any, Callable, Dict, Hashable, List, Tuple
+
+
+def _bullets(items) -> str:
+    return ''.join(f"- {item}\n" for item in items)
+
+
+def _strings(items) -> Tuple[str, ...]:
+    """Hashable snapshot of a list for section keys; items are rendered as text anyway"""
+    return tuple(str(item) for item in items)
+
+
+def _render_contact(contact: Tuple[str, ...]) -> str:
+    return "## Contact\n" + _bullets(contact) + "\n"
+
+
+def _render_summary(summary: str) -> str:
+    return "## Professional Summary\n" + summary + "\n\n"
+
+
+def _render_entry(heading: str, subtitle: str, dates: str, items: Tuple[str, ...]) -> str:
+    return f"### {heading}\n**{subtitle}** | {dates}\n" + _bullets(items) + "\n"
+
+
+def _render_skills(category: str, skills: Tuple[str, ...]) -> str:
+    return f"### {category}\n" + _bullets(skills) + "\n"
+
+
+class CVMarkdownRenderer:
+    """Renders a structured CV to markdown, re-rendering only the sections that changed.
+
+    Each section (contact, summary, every job, education entry and skill
+    category) is cached under a snapshot of its own fields, so a clean
+    section costs a dict lookup and only dirty sections are formatted again
+    before the parts are joined. Sections are cached by content rather than
+    position, so inserting or deleting an entry leaves its neighbours cached.
+    Entries no longer in the CV are dropped after each render.
+    """
+
+    def __init__(self):
+        self._sections: Dict[Hashable, str] = {}
+        self.rendered = 0  # sections formatted since creation, for benchmarks and tests
+
+    def render(self, structured_cv: Dict[str, Any]) -> str:
+        sections: Dict[Hashable, str] = {}
+        parts: List[str] = [f"# {structured_cv['name']}\n\n"]
+
+        previous = self._sections
+
+        def section(render: Callable[..., str], *fields) -> None:
+            key = (render, *fields)
+            text = previous.get(key)
+            if text is None:
+                text = render(*fields)
+                self.rendered += 1
+            sections[key] = text
+            parts.append(text)
+
+        section(_render_contact, _strings(structured_cv['contact']))
+        section(_render_summary, str(structured_cv['professional_summary']))
+
+        parts.append("## Work Experience\n\n")
+        for job in structured_cv['work_experience']:
+            section(_render_entry, *_strings((job['title'], job['company'], job['dates'])),
+                    _strings(job['responsibilities']))
+
+        parts.append("## Education\n\n")
+        for edu in structured_cv['education']:
+            section(_render_entry, *_strings((edu['degree'], edu['institution'], edu['dates'])),
+                    _strings(edu['details']))
+
+        parts.append("## Skills\n\n")
+        for category, skills in structured_cv['skills'].items():
+            section(_render_skills, category, _strings(skills))
+
+        self._sections = sections
+        return ''.join(parts)
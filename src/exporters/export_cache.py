@@ -0,0 +1,56 @@
+import logging
+from typing import Any, Callable, Dict, Optional
+from ..utils.cache import LRUCache, canonical_hash
+from ..utils.metrics import record_export, record_lookup
+from ..utils.tracing import span
+from ..config.settings import EXPORT_CACHE
+
+logger = logging.getLogger(__name__)
+
+
+class ExportCache:
+    """Memoizes rendered resume documents by their inputs.
+
+    Keys hash the renderer together with the canonical form of the structured
+    CV, the language and every layout setting, so editing any of them renders
+    afresh while unchanged downloads are served from a byte-bounded LRU.
+    """
+
+    def __init__(self, cache: Optional[LRUCache] = None):
+        self.cache = cache
+
+    @classmethod
+    def from_settings(cls, settings: Dict[str, Any] = EXPORT_CACHE) -> "ExportCache":
+        """Build the cache described by EXPORT_CACHE; a disabled cache always renders"""
+        if not settings["enabled"]:
+            return cls()
+        return cls(LRUCache(max_entries=settings["max_entries"], max_bytes=settings["max_bytes"]))
+
+    @staticmethod
+    def key(render: Callable[..., bytes], structured_cv: Dict[str, Any], language: str,
+            layout: Dict[str, Any]) -> str:
+        return canonical_hash(f"{render.__module__}.{render.__qualname__}", structured_cv, language, layout)
+
+    def render(self, render: Callable[..., bytes], structured_cv: Dict[str, Any],
+               language: str = "English", **layout) -> bytes:
+        """Return ``render(structured_cv, language=language, **layout)``, rendering only on a miss"""
+        with span("export_cache.render", renderer=render.__qualname__) as render_span:
+            if self.cache is None:
+                document = render(structured_cv, language=language, **layout)
+            else:
+                key = self.key(render, structured_cv, language, layout)
+                document = self.cache.get(key)
+                render_span.set(hit=document is not None)
+                record_lookup('export', document is not None)
+                if document is None:
+                    document = render(structured_cv, language=language, **layout)
+                    self.cache.set(key, document)
+                else:
+                    logger.info("Serving rendered document from export cache")
+            record_export(render.__qualname__, document)
+            return document
+
+    def stats(self) -> Dict[str, Any]:
+        if self.cache is None:
+            return {}
+        return dict(self.cache.stats.as_dict(), entries=len(self.cache), bytes=self.cache.size_bytes)
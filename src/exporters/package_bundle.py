@@ -0,0 +1,79 @@
+import io
+import zipfile
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, Tuple, Union
+from ..utils.metrics import record_export
+
+# (archive name, zero-argument producer of the member's contents)
+BundleMember = Tuple[str, Callable[[], Union[str, bytes]]]
+
+# Members that are already compressed are stored rather than deflated again
+_STORED_SUFFIXES = ('.pdf', '.docx')
+
+
+def package_text(package: Dict[str, Any]) -> str:
+    """The resume package as one plain-text document"""
+    return f"""
+ATS Resume Package
+
+ANALYSIS
+--------
+{package['analysis']}
+
+RESUME
+------
+{package['cv']}
+
+COVER LETTER
+-----------
+{package['cover_letter']}
+"""
+
+
+def package_markdown(package: Dict[str, Any]) -> str:
+    """The resume package as one markdown document"""
+    return f"""
+# ATS Resume Package
+
+## Analysis
+{package['analysis']}
+
+## Resume
+{package['cv']}
+
+## Cover Letter
+{package['cover_letter']}
+"""
+
+
+def bundle_members(package: Dict[str, Any], render_pdf: Callable[[], bytes],
+                   render_docx: Callable[[], bytes]) -> Iterator[BundleMember]:
+    """Members of the full download bundle; nothing is generated until a producer is called"""
+    yield 'analysis.md', lambda: package['analysis']
+    yield 'resume.md', lambda: package['cv']
+    yield 'cover_letter.md', lambda: package['cover_letter']
+    yield 'ats_resume_package.md', lambda: package_markdown(package)
+    yield 'ats_resume_package.txt', lambda: package_text(package)
+    yield 'resume.pdf', render_pdf
+    yield 'resume.docx', render_docx
+
+
+def write_zip(members: Iterable[BundleMember], stream: BinaryIO) -> None:
+    """Write members into a zip on ``stream`` one at a time, producing each just before it is written"""
+    with zipfile.ZipFile(stream, 'w') as archive:
+        for name, produce in members:
+            compression = zipfile.ZIP_STORED if name.endswith(_STORED_SUFFIXES) else zipfile.ZIP_DEFLATED
+            info = zipfile.ZipInfo(name)
+            info.compress_type = compression
+            content = produce()
+            with archive.open(info, 'w') as member:
+                member.write(content.encode('utf-8') if isinstance(content, str) else content)
+
+
+def build_package_zip(package: Dict[str, Any], render_pdf: Callable[[], bytes],
+                      render_docx: Callable[[], bytes]) -> bytes:
+    """Zip of the analysis, CV and cover letter texts plus the PDF and DOCX resumes"""
+    buffer = io.BytesIO()
+    write_zip(bundle_members(package, render_pdf, render_docx), buffer)
+    bundle = buffer.getvalue()
+    record_export('build_package_zip', bundle)
+    return bundle
@@ -1,7 +1,8 @@
 from fpdf import FPDF
-import textwrap
+from .text_layout import write_paragraph
 from typing import Dict, List, Optional
 from ..config.settings import PDF_SETTINGS
+from ..utils.tracing import traced
 import logging
 
 logger = logging.getLogger(__name__)
@@ -48,9 +49,7 @@ class ResumePDF(FPDF):
         try:
             self.set_font('Times', '', PDF_SETTINGS["font_size"]["body"])
             contact_line = ' | '.join(contact_info)
-            wrapped_contact = textwrap.fill(contact_line, width=120)
-            for line in wrapped_contact.split('\n'):
-                self.cell(0, 5, line, ln=True, align='C')
+            write_paragraph(self, contact_line, 5, align='C')
             self.ln(5)
         except Exception as e:
             logger.error(f"Error adding contact info: {str(e)}")
@@ -71,9 +70,7 @@ class ResumePDF(FPDF):
         """Add professional summary section"""
         try:
             self.set_font('Times', '', PDF_SETTINGS["font_size"]["body"])
-            wrapped_text = textwrap.fill(summary, width=120)
-            for line in wrapped_text.split('\n'):
-                self.cell(0, spacing, line, ln=True)
+            write_paragraph(self, summary, spacing)
             self.ln(5)
         except Exception as e:
             logger.error(f"Error adding professional summary: {str(e)}")
@@ -91,15 +88,7 @@ class ResumePDF(FPDF):
                 
                 for resp in job['responsibilities']:
                     self.cell(5, spacing, '-', ln=0)
-                    wrapped_text = textwrap.fill(resp, width=120)
-                    first_line = True
-                    for line in wrapped_text.split('\n'):
-                        if first_line:
-                            self.cell(0, spacing, line, ln=True)
-                            first_line = False
-                        else:
-                            self.cell(5, spacing, '', ln=0)
-                            self.cell(0, spacing, line, ln=True)
+                    write_paragraph(self, resp, spacing)
                 self.ln(3)
         except Exception as e:
             logger.error(f"Error adding work experience: {str(e)}")
@@ -116,10 +105,8 @@ class ResumePDF(FPDF):
                 self.cell(0, spacing, f"{edu['institution']} | {edu['dates']}", ln=True)
                 
                 details_text = ', '.join(edu['details'])
-                wrapped_details = textwrap.fill(details_text, width=120)
-                for line in wrapped_details.split('\n'):        
-                    self.cell(5, spacing, '-', ln=0)
-                    self.cell(0, spacing, line, ln=True)
+                self.cell(5, spacing, '-', ln=0)
+                write_paragraph(self, details_text, spacing)
                 self.ln(3)
         except Exception as e:
             logger.error(f"Error adding education: {str(e)}")
@@ -134,35 +121,43 @@ class ResumePDF(FPDF):
                 
                 self.set_font('Times', '', PDF_SETTINGS["font_size"]["body"])
                 skills_text = ', '.join(skill_list)
-                wrapped_skills = textwrap.fill(skills_text, width=120)
-                for line in wrapped_skills.split('\n'):
-                    self.cell(0, spacing, line, ln=True)
+                write_paragraph(self, skills_text, spacing)
                 self.ln(3)
         except Exception as e:
             logger.error(f"Error adding skills: {str(e)}")
             raise
 
+def build_resume_pdf(structured_cv: Dict, language: str = "English") -> ResumePDF:
+    """Lay out the resume from structured CV data"""
+    pdf = ResumePDF(language=language)
+    
+    pdf.add_header(structured_cv['name'])
+    pdf.add_contact_info(structured_cv['contact'])
+    
+    pdf.add_section_header(pdf.headers[0])
+    pdf.add_professional_summary(structured_cv['professional_summary'])
+    
+    pdf.add_section_header(pdf.headers[1])
+    pdf.add_work_experience(structured_cv['work_experience'])
+    
+    pdf.add_section_header(pdf.headers[2])
+    pdf.add_education(structured_cv['education'])
+    
+    pdf.add_section_header(pdf.headers[3])
+    pdf.add_skills(structured_cv['skills'])
+    return pdf
+
+@traced("export.render_pdf")
+def render_resume_pdf(structured_cv: Dict, language: str = "English") -> bytes:
+    """Render the PDF resume into memory and return its bytes"""
+    return bytes(build_resume_pdf(structured_cv, language=language).output())
+
 def generate_resume_pdf(structured_cv: Dict, language: str = "English", output_path: str = 'resume.pdf') -> bool:
     """Generate PDF resume from structured CV data"""
     try:
-        pdf = ResumePDF(language=language)
-        
-        pdf.add_header(structured_cv['name'])
-        pdf.add_contact_info(structured_cv['contact'])
-        
-        pdf.add_section_header(pdf.headers[0])
-        pdf.add_professional_summary(structured_cv['professional_summary'])
-        
-        pdf.add_section_header(pdf.headers[1])
-        pdf.add_work_experience(structured_cv['work_experience'])
-        
-        pdf.add_section_header(pdf.headers[2])
-        pdf.add_education(structured_cv['education'])
-        
-        pdf.add_section_header(pdf.headers[3])
-        pdf.add_skills(structured_cv['skills'])
-        
-        pdf.output(output_path)
+        pdf_bytes = render_resume_pdf(structured_cv, language=language)
+        with open(output_path, 'wb') as f:
+            f.write(pdf_bytes)
         logger.info(f"Successfully generated PDF at {output_path}")
         return True
     except Exception as e:
@@ -0,0 +1,105 @@
+from typing import Dict, List, Tuple
+
+# Slack (in user units) so fpdf never re-breaks a line we measured as fitting
+_FIT_TOLERANCE = 0.01
+
+
+class GlyphWidthCache:
+    """Advance widths of single characters, cached per (font, style, size, char).
+
+    Widths are measured once through the document's active font and reused by
+    every later document, so wrapping a paragraph is a dictionary lookup per
+    character instead of a string-width call per candidate line.
+    """
+
+    def __init__(self):
+        self._tables: Dict[Tuple[str, str, float], Dict[str, float]] = {}
+
+    def table(self, pdf) -> Dict[str, float]:
+        """Width table for the font currently selected on ``pdf``"""
+        key = (pdf.font_family, pdf.font_style, pdf.font_size_pt)
+        table = self._tables.get(key)
+        if table is None:
+            table = self._tables.setdefault(key, {})
+        return table
+
+    def measure(self, pdf, text: str, table: Dict[str, float] = None) -> float:
+        """Width of ``text`` in the active font, in user units"""
+        if table is None:
+            table = self.table(pdf)
+        width = 0.0
+        for char in text:
+            char_width = table.get(char)
+            if char_width is None:
+                char_width = table[char] = pdf.get_string_width(char)
+            width += char_width
+        return width
+
+    def wrap(self, pdf, text: str, max_width: float) -> List[str]:
+        """Greedily break ``text`` into lines no wider than ``max_width``.
+
+        Whitespace runs collapse to single spaces, as with ``textwrap.fill``;
+        words wider than a whole line are split between characters.
+        """
+        table = self.table(pdf)
+        space = self.measure(pdf, ' ', table)
+        lines: List[str] = []
+        line: List[str] = []
+        line_width = 0.0
+        for word in text.split():
+            word_width = self.measure(pdf, word, table)
+            if line and line_width + space + word_width > max_width:
+                lines.append(' '.join(line))
+                line, line_width = [], 0.0
+            if word_width > max_width:
+                pieces = self._split_word(pdf, word, max_width, table)
+                lines.extend(pieces[:-1])
+                word = pieces[-1]
+                word_width = self.measure(pdf, word, table)
+            line_width += word_width + (space if line else 0.0)
+            line.append(word)
+        if line or not lines:
+            lines.append(' '.join(line))
+        return lines
+
+    def _split_word(self, pdf, word: str, max_width: float, table: Dict[str, float]) -> List[str]:
+        pieces = []
+        start, width = 0, 0.0
+        for idx, char in enumerate(word):
+            char_width = self.measure(pdf, char, table)
+            if idx > start and width + char_width > max_width:
+                pieces.append(word[start:idx])
+                start, width = idx, 0.0
+            width += char_width
+        pieces.append(word[start:])
+        return pieces
+
+
+GLYPH_WIDTHS = GlyphWidthCache()
+
+
+def write_paragraph(pdf, text: str, height: float, align: str = 'L') -> int:
+    """Wrap ``text`` to the space right of the cursor and write it in one call.
+
+    Lines are measured here, so each is placed with the low-level ``text()``
+    at the baseline ``cell()`` would use; ``cell()`` and ``multi_cell()`` would
+    re-measure every line and cost several times the whole layout. Page breaks
+    follow the document's auto page break setting. Continuation lines start at
+    the same x as the first, which gives bullets a hanging indent. Returns the
+    number of lines written.
+    """
+    x = pdf.x
+    width = pdf.w - pdf.r_margin - x
+    table = GLYPH_WIDTHS.table(pdf)
+    lines = GLYPH_WIDTHS.wrap(pdf, text, width - 2 * pdf.c_margin - _FIT_TOLERANCE)
+    for line in lines:
+        if pdf.will_page_break(height):
+            pdf.add_page()
+        offset = pdf.c_margin
+        if align == 'C':
+            offset = (width - GLYPH_WIDTHS.measure(pdf, line, table)) / 2
+        if line:
+            pdf.text(x + offset, pdf.y + 0.5 * height + 0.3 * pdf.font_size, line)
+        pdf.set_y(pdf.y + height)
+    pdf.set_x(pdf.l_margin)
+    return len(lines)
@@ -0,0 +1,244 @@
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# Cached values are immutable text or bytes so they can be shared without copying
+CacheValue = Union[str, bytes]
+
+
+def canonical_hash(*parts: Any) -> str:
+    """SHA-256 of the canonical JSON form of ``parts`` (key order independent)"""
+    canonical = json.dumps(parts, sort_keys=True, separators=(',', ':'), ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+class CacheStats:
+    """Hit/miss counters shared by the cache tiers"""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions}
+
+
+class LRUCache:
+    """Thread-safe in-memory LRU with TTL, entry-count and byte-size limits"""
+
+    def __init__(self, max_entries: int = 128, max_bytes: Optional[int] = None,
+                 ttl: Optional[float] = None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.stats = CacheStats()
+        self.size_bytes = 0
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[CacheValue]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.time():
+                self._remove(key)
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return value
+
+    def set(self, key: str, value: CacheValue, expires_at: Optional[float] = None) -> None:
+        size = len(value)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        if expires_at is None and self.ttl is not None:
+            expires_at = time.time() + self.ttl
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, expires_at)
+            self.size_bytes += size
+            while len(self._entries) > self.max_entries or (
+                    self.max_bytes is not None and self.size_bytes > self.max_bytes):
+                self._remove(next(iter(self._entries)))
+                self.stats.evictions += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size_bytes = 0
+
+    def _remove(self, key: str) -> None:
+        value, _ = self._entries.pop(key)
+        self.size_bytes -= len(value)
+
+
+class SQLiteCache:
+    """On-disk cache tier backed by a single SQLite file.
+
+    Entries expire after ``ttl`` seconds and the least recently used ones are
+    evicted once the table grows past ``max_entries`` or ``max_bytes``.
+    """
+
+    def __init__(self, path: Union[str, Path], max_entries: int = 1000,
+                 max_bytes: Optional[int] = None, ttl: Optional[float] = None):
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # One connection per cache, serialized by the lock; WAL lets other processes read
+        self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        with self._lock, self._conn as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                " key TEXT PRIMARY KEY, value BLOB NOT NULL, is_text INTEGER NOT NULL,"
+                " size INTEGER NOT NULL, expires_at REAL, accessed_at REAL NOT NULL)")
+            conn.execute("CREATE INDEX IF NOT EXISTS cache_accessed ON cache (accessed_at)")
+
+    def get_entry(self, key: str) -> Optional[tuple]:
+        """Return ``(value, expires_at)`` or None"""
+        now = time.time()
+        with self._lock, self._conn as conn:
+            row = conn.execute(
+                "SELECT value, is_text, expires_at FROM cache WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.stats.misses += 1
+                return None
+            value, is_text, expires_at = row
+            if expires_at is not None and expires_at <= now:
+                conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+                self.stats.misses += 1
+                return None
+            conn.execute("UPDATE cache SET accessed_at = ? WHERE key = ?", (now, key))
+            self.stats.hits += 1
+        return (value.decode('utf-8') if is_text else bytes(value)), expires_at
+
+    def get(self, key: str) -> Optional[CacheValue]:
+        entry = self.get_entry(key)
+        return entry[0] if entry else None
+
+    def set(self, key: str, value: CacheValue, expires_at: Optional[float] = None) -> None:
+        now = time.time()
+        if expires_at is None and self.ttl is not None:
+            expires_at = now + self.ttl
+        is_text = isinstance(value, str)
+        blob = value.encode('utf-8') if is_text else value
+        if self.max_bytes is not None and len(blob) > self.max_bytes:
+            return
+        with self._lock, self._conn as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, is_text, size, expires_at, accessed_at)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (key, sqlite3.Binary(blob), int(is_text), len(blob), expires_at, now))
+            self._evict(conn, now)
+
+    def delete(self, key: str) -> None:
+        with self._lock, self._conn as conn:
+            conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._lock, self._conn as conn:
+            conn.execute("DELETE FROM cache")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        conn.execute("DELETE FROM cache WHERE expires_at IS NOT NULL AND expires_at <= ?", (now,))
+        count, total = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache").fetchone()
+        rows = conn.execute("SELECT key, size FROM cache ORDER BY accessed_at")
+        doomed = []
+        for key, size in rows:
+            if count <= self.max_entries and (self.max_bytes is None or total <= self.max_bytes):
+                break
+            doomed.append((key,))
+            count -= 1
+            total -= size
+        if doomed:
+            conn.executemany("DELETE FROM cache WHERE key = ?", doomed)
+            self.stats.evictions += len(doomed)
+
+
+class TieredCache:
+    """Memory LRU in front of an optional SQLite tier; disk hits are promoted"""
+
+    def __init__(self, memory: LRUCache, disk: Optional[SQLiteCache] = None):
+        self.memory = memory
+        self.disk = disk
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[CacheValue]:
+        value = self.memory.get(key)
+        if value is None and self.disk is not None:
+            entry = self.disk.get_entry(key)
+            if entry is not None:
+                value, expires_at = entry
+                self.memory.set(key, value, expires_at=expires_at)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def set(self, key: str, value: CacheValue) -> None:
+        self.memory.set(key, value)
+        if self.disk is not None:
+            try:
+                self.disk.set(key, value)
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to write cache entry to disk: {str(e)}")
+
+    def delete(self, key: str) -> None:
+        self.memory.delete(key)
+        if self.disk is not None:
+            self.disk.delete(key)
+
+    def clear(self) -> None:
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for the cache as a whole and for each tier"""
+        lookups = self.hits + self.misses
+        stats = {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "memory": dict(self.memory.stats.as_dict(), entries=len(self.memory),
+                           bytes=self.memory.size_bytes),
+        }
+        if self.disk is not None:
+            stats["disk"] = self.disk.stats.as_dict()
+        return stats
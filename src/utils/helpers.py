@@ -2,7 +2,6 @@ import os
 import logging
 from pathlib import Path
 from typing import Optional, Union
-import magic
 from ..config.settings import MAX_FILE_SIZE, SUPPORTED_FILE_TYPES
 
 logger = logging.getLogger(__name__)
@@ -24,7 +23,8 @@ def validate_file(file_path: Union[str, Path]) -> Optional[str]:
         if file_size > MAX_FILE_SIZE:
             raise ValueError(f"File size exceeds maximum limit of {MAX_FILE_SIZE/1024/1024}MB")
 
-        # Check file type
+        # Check file type; libmagic is only loaded once a file is validated
+        import magic
         mime = magic.Magic(mime=True)
         file_type = mime.from_file(str(file_path))
         
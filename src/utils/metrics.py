@@ -0,0 +1,223 @@
+import bisect
+import logging
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Sequence, Tuple
+from ..config.settings import METRICS
+
+if TYPE_CHECKING:
+    from http.server import ThreadingHTTPServer
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# Seconds, from sub-millisecond cache lookups up to the run timeout
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+POLL_BUCKETS = (1, 2, 3, 5, 8, 13, 21, 34, 55, 89)
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = '') -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) and not value.is_integer() else str(int(value))
+
+
+class Registry:
+    """The metrics exposed together on one endpoint"""
+
+    def __init__(self):
+        self._metrics: List["_Metric"] = []
+        self._lock = threading.Lock()
+
+    def register(self, metric: "_Metric") -> None:
+        with self._lock:
+            if any(existing.name == metric.name for existing in self._metrics):
+                raise ValueError(f"Duplicate metric: {metric.name}")
+            self._metrics.append(metric)
+
+    def exposition(self) -> str:
+        """All metrics in the Prometheus text exposition format"""
+        with self._lock:
+            metrics = list(self._metrics)
+        lines = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            lines.extend(f"{name}{labels} {_format_value(value)}" for name, labels, value in metric.samples())
+        return '\n'.join(lines) + '\n'
+
+
+REGISTRY = Registry()
+
+
+class _Metric:
+    type = ''
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 registry: Optional[Registry] = REGISTRY):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        # One short critical section per update keeps the hot path cheap
+        self._lock = threading.Lock()
+        self._values: Dict[Tuple[str, ...], Any] = {}
+        if registry is not None:
+            registry.register(self)
+
+    def _key(self, labels: Dict[str, Any]) -> Tuple[str, ...]:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f"{self.name} takes labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _snapshot(self) -> List[Tuple[Tuple[str, ...], Any]]:
+        with self._lock:
+            return sorted(self._values.items())
+
+    def samples(self) -> Iterator[Tuple[str, str, float]]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """A count that only goes up, such as requests served or bytes written"""
+    type = 'counter'
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def samples(self) -> Iterator[Tuple[str, str, float]]:
+        for key, value in self._snapshot():
+            yield self.name, _format_labels(self.labelnames, key), value
+
+
+class Histogram(_Metric):
+    """Distribution of observed values over fixed buckets, with their sum and count"""
+    type = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = LATENCY_BUCKETS, registry: Optional[Registry] = REGISTRY):
+        super().__init__(name, documentation, labelnames, registry)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        # Counts per bucket are kept non-cumulative so an observation touches a single slot
+        idx = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            state[0][idx] += 1
+            state[1] += value
+            state[2] += 1
+
+    def count(self, **labels) -> int:
+        state = self._values.get(self._key(labels))
+        return state[2] if state is not None else 0
+
+    def sum(self, **labels) -> float:
+        state = self._values.get(self._key(labels))
+        return state[1] if state is not None else 0.0
+
+    def _snapshot(self) -> List[Tuple[Tuple[str, ...], Any]]:
+        with self._lock:
+            return sorted((key, (list(counts), total, count)) for key, (counts, total, count) in self._values.items())
+
+    def samples(self) -> Iterator[Tuple[str, str, float]]:
+        for key, (counts, total, count) in self._snapshot():
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += bucket_count
+                yield (f"{self.name}_bucket",
+                       _format_labels(self.labelnames, key, f'le="{_format_value(bound)}"'), cumulative)
+            yield f"{self.name}_sum", _format_labels(self.labelnames, key), total
+            yield f"{self.name}_count", _format_labels(self.labelnames, key), count
+
+
+REQUESTS = Counter('resume_requests_total', "Resume package requests by result (generated, cached, failed, rejected)",
+                   ['result'])
+RUNS = Counter('resume_assistant_runs_total', "Assistant runs by final status (completed, failed, timeout, error)",
+               ['status'])
+RUN_POLLS = Histogram('resume_assistant_run_polls', "Status checks made per polled assistant run",
+                      buckets=POLL_BUCKETS)
+INIT_RETRIES = Counter('resume_assistant_init_retries_total', "Retried attempts to initialize the assistant")
+RETRIES = Counter('resume_api_retries_total', "Retried assistant API calls by operation and reason (status or connection)",
+                  ['operation', 'reason'])
+RETRY_GIVE_UPS = Counter('resume_api_retry_give_ups_total',
+                         "Retryable API errors raised anyway, by limit reached (attempts, budget, deadline, retry_after)",
+                         ['reason'])
+JOBS_SUBMITTED = Counter('resume_jobs_submitted_total', "Background jobs submitted, by result (queued, coalesced)",
+                         ['result'])
+ADMISSION_WAIT = Histogram('resume_admission_wait_seconds', "Time runs waited for a slot and the rate limits")
+STAGE_SECONDS = Histogram('resume_stage_duration_seconds', "Latency of each traced pipeline stage", ['stage'])
+CACHE_LOOKUPS = Counter('resume_cache_lookups_total', "Cache lookups by cache and result (hit, miss)",
+                        ['cache', 'result'])
+EXPORTS = Counter('resume_exports_total', "Documents exported by renderer", ['renderer'])
+EXPORT_BYTES = Counter('resume_export_bytes_total', "Bytes of exported documents by renderer", ['renderer'])
+
+
+def record_lookup(cache: str, hit: bool) -> None:
+    CACHE_LOOKUPS.inc(cache=cache, result='hit' if hit else 'miss')
+
+
+def record_export(renderer: str, document: bytes) -> None:
+    EXPORTS.inc(renderer=renderer)
+    EXPORT_BYTES.inc(len(document), renderer=renderer)
+
+
+def _handler(registry: Registry):
+    from http.server import BaseHTTPRequestHandler
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+        def do_GET(self):
+            if self.path.split('?')[0] not in ('/', '/metrics'):
+                self.send_error(404)
+                return
+            body = registry.exposition().encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', CONTENT_TYPE)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    return MetricsHandler
+
+
+def start_http_server(port: int, addr: str = '127.0.0.1', registry: Registry = REGISTRY) -> "ThreadingHTTPServer":
+    """Serve ``registry`` at ``/metrics`` from a daemon thread"""
+    from http.server import ThreadingHTTPServer
+
+    server = ThreadingHTTPServer((addr, port), _handler(registry))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name='metrics-server', daemon=True).start()
+    logger.info(f"Serving metrics at http://{addr}:{server.server_port}/metrics")
+    return server
+
+
+def start_metrics_server(settings: Dict[str, Any] = METRICS) -> Optional["ThreadingHTTPServer"]:
+    """Start the endpoint described by METRICS, or return None when disabled or the port is taken"""
+    if not settings["enabled"]:
+        return None
+    try:
+        return start_http_server(settings["port"], settings["addr"])
+    except OSError as e:
+        logger.warning(f"Metrics endpoint not started on {settings['addr']}:{settings['port']}: {str(e)}")
+        return None
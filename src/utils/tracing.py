@@ -0,0 +1,284 @@
+import os
+import json
+import time
+import queue
+import logging
+import threading
+import contextvars
+from collections import deque
+from contextlib import contextmanager
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Union
+from .metrics import STAGE_SECONDS
+from ..config.settings import TRACING
+
+logger = logging.getLogger(__name__)
+
+_current_span: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar('current_span', default=None)
+
+
+def _random_id(n_bytes: int) -> str:
+    return os.urandom(n_bytes).hex()
+
+
+class Trace:
+    """The spans of one request, in the order they started"""
+
+    def __init__(self):
+        self.trace_id = _random_id(16)
+        self.spans: List["Span"] = []
+
+    def breakdown(self) -> List[Dict[str, Any]]:
+        """One row per span: indented name, start offset and duration in milliseconds"""
+        if not self.spans:
+            return []
+        origin = self.spans[0].start_ns
+        depths: Dict[str, int] = {}
+        rows = []
+        for span in self.spans:
+            depth = depths[span.span_id] = depths.get(span.parent_id, -1) + 1
+            rows.append({
+                "stage": "  " * depth + span.name,
+                "start_ms": round((span.start_ns - origin) / 1e6, 1),
+                "duration_ms": round(span.duration_ms, 1) if span.end_ns else None,
+                "status": span.status,
+            })
+        return rows
+
+
+class Span:
+    """A timed stage of a request, with attributes and timestamped events"""
+    __slots__ = ('name', 'trace', 'span_id', 'parent_id', 'start_ns', 'end_ns',
+                 'attributes', 'events', 'status', 'error')
+
+    def __init__(self, name: str, trace: Trace, parent_id: Optional[str], attributes: Dict[str, Any]):
+        self.name = name
+        self.trace = trace
+        self.span_id = _random_id(8)
+        self.parent_id = parent_id
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.attributes = attributes
+        self.events: List[tuple] = []
+        self.status = 'ok'
+        self.error: Optional[str] = None
+
+    @property
+    def duration_ms(self) -> float:
+        return ((self.end_ns or time.time_ns()) - self.start_ns) / 1e6
+
+    def set(self, **attributes) -> None:
+        self.attributes.update(attributes)
+
+    def add_event(self, name: str, **attributes) -> None:
+        self.events.append((time.time_ns(), name, attributes))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "trace_id": self.trace.trace_id, "span_id": self.span_id, "parent_id": self.parent_id,
+            "name": self.name, "start_unix_ns": self.start_ns, "end_unix_ns": self.end_ns,
+            "duration_ms": round(self.duration_ms, 3), "status": self.status, "error": self.error,
+            "attributes": self.attributes,
+            "events": [{"unix_ns": ts, "name": name, "attributes": attributes}
+                       for ts, name, attributes in self.events],
+        }
+
+
+class JsonlExporter:
+    """Appends every finished span to a JSONL file"""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def export(self, spans: Sequence[Span]) -> None:
+        with open(self.path, 'a', encoding='utf-8') as f:
+            for span in spans:
+                f.write(json.dumps(span.to_dict(), default=str) + '\n')
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_attributes(attributes: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [{"key": key, "value": _otlp_value(value)} for key, value in attributes.items()]
+
+
+class OTLPExporter:
+    """Posts spans to an OpenTelemetry collector over OTLP/HTTP with JSON encoding"""
+
+    def __init__(self, endpoint: str, service_name: str, timeout: float = 5.0):
+        import httpx
+
+        self.url = endpoint.rstrip('/') + '/v1/traces'
+        self.service_name = service_name
+        self._client = httpx.Client(timeout=timeout)
+
+    def payload(self, spans: Sequence[Span]) -> Dict[str, Any]:
+        return {"resourceSpans": [{
+            "resource": {"attributes": _otlp_attributes({"service.name": self.service_name})},
+            "scopeSpans": [{
+                "scope": {"name": __name__},
+                "spans": [{
+                    "traceId": span.trace.trace_id,
+                    "spanId": span.span_id,
+                    "parentSpanId": span.parent_id or "",
+                    "name": span.name,
+                    "kind": 1,  # internal
+                    "startTimeUnixNano": str(span.start_ns),
+                    "endTimeUnixNano": str(span.end_ns),
+                    "attributes": _otlp_attributes(span.attributes),
+                    "events": [{"timeUnixNano": str(ts), "name": name, "attributes": _otlp_attributes(attributes)}
+                               for ts, name, attributes in span.events],
+                    "status": {"code": 2, "message": span.error or ""} if span.status == 'error' else {"code": 1},
+                } for span in spans],
+            }],
+        }]}
+
+    def export(self, spans: Sequence[Span]) -> None:
+        self._client.post(self.url, json=self.payload(spans)).raise_for_status()
+
+
+class Tracer:
+    """Records nested spans per request and hands finished traces to exporters.
+
+    The current span is tracked in a context variable, so spans opened inside
+    another become its children. When the outermost span of a trace ends, the
+    trace is kept for ``recent`` and queued for the exporters, which run on a
+    background thread so exporting never adds to request latency.
+    """
+
+    def __init__(self, exporters: Sequence[Any] = (), keep: int = 20):
+        self.exporters = list(exporters)
+        self.recent: deque = deque(maxlen=keep)
+        self._queue: Optional[queue.Queue] = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, settings: Dict[str, Any] = TRACING) -> "Tracer":
+        """Build the tracer described by TRACING"""
+        exporters = []
+        if settings["exporter"] == "jsonl":
+            exporters.append(JsonlExporter(settings["jsonl_path"]))
+        elif settings["exporter"] == "otlp":
+            exporters.append(OTLPExporter(settings["otlp_endpoint"], settings["service_name"]))
+        elif settings["exporter"] != "none":
+            raise ValueError(f"Unknown trace exporter: {settings['exporter']}")
+        return cls(exporters)
+
+    @contextmanager
+    def span(self, name: str, **attributes) -> Iterator[Span]:
+        parent = _current_span.get()
+        trace = parent.trace if parent is not None else Trace()
+        span = Span(name, trace, parent.span_id if parent is not None else None, attributes)
+        trace.spans.append(span)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            if not isinstance(e, GeneratorExit):
+                span.status = 'error'
+                span.error = f"{type(e).__name__}: {str(e)}"
+            raise
+        finally:
+            span.end_ns = time.time_ns()
+            STAGE_SECONDS.observe((span.end_ns - span.start_ns) / 1e9, stage=name)
+            try:
+                _current_span.reset(token)
+            except ValueError:
+                # Ended from another context, e.g. a generator closed elsewhere
+                _current_span.set(parent)
+            if parent is None:
+                self._finish(trace)
+
+    def traced(self, name: str) -> Callable:
+        """Decorator running each call of a function in its own span"""
+        def decorator(func):
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.span(name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def _finish(self, trace: Trace) -> None:
+        self.recent.append(trace)
+        if not self.exporters:
+            return
+        with self._lock:
+            if self._queue is None:
+                self._queue = queue.Queue()
+                threading.Thread(target=self._export_loop, name='trace-exporter', daemon=True).start()
+        self._queue.put(trace)
+
+    def _export_loop(self) -> None:
+        while True:
+            trace = self._queue.get()
+            try:
+                for exporter in self.exporters:
+                    exporter.export(trace.spans)
+            except Exception as e:
+                logger.warning(f"Failed to export trace {trace.trace_id}: {str(e)}")
+            finally:
+                self._queue.task_done()
+
+    def flush(self) -> None:
+        """Wait until every finished trace has been exported"""
+        if self._queue is not None:
+            self._queue.join()
+
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+def add_event(name: str, **attributes) -> None:
+    """Record an event on the current span, if there is one"""
+    span = _current_span.get()
+    if span is not None:
+        span.add_event(name, **attributes)
+
+
+def set_attributes(**attributes) -> None:
+    """Set attributes on the current span, if there is one"""
+    span = _current_span.get()
+    if span is not None:
+        span.set(**attributes)
+
+
+_tracer: Optional[Tracer] = None
+_tracer_lock = threading.Lock()
+
+
+def get_tracer() -> Tracer:
+    """The process-wide tracer, built from TRACING on first use"""
+    global _tracer
+    if _tracer is None:
+        with _tracer_lock:
+            if _tracer is None:
+                _tracer = Tracer.from_settings()
+    return _tracer
+
+
+def span(name: str, **attributes):
+    """Open a span on the process-wide tracer"""
+    return get_tracer().span(name, **attributes)
+
+
+def traced(name: str) -> Callable:
+    """Decorator running each call in a span on the process-wide tracer"""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with get_tracer().span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
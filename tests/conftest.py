@@ -0,0 +1,68 @@
+import json
+import pytest
+from fake_assistants import FakeAssistantsServer
+from src.config import settings
+
+
+@pytest.fixture
+def sample_package():
+    return {
+        "cv": "# John Doe\n\nExperienced data analyst.",
+        "structured_cv": {
+            "name": "John Doe",
+            "contact": ["john.doe@email.com", "LinkedIn: /in/johndoe", "(123) 456-7890"],
+            "professional_summary": "Experienced data analyst with over 6 years of experience "
+                                    "turning data into business decisions.",
+            "work_experience": [
+                {
+                    "title": "Senior Data Analyst",
+                    "company": "Tech Corp",
+                    "dates": "2020-Present",
+                    "responsibilities": ["Led data analysis projects", "Developed dashboards"]
+                }
+            ],
+            "education": [
+                {
+                    "degree": "Master of Science in Data Analytics",
+                    "institution": "University Name",
+                    "dates": "2018-2020",
+                    "details": ["Specialized in machine learning", "GPA: 3.9/4.0"]
+                }
+            ],
+            "skills": {
+                "Technical": ["Python", "SQL", "Tableau"],
+                "Soft Skills": ["Leadership", "Communication"]
+            }
+        },
+        "cover_letter": "Dear Hiring Manager,\n\nI am excited to apply.",
+        "analysis": "Strong match for the role."
+    }
+
+
+@pytest.fixture
+def sample_input():
+    return {
+        "language": "English",
+        "job_name": "Data Analyst",
+        "job_description": "Analyze data and build dashboards for the business teams.",
+        "location": "Remote",
+        "employer_info": "A fast-growing analytics company with a remote-first culture.",
+        "resume_content": "# John Doe\n\nExperienced data analyst with over 6 years of experience."
+    }
+
+
+@pytest.fixture
+def fake_api(sample_package):
+    with FakeAssistantsServer(reply=json.dumps(sample_package)) as server:
+        yield server
+
+
+@pytest.fixture
+def fake_env(fake_api, monkeypatch):
+    """Point the OpenAI client used by AssistantManager at the fake API"""
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setenv("OPENAI_BASE_URL", fake_api.base_url)
+    monkeypatch.setenv("agent_id", "asst_test")
+    # Keep runs independent of the on-disk response cache under OUTPUT_DIR
+    monkeypatch.setitem(settings.RESPONSE_CACHE, "enabled", False)
+    return fake_api
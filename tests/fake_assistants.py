@@ -0,0 +1,340 @@
+"""Local fake of the OpenAI Assistants API with scriptable run timings"""
+import json
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+
+
+def _new_id(prefix: str) -> str:
+    return f"{prefix}_{uuid.uuid4().hex[:12]}"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def setup(self):
+        # One handler instance serves every request on a kept-alive connection
+        super().setup()
+        self.server.fake.open_connection()
+
+    # Plumbing -------------------------------------------------------------
+
+    def _read_body(self) -> Dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        return json.loads(self.rfile.read(length) or b"{}")
+
+    def _send_json(self, payload: Dict, status: int = 200, headers: Optional[Dict] = None):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_error(self, status: int, message: str, headers: Optional[Dict] = None):
+        self._send_json({"error": {"message": message, "type": "fake_error"}}, status, headers)
+
+    def _dispatch(self, method: str):
+        server = self.server.fake
+        path = self.path.split("?")[0]
+        body = self._read_body() if method == "POST" else {}
+        route = server.record(method, path)
+        fault = server.take_fault(route)
+        if fault is not None:
+            status, headers = fault
+            self._send_error(status, "injected fault", headers)
+            return
+        handler = getattr(self, f"_{method.lower()}_{route}", None)
+        if handler is None:
+            self._send_error(404, f"unknown route {method} {path}")
+            return
+        handler(path, body)
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_DELETE(self):
+        self._dispatch("DELETE")
+
+    # Routes ---------------------------------------------------------------
+
+    def _get_assistant(self, path, body):
+        assistant_id = path.rsplit("/", 1)[-1]
+        self._send_json({
+            "id": assistant_id, "object": "assistant", "created_at": 0,
+            "name": "Fake Resume Assistant", "model": self.server.fake.model,
+            "instructions": "", "tools": [], "metadata": {},
+        })
+
+    def _post_threads(self, path, body):
+        self._send_json(self.server.fake.create_thread())
+
+    def _delete_thread(self, path, body):
+        thread_id = path.rsplit("/", 1)[-1]
+        self.server.fake.delete_thread(thread_id)
+        self._send_json({"id": thread_id, "object": "thread.deleted", "deleted": True})
+
+    def _post_messages(self, path, body):
+        fake = self.server.fake
+        thread_id = path.split("/")[2]
+        content = body.get("content", "")
+        if not isinstance(content, str):
+            content = json.dumps(content)
+        self._send_json(fake.add_message(thread_id, "user", content))
+
+    def _get_messages(self, path, body):
+        thread_id = path.split("/")[2]
+        messages = list(reversed(self.server.fake.threads.get(thread_id, [])))
+        self._send_json({
+            "object": "list", "data": messages,
+            "first_id": messages[0]["id"] if messages else None,
+            "last_id": messages[-1]["id"] if messages else None,
+            "has_more": False,
+        })
+
+    def _post_runs(self, path, body):
+        fake = self.server.fake
+        thread_id = path.split("/")[2]
+        run = fake.create_run(thread_id, body.get("assistant_id"))
+        if body.get("stream"):
+            if not fake.streaming:
+                self._send_error(400, "Streaming is not supported")
+                return
+            self._stream_run(run)
+            return
+        self._send_json(fake.run_payload(run))
+
+    def _get_run(self, path, body):
+        fake = self.server.fake
+        run_id = path.rsplit("/", 1)[-1]
+        run = fake.runs.get(run_id)
+        if run is None:
+            self._send_error(404, f"No run found with id '{run_id}'")
+            return
+        self._send_json(fake.run_payload(run))
+
+    def _stream_run(self, run: Dict):
+        fake = self.server.fake
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+
+        def emit(event: str, data):
+            payload = data if isinstance(data, str) else json.dumps(data)
+            self.wfile.write(f"event: {event}\ndata: {payload}\n\n".encode())
+            self.wfile.flush()
+
+        try:
+            for event, data in fake.stream_events(run):
+                if event == "sleep":
+                    time.sleep(data)
+                    continue
+                emit(event, data)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 512
+
+
+_ROUTES = [
+    ("GET", re.compile(r"^/assistants/[^/]+$"), "assistant"),
+    ("POST", re.compile(r"^/threads$"), "threads"),
+    ("DELETE", re.compile(r"^/threads/[^/]+$"), "thread"),
+    ("POST", re.compile(r"^/threads/[^/]+/messages$"), "messages"),
+    ("GET", re.compile(r"^/threads/[^/]+/messages$"), "messages"),
+    ("POST", re.compile(r"^/threads/[^/]+/runs$"), "runs"),
+    ("GET", re.compile(r"^/threads/[^/]+/runs/[^/]+$"), "run"),
+]
+
+
+class FakeAssistantsServer:
+    """Threaded HTTP server that scripts Assistants API runs.
+
+    Attributes that can be changed between requests:
+
+    - ``reply``: text of the assistant message produced by every run
+    - ``run_duration``: seconds a run stays ``in_progress`` before finishing
+    - ``run_status``: terminal status of runs (``completed`` or ``failed``)
+    - ``streaming``: whether ``stream=True`` run creation is supported
+    - ``chunk_size`` / ``chunk_delay``: how streamed replies are split
+    """
+
+    def __init__(self, reply: str = "{}", run_duration: float = 0.0,
+                 run_status: str = "completed", streaming: bool = True,
+                 chunk_size: int = 0, chunk_delay: float = 0.0,
+                 model: str = "gpt-4o"):
+        self.reply = reply
+        self.run_duration = run_duration
+        self.run_status = run_status
+        self.streaming = streaming
+        self.chunk_size = chunk_size
+        self.chunk_delay = chunk_delay
+        self.model = model
+        self.threads: Dict[str, List[Dict]] = {}
+        self.deleted_threads: List[str] = []
+        self.runs: Dict[str, Dict] = {}
+        self.requests: List[tuple] = []
+        self.faults: Dict[str, List[tuple]] = {}
+        self.connections = 0
+        self._lock = threading.Lock()
+        self._httpd = _Server(("127.0.0.1", 0), _Handler)
+        self._httpd.fake = self
+        self._thread = threading.Thread(target=self._httpd.serve_forever,
+                                        kwargs={"poll_interval": 0.05}, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeAssistantsServer":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    # Bookkeeping ------------------------------------------------------------
+
+    def record(self, method: str, path: str) -> Optional[str]:
+        for route_method, pattern, name in _ROUTES:
+            if route_method == method and pattern.match(path):
+                with self._lock:
+                    self.requests.append((method, name))
+                return name
+        return None
+
+    def open_connection(self) -> None:
+        with self._lock:
+            self.connections += 1
+
+    def count(self, method: str, route: str) -> int:
+        with self._lock:
+            return sum(1 for request in self.requests if request == (method, route))
+
+    def inject_fault(self, route: str, status: int, times: int = 1,
+                     headers: Optional[Dict] = None) -> None:
+        """Fail the next ``times`` requests to ``route`` with ``status``"""
+        with self._lock:
+            self.faults.setdefault(route, []).extend([(status, headers or {})] * times)
+
+    def take_fault(self, route: Optional[str]) -> Optional[tuple]:
+        with self._lock:
+            pending = self.faults.get(route)
+            return pending.pop(0) if pending else None
+
+    # Object factories -------------------------------------------------------
+
+    def create_thread(self) -> Dict:
+        thread_id = _new_id("thread")
+        with self._lock:
+            self.threads[thread_id] = []
+        return {"id": thread_id, "object": "thread", "created_at": int(time.time()),
+                "metadata": {}, "tool_resources": None}
+
+    def delete_thread(self, thread_id: str) -> None:
+        with self._lock:
+            self.threads.pop(thread_id, None)
+            self.deleted_threads.append(thread_id)
+
+    def add_message(self, thread_id: str, role: str, text: str, run_id: Optional[str] = None) -> Dict:
+        message = {
+            "id": _new_id("msg"), "object": "thread.message", "created_at": int(time.time()),
+            "thread_id": thread_id, "role": role, "run_id": run_id,
+            "assistant_id": None, "attachments": [], "metadata": {},
+            "status": "completed", "completed_at": None, "incomplete_at": None,
+            "incomplete_details": None,
+            "content": [{"type": "text", "text": {"value": text, "annotations": []}}],
+        }
+        with self._lock:
+            self.threads.setdefault(thread_id, []).append(message)
+        return message
+
+    def create_run(self, thread_id: str, assistant_id: str) -> Dict:
+        run = {"id": _new_id("run"), "thread_id": thread_id, "assistant_id": assistant_id,
+               "started": time.monotonic(), "reply": self.reply,
+               "duration": self.run_duration, "final_status": self.run_status,
+               "finished": False}
+        with self._lock:
+            self.runs[run["id"]] = run
+        return run
+
+    def _finish(self, run: Dict) -> None:
+        with self._lock:
+            if run["finished"]:
+                return
+            run["finished"] = True
+        if run["final_status"] == "completed":
+            self.add_message(run["thread_id"], "assistant", run["reply"], run["id"])
+
+    def run_payload(self, run: Dict, status: Optional[str] = None) -> Dict:
+        if status is None:
+            elapsed = time.monotonic() - run["started"]
+            if elapsed >= run["duration"]:
+                self._finish(run)
+                status = run["final_status"]
+            else:
+                status = "in_progress"
+        last_error = None
+        if status == "failed":
+            last_error = {"code": "server_error", "message": "Scripted failure"}
+        return {"id": run["id"], "object": "thread.run", "created_at": 0,
+                "thread_id": run["thread_id"], "assistant_id": run["assistant_id"],
+                "status": status, "last_error": last_error, "model": self.model,
+                "instructions": "", "tools": [], "metadata": {}}
+
+    def stream_events(self, run: Dict):
+        """Yield ``(event, data)`` pairs for a streamed run, with ``sleep`` pauses"""
+        yield "thread.run.created", self.run_payload(run, "queued")
+        yield "thread.run.in_progress", self.run_payload(run, "in_progress")
+        if run["final_status"] != "completed":
+            yield "sleep", run["duration"]
+            self._finish(run)
+            yield f"thread.run.{run['final_status']}", self.run_payload(run, run["final_status"])
+            yield "done", "[DONE]"
+            return
+        message_id = _new_id("msg")
+        yield "thread.message.created", {"id": message_id, "object": "thread.message",
+                                         "thread_id": run["thread_id"], "role": "assistant",
+                                         "status": "in_progress", "content": []}
+        reply = run["reply"]
+        size = self.chunk_size or len(reply) or 1
+        chunks = [reply[i:i + size] for i in range(0, len(reply), size)] or [""]
+        pause = self.chunk_delay if self.chunk_size else run["duration"]
+        for chunk in chunks:
+            yield "sleep", pause
+            yield "thread.message.delta", {
+                "id": message_id, "object": "thread.message.delta",
+                "delta": {"content": [{"index": 0, "type": "text",
+                                       "text": {"value": chunk, "annotations": []}}]},
+            }
+        self._finish(run)
+        message = self.threads[run["thread_id"]][-1]
+        yield "thread.message.completed", dict(message, id=message_id)
+        yield "thread.run.completed", self.run_payload(run, "completed")
+        yield "done", "[DONE]"
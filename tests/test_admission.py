@@ -0,0 +1,126 @@
+import threading
+import time
+import pytest
+from assistant_manager import AssistantManager
+from src.config import settings
+from src.core.admission import AdmissionController, AdmissionQueue, AdmissionRejected, QueueStatus
+from src.core.providers import StubProvider
+from src.core.rate_limit import RateLimiter, TokenBucket
+from src.utils import metrics
+
+
+def hold_slot(queue):
+    """Occupy one of the queue's slots from another thread until released"""
+    admitted, release = threading.Event(), threading.Event()
+
+    def run():
+        with queue.admit():
+            admitted.set()
+            release.wait(5)
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    admitted.wait(5)
+    return release, thread
+
+
+def test_waiters_see_their_place_and_wait():
+    queue = AdmissionQueue(max_concurrent=1, max_queued=4, expected_run_seconds=10)
+    release, holder = hold_slot(queue)
+    reports = {"second": [], "third": []}
+
+    def wait_in_line(name):
+        with queue.admit(reports[name].append):
+            pass
+
+    second = threading.Thread(target=wait_in_line, args=("second",))
+    second.start()
+    while queue.stats()["queued"] < 1:
+        time.sleep(0.01)
+    third = threading.Thread(target=wait_in_line, args=("third",))
+    third.start()
+    while queue.stats()["queued"] < 2:
+        time.sleep(0.01)
+    release.set()
+    for thread in (holder, second, third):
+        thread.join(5)
+
+    assert reports["second"] == [QueueStatus(1, 10)]
+    assert reports["third"][0] == QueueStatus(2, 20)
+    assert queue.stats() == {"active": 0, "queued": 0, "run_seconds": pytest.approx(queue.run_seconds)}
+    assert queue.run_seconds < 10
+
+
+def test_full_queue_turns_requests_away():
+    queue = AdmissionQueue(max_concurrent=1, max_queued=0)
+    release, holder = hold_slot(queue)
+    try:
+        with pytest.raises(AdmissionRejected):
+            with queue.admit():
+                pass
+    finally:
+        release.set()
+        holder.join(5)
+    with queue.admit():
+        assert queue.stats()["active"] == 1
+
+
+def test_abandoned_waiter_leaves_the_line():
+    queue = AdmissionQueue(max_concurrent=1, max_queued=4)
+    release, holder = hold_slot(queue)
+
+    def leave(status):
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        with queue.admit(leave):
+            pass
+    assert queue.stats()["queued"] == 0
+    release.set()
+    holder.join(5)
+
+
+def test_rate_limit_holds_admitted_runs():
+    sleeps, reports = [], []
+    limiter = RateLimiter(requests=TokenBucket(per_minute=60, capacity=1))
+    controller = AdmissionController(AdmissionQueue(), limiter, sleep=sleeps.append)
+
+    with controller.admit("first", reports.append):
+        pass
+    with controller.admit("second", reports.append):
+        pass
+
+    assert sleeps == [pytest.approx(1, abs=0.05)]
+    assert reports == [QueueStatus(0, sleeps[0]), QueueStatus(0, 0.0)]
+
+
+def test_manager_admits_runs_in_order(monkeypatch, sample_input):
+    monkeypatch.setitem(settings.RESPONSE_CACHE, "enabled", False)
+    controller = AdmissionController(AdmissionQueue(max_concurrent=1, max_queued=1, expected_run_seconds=0.2))
+    manager = AssistantManager(provider=StubProvider(latency=0.2), admission=controller)
+    reports, errors = [], []
+    rejected = metrics.REQUESTS.value(result="rejected")
+
+    def generate(job):
+        try:
+            manager.generate_resume_package(dict(sample_input, job_name=job), on_wait=reports.append)
+        except AdmissionRejected as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=generate, args=(f"Job {i}",)) for i in range(3)]
+    for thread in threads:
+        thread.start()
+        time.sleep(0.05)
+    for thread in threads:
+        thread.join(5)
+
+    assert reports == [QueueStatus(1, pytest.approx(0.2)), QueueStatus(0, 0.0)]
+    assert len(errors) == 1
+    assert metrics.REQUESTS.value(result="rejected") == rejected + 1
+
+
+def test_only_rate_limited_providers_are_admitted(fake_env):
+    assert AssistantManager(provider=StubProvider()).admission is None
+    manager = AssistantManager()
+    assert isinstance(manager.admission, AdmissionController)
+    manager.close()
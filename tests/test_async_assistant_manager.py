@@ -0,0 +1,40 @@
+import asyncio
+import time
+import pytest
+from assistant_manager import AsyncAssistantManager
+
+
+def test_generates_package(fake_env, sample_input, sample_package):
+    async def run():
+        async with AsyncAssistantManager() as manager:
+            return await manager.generate_resume_package(sample_input)
+
+    assert asyncio.run(run()) == sample_package
+
+
+def test_runs_concurrently_under_limit(fake_env, sample_input, sample_package):
+    fake_env.run_duration = 0.3
+
+    async def run():
+        async with AsyncAssistantManager(max_concurrency=10) as manager:
+            jobs = [manager.generate_resume_package(sample_input) for _ in range(20)]
+            return await asyncio.gather(*jobs)
+
+    start = time.monotonic()
+    results = asyncio.run(run())
+    elapsed = time.monotonic() - start
+
+    assert results == [sample_package] * 20
+    # Two waves of ten runs, far below twenty sequential runs
+    assert 0.6 <= elapsed < 3.0
+
+
+def test_failed_run_raises(fake_env, sample_input):
+    fake_env.run_status = "failed"
+
+    async def run():
+        async with AsyncAssistantManager() as manager:
+            await manager.generate_resume_package(sample_input)
+
+    with pytest.raises(Exception, match="Assistant run failed"):
+        asyncio.run(run())
@@ -0,0 +1,92 @@
+import csv
+import io
+import json
+import pytest
+from assistant_manager import AssistantManager
+from batch import main, read_postings, run_batch
+from src.config import settings
+from src.core.admission import AdmissionController, AdmissionQueue
+from src.core.providers import StubProvider
+
+
+@pytest.fixture
+def postings_file(tmp_path, sample_input):
+    path = tmp_path / "postings.jsonl"
+    with open(path, "w") as f:
+        for idx in range(3):
+            posting = {key: sample_input[key] for key in
+                       ("job_name", "job_description", "location", "employer_info", "language")}
+            posting["job_name"] = f"Data Analyst {idx}"
+            f.write(json.dumps(posting) + "\n")
+    return path
+
+
+def test_read_postings_csv_defaults(tmp_path):
+    path = tmp_path / "postings.csv"
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=["job_name", "job_description", "employer_info"])
+        writer.writeheader()
+        writer.writerow({"job_name": "Analyst", "job_description": "Analyze",
+                         "employer_info": "Acme"})
+
+    [posting] = read_postings(path)
+    assert posting["location"] == "Remote"
+    assert posting["language"] == "English"
+    assert len(posting["id"]) == 16
+
+
+def test_read_postings_rejects_incomplete_rows(tmp_path):
+    path = tmp_path / "postings.jsonl"
+    path.write_text(json.dumps({"job_name": "Analyst"}) + "\n")
+    with pytest.raises(ValueError, match="Posting 1 is missing"):
+        read_postings(path)
+
+
+def test_batch_writes_artifacts_and_resumes(fake_env, postings_file, tmp_path, sample_package):
+    output_dir = tmp_path / "out"
+    resume = tmp_path / "resume.md"
+    resume.write_text("# John Doe\n\nExperienced data analyst.")
+
+    assert main([str(postings_file), "--resume", str(resume),
+                 "--output-dir", str(output_dir), "--workers", "2"]) == 0
+
+    job_dirs = sorted(path for path in output_dir.iterdir() if path.is_dir())
+    assert len(job_dirs) == 3
+    for job_dir in job_dirs:
+        assert json.loads((job_dir / "package.json").read_text()) == sample_package
+        assert (job_dir / "resume.pdf").stat().st_size > 0
+        assert (job_dir / "resume.docx").stat().st_size > 0
+    assert fake_env.count("POST", "messages") == 3
+
+    out = io.StringIO()
+    summary = run_batch(read_postings(postings_file), "resume", output_dir, out=out)
+    assert summary == {"completed": 0, "failed": 0, "skipped": 3}
+    assert fake_env.count("POST", "messages") == 3
+
+
+def test_failed_postings_are_retried(fake_env, postings_file, tmp_path):
+    output_dir = tmp_path / "out"
+    fake_env.run_status = "failed"
+    out = io.StringIO()
+
+    summary = run_batch(read_postings(postings_file), "resume", output_dir, out=out)
+    assert summary["failed"] == 3
+    assert "FAILED" in out.getvalue()
+
+    fake_env.run_status = "completed"
+    summary = run_batch(read_postings(postings_file), "resume", output_dir, out=out)
+    assert summary == {"completed": 3, "failed": 0, "skipped": 0}
+    assert "jobs/s" in out.getvalue()
+
+
+def test_workers_are_capped_at_admission_capacity(postings_file, tmp_path, monkeypatch):
+    monkeypatch.setitem(settings.RESPONSE_CACHE, "enabled", False)
+    controller = AdmissionController(AdmissionQueue(max_concurrent=1, max_queued=1))
+    assistant = AssistantManager(provider=StubProvider(latency=0.2), admission=controller)
+    out = io.StringIO()
+
+    summary = run_batch(read_postings(postings_file), "resume", tmp_path / "out", workers=8,
+                        assistant=assistant, out=out)
+
+    assert summary == {"completed": 3, "failed": 0, "skipped": 0}
+    assert "Limiting to 2 workers" in out.getvalue()
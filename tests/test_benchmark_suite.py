@@ -0,0 +1,31 @@
+import io
+import json
+import pytest
+from benchmarks import suite
+from benchmarks.synthetic_cv import make_package
+from src.core.response_parser import validate_resume_package
+
+
+@pytest.mark.parametrize("jobs", [1, 50])
+def test_synthetic_packages_are_valid(jobs):
+    package = make_package(jobs=jobs)
+    assert validate_resume_package(package) is package
+    assert len(package["structured_cv"]["work_experience"]) == jobs
+
+
+def test_every_scenario_runs_and_compares(tmp_path, monkeypatch):
+    monkeypatch.setitem(suite.settings.RESPONSE_CACHE, "enabled", False)
+    results = suite.run_suite(sorted(suite.GROUPS), [1], min_time=0.001, rounds=2, out=io.StringIO())
+
+    measured = [row for row in results["results"] if "stats" in row]
+    assert {row["group"] for row in results["results"]} == {"ingestion", "generation", "validation", "export"}
+    assert all(row["stats"]["median"] > 0 and row["stats"]["rounds"] == 2 for row in measured)
+    assert all("skipped" in row or "stats" in row for row in results["results"])
+
+    baseline = tmp_path / "baseline.json"
+    for row in measured:
+        row["stats"] = dict(row["stats"], median=row["stats"]["median"] / 2)
+    baseline.write_text(json.dumps(results))
+    for row in measured:
+        row["stats"]["median"] *= 2
+    assert suite.compare(results, baseline, threshold=0.5) == len(measured)
@@ -0,0 +1,63 @@
+import zipfile
+import pytest
+from src.exporters.bulk_renderer import (
+    CallbackSink, DirectorySink, RenderJob, ZipSink, render_many)
+
+
+@pytest.fixture
+def jobs(sample_package):
+    cv = sample_package["structured_cv"]
+    return [RenderJob(f"candidate_{idx}", cv, "English" if idx % 2 else "Spanish") for idx in range(6)]
+
+
+def test_in_process_render_streams_to_callback(jobs):
+    received = {}
+    report = render_many(iter(jobs), CallbackSink(received.__setitem__), workers=0)
+
+    assert report.documents == 6
+    assert report.failed == []
+    assert sorted(received) == [job.name for job in jobs]
+    assert all(data.startswith(b"%PDF-") for data in received.values())
+    assert report.docs_per_sec > 0
+    assert report.peak_rss_bytes > 0
+
+
+def test_worker_pool_writes_zip(jobs, tmp_path):
+    report = render_many(jobs, ZipSink(tmp_path / "resumes.zip"), workers=2, chunksize=1)
+
+    assert report.documents == 6
+    with zipfile.ZipFile(tmp_path / "resumes.zip") as archive:
+        assert sorted(archive.namelist()) == sorted(f"{job.name}.pdf" for job in jobs)
+        assert archive.read("candidate_3.pdf").startswith(b"%PDF-")
+    assert "docs/s" in report.summary()
+
+
+def test_failures_are_reported_per_document(jobs, tmp_path):
+    broken = RenderJob("broken", {"name": "Missing sections"})
+    report = render_many([jobs[0], broken, ("tuple job", jobs[1].structured_cv)],
+                         DirectorySink(tmp_path), workers=0)
+
+    assert report.documents == 2
+    assert [name for name, _ in report.failed] == ["broken"]
+    assert report.failed[0][1].startswith("KeyError")
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["candidate_0.pdf", "tuple job.pdf"]
+
+
+def test_directory_sink_sanitizes_names(tmp_path, sample_package):
+    render_many([RenderJob("../escape/attempt", sample_package["structured_cv"])],
+                DirectorySink(tmp_path / "out"), workers=0)
+
+    assert [path.name for path in (tmp_path / "out").iterdir()] == ["attempt.pdf"]
+
+
+def test_sinks_keep_documents_whose_names_collide(tmp_path, sample_package):
+    cv = sample_package["structured_cv"]
+    jobs = [RenderJob("a/resume", cv), RenderJob("b/resume", cv), RenderJob("RESUME.pdf", cv)]
+
+    render_many(jobs, DirectorySink(tmp_path / "out"), workers=0)
+    render_many(jobs, ZipSink(tmp_path / "resumes.zip"), workers=0)
+
+    expected = ["RESUME-3.pdf", "resume-2.pdf", "resume.pdf"]
+    assert sorted(path.name for path in (tmp_path / "out").iterdir()) == expected
+    with zipfile.ZipFile(tmp_path / "resumes.zip") as archive:
+        assert sorted(archive.namelist()) == expected
@@ -0,0 +1,106 @@
+import time
+import pytest
+from src.utils.cache import LRUCache, SQLiteCache, TieredCache, canonical_hash
+from src.core.response_cache import ResponseCache
+from assistant_manager import AssistantManager
+
+
+def test_canonical_hash_ignores_key_order():
+    assert canonical_hash({"a": 1, "b": [1, 2]}) == canonical_hash({"b": [1, 2], "a": 1})
+    assert canonical_hash({"a": 1}) != canonical_hash({"a": 2})
+
+
+def test_lru_evicts_least_recently_used():
+    cache = LRUCache(max_entries=2)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    cache.get("a")
+    cache.set("c", "3")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+    assert cache.stats.evictions == 1
+
+
+def test_lru_respects_byte_budget():
+    cache = LRUCache(max_entries=10, max_bytes=10)
+    cache.set("a", b"12345")
+    cache.set("b", b"12345")
+    cache.set("c", b"123")
+
+    assert cache.get("a") is None
+    assert cache.size_bytes == 8
+    cache.set("huge", b"x" * 11)
+    assert cache.get("huge") is None
+
+
+def test_lru_ttl_expiry():
+    cache = LRUCache(ttl=0.05)
+    cache.set("a", "1")
+    assert cache.get("a") == "1"
+    time.sleep(0.1)
+    assert cache.get("a") is None
+
+
+def test_sqlite_round_trip_and_eviction(tmp_path):
+    cache = SQLiteCache(tmp_path / "cache.sqlite3", max_entries=2)
+    cache.set("text", "héllo")
+    cache.set("blob", b"\x00\x01")
+    assert cache.get("blob") == b"\x00\x01"
+    assert cache.get("text") == "héllo"
+
+    cache.set("third", "3")
+    assert len(cache) == 2
+    assert cache.get("blob") is None
+
+
+def test_sqlite_ttl_expiry(tmp_path):
+    cache = SQLiteCache(tmp_path / "cache.sqlite3", ttl=0.05)
+    cache.set("a", "1")
+    time.sleep(0.1)
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_tiered_cache_promotes_disk_hits(tmp_path):
+    disk = SQLiteCache(tmp_path / "cache.sqlite3")
+    TieredCache(LRUCache(), disk).set("k", "v")
+
+    fresh = TieredCache(LRUCache(), disk)
+    assert fresh.get("k") == "v"
+    assert fresh.get("k") == "v"
+    assert fresh.get("missing") is None
+
+    stats = fresh.stats()
+    assert (stats["hits"], stats["misses"]) == (2, 1)
+    assert stats["disk"]["hits"] == 1
+    assert stats["memory"]["hits"] == 1
+
+
+def test_manager_serves_repeat_requests_from_cache(fake_env, tmp_path, sample_input, sample_package):
+    manager = AssistantManager()
+    manager.response_cache = ResponseCache(
+        TieredCache(LRUCache(), SQLiteCache(tmp_path / "responses.sqlite3")))
+
+    first = manager.generate_resume_package(sample_input)
+    first['structured_cv']['name'] = "Edited In Place"
+    second = manager.generate_resume_package(dict(reversed(list(sample_input.items()))))
+
+    assert second == sample_package
+    assert fake_env.count("POST", "messages") == 1
+    assert manager.response_cache.stats()["hits"] == 1
+
+    changed = dict(sample_input, job_name="Senior Data Analyst")
+    manager.generate_resume_package(changed)
+    assert fake_env.count("POST", "messages") == 2
+
+
+def test_invalid_responses_are_not_cached(fake_env, sample_input):
+    fake_env.reply = '{"cv": "only"}'
+    manager = AssistantManager()
+    manager.response_cache = ResponseCache(TieredCache(LRUCache()))
+
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            manager.generate_resume_package(sample_input)
+    assert fake_env.count("POST", "messages") == 2
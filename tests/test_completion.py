@@ -0,0 +1,97 @@
+import json
+import time
+import pytest
+from openai import OpenAI
+from src.core.completion import PollBackoff, RunFailedError, complete_run, poll_run
+from assistant_manager import AssistantManager
+
+
+@pytest.fixture
+def client(fake_api):
+    return OpenAI(api_key="test-key", base_url=fake_api.base_url, max_retries=0)
+
+
+def test_backoff_grows_to_cap():
+    intervals = PollBackoff(initial=0.1, maximum=0.5, factor=2)
+    iterator = iter(intervals)
+    assert [next(iterator) for _ in range(5)] == [0.1, 0.2, 0.4, 0.5, 0.5]
+
+
+def test_streamed_run_returns_final_message(client, fake_api, sample_package):
+    fake_api.run_duration = 0.3
+    thread = client.beta.threads.create()
+
+    reply = complete_run(client, thread.id, "asst_test", stream=True)
+
+    assert json.loads(reply) == sample_package
+    assert fake_api.count("GET", "run") == 0
+    assert fake_api.count("GET", "messages") == 0
+
+
+def test_streamed_run_returns_without_poll_latency(client, fake_api):
+    fake_api.run_duration = 0.2
+    thread = client.beta.threads.create()
+
+    start = time.monotonic()
+    complete_run(client, thread.id, "asst_test", stream=True)
+    assert time.monotonic() - start < 0.9
+
+
+def test_falls_back_to_polling_without_streaming(client, fake_api, sample_package):
+    fake_api.streaming = False
+    fake_api.run_duration = 0.3
+    thread = client.beta.threads.create()
+
+    reply = complete_run(client, thread.id, "asst_test", stream=True,
+                         backoff=PollBackoff(initial=0.05, maximum=0.2))
+
+    assert json.loads(reply) == sample_package
+    assert fake_api.count("POST", "runs") == 2
+    assert 1 < fake_api.count("GET", "run") < 10
+
+
+def test_poll_run_uses_adaptive_intervals(client, fake_api):
+    fake_api.run_duration = 0.5
+    thread = client.beta.threads.create()
+    run = client.beta.threads.runs.create(thread_id=thread.id, assistant_id="asst_test")
+    sleeps = []
+
+    def record_sleep(seconds):
+        sleeps.append(seconds)
+        time.sleep(seconds)
+
+    poll_run(client, thread.id, run.id, backoff=PollBackoff(initial=0.05, maximum=0.2),
+             sleep=record_sleep)
+
+    assert sleeps[0] == 0.05
+    assert sleeps == sorted(sleeps)
+    assert max(sleeps) <= 0.2
+
+
+@pytest.mark.parametrize("streaming", [True, False])
+def test_failed_run_raises(client, fake_api, streaming):
+    fake_api.streaming = streaming
+    fake_api.run_status = "failed"
+    thread = client.beta.threads.create()
+
+    with pytest.raises(RunFailedError, match="Scripted failure"):
+        complete_run(client, thread.id, "asst_test",
+                     backoff=PollBackoff(initial=0.01, maximum=0.05))
+
+
+def test_poll_timeout(client, fake_api):
+    fake_api.streaming = False
+    fake_api.run_duration = 5
+    thread = client.beta.threads.create()
+
+    with pytest.raises(TimeoutError):
+        complete_run(client, thread.id, "asst_test", timeout=0.3,
+                     backoff=PollBackoff(initial=0.05, maximum=0.1))
+
+
+def test_assistant_manager_generates_package(fake_env, sample_input, sample_package):
+    fake_env.run_duration = 0.1
+    manager = AssistantManager()
+
+    assert manager.generate_resume_package(sample_input) == sample_package
+    assert fake_env.count("GET", "run") == 0
@@ -0,0 +1,67 @@
+import copy
+import pytest
+from benchmarks.bench_cv_markdown import legacy_format_cv_from_structure
+from benchmarks.synthetic_cv import make_structured_cv
+from src.exporters.cv_markdown import CVMarkdownRenderer
+
+
+@pytest.fixture
+def cv():
+    return make_structured_cv(jobs=6, responsibilities=3, skills=12, education=2)
+
+
+@pytest.mark.parametrize("jobs,skills,education", [(0, 0, 0), (1, 4, 1), (12, 60, 3)])
+def test_output_matches_concatenation(jobs, skills, education):
+    cv = make_structured_cv(jobs=jobs, skills=skills, education=education)
+    assert CVMarkdownRenderer().render(cv) == legacy_format_cv_from_structure(cv)
+
+
+def test_sample_package_matches(sample_package):
+    cv = sample_package["structured_cv"]
+    assert CVMarkdownRenderer().render(cv) == legacy_format_cv_from_structure(cv)
+
+
+def test_non_string_items_render_like_concatenation(cv):
+    cv['contact'].append({"linkedin": "jordan"})
+    cv['work_experience'][0]['responsibilities'].append(["nested", "list"])
+    cv['education'][0]['details'].append(None)
+    cv['skills']['Tools'].append({"name": "Docker"})
+
+    assert CVMarkdownRenderer().render(cv) == legacy_format_cv_from_structure(cv)
+
+
+def test_only_dirty_sections_are_rendered(cv):
+    renderer = CVMarkdownRenderer()
+    renderer.render(cv)
+    sections = renderer.rendered
+
+    assert renderer.render(cv) == legacy_format_cv_from_structure(cv)
+    assert renderer.rendered == sections
+
+    cv['work_experience'][2]['responsibilities'][0] = "Rewrote the billing service"
+    cv['skills']['Tools'].append("Kubernetes")
+    cv['name'] = "Jordan Renamed"
+    assert renderer.render(cv) == legacy_format_cv_from_structure(cv)
+    assert renderer.rendered == sections + 2
+
+
+def test_inserting_and_deleting_entries_keeps_neighbours_cached(cv):
+    renderer = CVMarkdownRenderer()
+    renderer.render(cv)
+    sections = renderer.rendered
+
+    cv['work_experience'].insert(0, copy.deepcopy(cv['work_experience'][3]))
+    cv['work_experience'][0]['title'] = "New Position"
+    del cv['education'][0]
+    assert renderer.render(cv) == legacy_format_cv_from_structure(cv)
+    assert renderer.rendered == sections + 1
+
+
+def test_removed_sections_are_evicted(cv):
+    renderer = CVMarkdownRenderer()
+    renderer.render(cv)
+    cv['work_experience'] = cv['work_experience'][:1]
+    del cv['skills']['Tools']
+    renderer.render(cv)
+
+    assert len(renderer._sections) == 2 + 1 + len(cv['education']) + len(cv['skills'])
@@ -0,0 +1,70 @@
+import pytest
+from src.core.document_converter import DocumentConverter
+from src.utils.cache import LRUCache, SQLiteCache, TieredCache
+
+
+class RecordingMarkItDown:
+    """Stands in for MarkItDown, recording each stream it is asked to convert"""
+
+    def __init__(self, text="# Converted"):
+        self.text = text
+        self.calls = []
+
+    def convert_stream(self, stream, file_extension=None):
+        self.calls.append((stream.read(), file_extension))
+        return type("Result", (), {"text_content": self.text})()
+
+
+def make_converter(tmp_path, markitdown, disk=True):
+    disk_tier = SQLiteCache(tmp_path / "conversions.sqlite3") if disk else None
+    return DocumentConverter(TieredCache(LRUCache(max_entries=4), disk_tier), markitdown=markitdown)
+
+
+def test_converts_from_memory_stream(tmp_path):
+    markitdown = RecordingMarkItDown()
+    converter = make_converter(tmp_path, markitdown)
+
+    assert converter.convert(b"%PDF-1.4 one", '.pdf') == "# Converted"
+    assert markitdown.calls == [(b"%PDF-1.4 one", '.pdf')]
+
+
+def test_same_bytes_convert_once(tmp_path):
+    markitdown = RecordingMarkItDown()
+    converter = make_converter(tmp_path, markitdown)
+
+    for _ in range(5):
+        converter.convert(b"%PDF-1.4 one", '.pdf')
+    converter.convert(b"%PDF-1.4 two", '.pdf')
+
+    assert len(markitdown.calls) == 2
+    assert converter.stats()["hits"] == 4
+
+
+def test_disk_tier_survives_new_converter(tmp_path):
+    first = RecordingMarkItDown()
+    make_converter(tmp_path, first).convert(b"%PDF-1.4 one", '.pdf')
+
+    second = RecordingMarkItDown(text="# Should not be used")
+    assert make_converter(tmp_path, second).convert(b"%PDF-1.4 one", '.pdf') == "# Converted"
+    assert second.calls == []
+
+
+def test_empty_conversion_raises_and_is_not_cached(tmp_path):
+    markitdown = RecordingMarkItDown(text="")
+    converter = make_converter(tmp_path, markitdown)
+
+    for _ in range(2):
+        with pytest.raises(ValueError, match="Could not extract text"):
+            converter.convert(b"%PDF-1.4 empty", '.pdf')
+    assert len(markitdown.calls) == 2
+
+
+def test_disabled_cache_converts_every_time():
+    markitdown = RecordingMarkItDown()
+    converter = DocumentConverter.from_settings({"enabled": False})
+    converter._markitdown = markitdown
+
+    converter.convert(b"%PDF-1.4 one", '.pdf')
+    converter.convert(b"%PDF-1.4 one", '.pdf')
+    assert len(markitdown.calls) == 2
+    assert converter.stats() == {}
@@ -0,0 +1,73 @@
+import sys
+import pytest
+from streamlit.testing.v1 import AppTest
+
+
+def _results_page():
+    import streamlit as st
+    import main
+
+    main.show_package(main.lazy_tabs(main.RESULT_TABS), st.session_state.response, "English")
+
+
+def _skills_section():
+    import streamlit as st
+    import main
+
+    main.edit_skills(st.session_state.response['structured_cv'])
+
+
+def _timed_request():
+    import main
+
+    with main.timed_request("export_pdf", jobs=1):
+        with main.span("export.render_pdf"):
+            pass
+    main.show_timings()
+
+
+@pytest.fixture
+def app(sample_package, monkeypatch):
+    # AppTest leaves its script installed as __main__, which spawned worker processes would re-import
+    monkeypatch.setitem(sys.modules, "__main__", sys.modules["__main__"])
+
+    def run(script, active_tab="Resume"):
+        at = AppTest.from_function(script, default_timeout=30)
+        at.session_state["response"] = sample_package
+        at.session_state["active_tab"] = active_tab
+        return at.run()
+    return run
+
+
+def test_hidden_tabs_build_no_widgets(app):
+    at = app(_results_page, active_tab="Cover Letter")
+
+    assert not at.exception
+    assert [area.key for area in at.text_area] == ["cover_letter_editor"]
+    assert not at.text_input
+
+
+def test_resume_tab_builds_the_editor(app, sample_package):
+    at = app(_results_page)
+
+    assert not at.exception
+    assert at.text_input[0].value == sample_package["structured_cv"]["name"]
+    assert at.button(key="del_exp_0")
+
+
+def test_section_edits_update_the_structured_cv(app, sample_package):
+    category = next(iter(sample_package["structured_cv"]["skills"]))
+
+    at = app(_skills_section)
+    at.text_input(key=f"skill_{category}_0").input("Rust").run()
+
+    assert not at.exception
+    assert at.session_state["response"]["structured_cv"]["skills"][category][0] == "Rust"
+
+
+def test_timing_breakdown(app):
+    at = app(_timed_request)
+
+    assert not at.exception
+    assert at.markdown[0].value.startswith("**export_pdf**")
+    assert list(at.dataframe[0].value["stage"]) == ["export_pdf", "  export.render_pdf"]
@@ -0,0 +1,94 @@
+import copy
+import pytest
+from export_docx import render_resume_docx
+from export_pdf import render_resume_pdf
+from src.exporters.export_cache import ExportCache
+from src.utils.cache import LRUCache
+
+
+class CountingRenderer:
+    def __init__(self, size=100):
+        self.size = size
+        self.calls = 0
+        self.__module__ = "tests"
+        self.__qualname__ = f"renderer_{size}"
+
+    def __call__(self, structured_cv, language="English", **layout):
+        self.calls += 1
+        return bytes(self.size)
+
+
+@pytest.fixture
+def structured_cv(sample_package):
+    return sample_package["structured_cv"]
+
+
+def test_unchanged_inputs_render_once(structured_cv):
+    cache = ExportCache(LRUCache(max_entries=8))
+    render = CountingRenderer()
+
+    for _ in range(3):
+        cache.render(render, copy.deepcopy(structured_cv), language="English", config={"body_size": 10})
+
+    assert render.calls == 1
+    assert cache.stats()["hits"] == 2
+
+
+@pytest.mark.parametrize("change", [
+    lambda cv, kwargs: cv["skills"]["Technical"].append("Rust"),
+    lambda cv, kwargs: kwargs.update(language="Spanish"),
+    lambda cv, kwargs: kwargs["config"].update(body_size=11),
+])
+def test_any_input_change_rerenders(structured_cv, change):
+    cache = ExportCache(LRUCache(max_entries=8))
+    render = CountingRenderer()
+    kwargs = {"language": "English", "config": {"body_size": 10}}
+
+    cache.render(render, structured_cv, **copy.deepcopy(kwargs))
+    change(structured_cv, kwargs)
+    cache.render(render, structured_cv, **kwargs)
+
+    assert render.calls == 2
+
+
+def test_key_ignores_dict_order(structured_cv):
+    reordered = dict(reversed(list(structured_cv.items())))
+    assert ExportCache.key(render_resume_pdf, structured_cv, "English", {"a": 1, "b": 2}) == \
+        ExportCache.key(render_resume_pdf, reordered, "English", {"b": 2, "a": 1})
+    assert ExportCache.key(render_resume_pdf, structured_cv, "English", {}) != \
+        ExportCache.key(render_resume_docx, structured_cv, "English", {})
+
+
+def test_byte_budget_evicts_least_recent(structured_cv):
+    cache = ExportCache(LRUCache(max_entries=100, max_bytes=250))
+    render = CountingRenderer(size=100)
+
+    for size in (1, 2, 3):
+        cache.render(render, structured_cv, config={"body_size": size})
+
+    assert cache.stats()["bytes"] <= 250
+    assert cache.stats()["entries"] == 2
+    cache.render(render, structured_cv, config={"body_size": 1})
+    assert render.calls == 4
+
+
+def test_disabled_cache_always_renders(structured_cv):
+    cache = ExportCache.from_settings({"enabled": False})
+    render = CountingRenderer()
+
+    cache.render(render, structured_cv)
+    cache.render(render, structured_cv)
+    assert render.calls == 2
+    assert cache.stats() == {}
+
+
+def test_real_renderers_are_memoized(structured_cv):
+    cache = ExportCache.from_settings()
+
+    first = cache.render(render_resume_pdf, structured_cv, language="English",
+                         font_config=None, spacing_config=None)
+    second = cache.render(render_resume_pdf, structured_cv, language="English",
+                          font_config=None, spacing_config=None)
+
+    assert first is second
+    assert first.startswith(b"%PDF-")
@@ -0,0 +1,46 @@
+import io
+import docx
+import pytest
+import export_docx
+import export_pdf
+from src.exporters import pdf_exporter
+
+
+@pytest.fixture
+def structured_cv(sample_package):
+    return sample_package["structured_cv"]
+
+
+@pytest.fixture
+def empty_cwd(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.mark.parametrize("render", [export_pdf.render_resume_pdf, pdf_exporter.render_resume_pdf],
+                         ids=["export_pdf", "pdf_exporter"])
+def test_render_pdf_returns_bytes_without_files(render, structured_cv, empty_cwd):
+    pdf_bytes = render(structured_cv, language="Spanish")
+
+    assert isinstance(pdf_bytes, bytes)
+    assert pdf_bytes.startswith(b"%PDF-")
+    assert pdf_bytes.rstrip().endswith(b"%%EOF")
+    assert list(empty_cwd.iterdir()) == []
+
+
+def test_render_docx_returns_bytes_without_files(structured_cv, empty_cwd):
+    docx_bytes = export_docx.render_resume_docx(structured_cv, language="English")
+
+    document = docx.Document(io.BytesIO(docx_bytes))
+    texts = [paragraph.text for paragraph in document.paragraphs]
+    assert texts[0] == "John Doe"
+    assert "Work Experience" in texts
+    assert "Python, SQL, Tableau" in texts
+    assert list(empty_cwd.iterdir()) == []
+
+
+def test_generate_functions_still_write_files(structured_cv, tmp_path):
+    assert export_pdf.generate_resume_pdf(structured_cv, output_path=str(tmp_path / "r.pdf"))
+    assert export_docx.generate_resume_docx(structured_cv, output_path=str(tmp_path / "r.docx"))
+    assert (tmp_path / "r.pdf").read_bytes().startswith(b"%PDF-")
+    assert docx.Document(str(tmp_path / "r.docx")).paragraphs[0].text == "John Doe"
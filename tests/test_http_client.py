@@ -0,0 +1,72 @@
+import asyncio
+import pytest
+from assistant_manager import AssistantManager, AsyncAssistantManager
+from src.config import settings
+from src.core import http_client
+from src.core.providers import OpenAIAssistantsProvider
+
+
+@pytest.fixture(autouse=True)
+def fresh_pool():
+    http_client.close_http_client()
+    yield
+    http_client.close_http_client()
+
+
+def test_options_follow_settings(monkeypatch):
+    config = dict(settings.HTTP_CLIENT, max_connections=8, max_keepalive_connections=4,
+                  keepalive_expiry=30, connect_timeout=2, read_timeout=45)
+    options = http_client.client_options(config)
+
+    assert options["http2"] is True
+    assert options["limits"].max_connections == 8
+    assert options["limits"].max_keepalive_connections == 4
+    assert options["limits"].keepalive_expiry == 30
+    assert (options["timeout"].connect, options["timeout"].read) == (2, 45)
+
+    monkeypatch.setattr(http_client, "http2_available", lambda: False)
+    assert http_client.client_options(config)["http2"] is False
+
+
+def test_managers_share_one_pool(fake_env):
+    first, second = AssistantManager(), AssistantManager()
+
+    client = first.provider.client
+    assert second.provider.client is client
+    assert client._client is http_client.get_http_client()
+    assert client.timeout.connect == settings.HTTP_CLIENT["connect_timeout"]
+    first.close()
+    second.close()
+
+
+def test_connections_are_reused(fake_env, sample_input, sample_package):
+    fake_env.streaming = False
+    manager = AssistantManager()
+    for _ in range(3):
+        assert manager.generate_resume_package(sample_input) == sample_package
+    manager.close()
+
+    # The thread pool refills in the background, so a few connections may be open at once
+    assert len(fake_env.requests) >= 15
+    assert fake_env.connections <= 4
+
+
+def test_init_retry_keeps_the_client(fake_env, monkeypatch):
+    monkeypatch.setattr("time.sleep", lambda seconds: None)
+    fake_env.inject_fault("assistant", 404)
+    provider = OpenAIAssistantsProvider(agent_id="asst_test", retry_delay=0)
+
+    assert provider.client is http_client.get_openai_client()
+    assert fake_env.count("GET", "assistant") == 2
+    provider.close()
+
+
+def test_async_pool_matches_concurrency(fake_env):
+    async def pool_limits():
+        manager = AsyncAssistantManager(max_concurrency=6)
+        limits = manager.client._client._transport._pool
+        await manager.close()
+        return limits
+
+    pool = asyncio.run(pool_limits())
+    assert pool._max_connections == 6 and pool._max_keepalive_connections == 6
@@ -0,0 +1,25 @@
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def test_core_modules_import_without_heavy_dependencies_or_side_effects():
+    code = """
+import logging, os, sys
+root_handlers = list(logging.getLogger().handlers)
+import src.config.settings, src.core.assistant, src.core.ingestion, src.exporters.export_cache
+import src.exporters.package_bundle, src.utils.metrics, src.utils.tracing, assistant_manager
+heavy = sorted({'openai', 'streamlit', 'fpdf', 'docx', 'magic', 'markitdown', 'http.server'} & set(sys.modules))
+print(heavy, logging.getLogger().handlers == root_handlers)
+"""
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    assert result.stdout.split("\n")[0] == "[] True"
+
+
+def test_directories_are_created_on_demand(tmp_path):
+    from src.config.settings import ensure_dir
+
+    path = ensure_dir(tmp_path / "output" / "cache")
+    assert path.is_dir() and ensure_dir(path) == path
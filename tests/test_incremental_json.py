@@ -0,0 +1,117 @@
+import json
+import random
+from pathlib import Path
+import pytest
+from assistant_manager import AssistantManager
+from src.core.incremental_json import IncrementalJSONParser
+from src.core.response_parser import extract_json
+
+REPLIES_DIR = Path(__file__).parent / "data" / "replies"
+GOOD_REPLIES = sorted(REPLIES_DIR.glob("good_*.txt"))
+
+
+def feed_all(chunks, partial_strings=True):
+    parser = IncrementalJSONParser(partial_strings=partial_strings)
+    updates = []
+    for chunk in chunks:
+        updates.extend(parser.feed(chunk))
+    return parser, updates
+
+
+def split_at(text, boundaries):
+    edges = [0] + sorted(boundaries) + [len(text)]
+    return [text[a:b] for a, b in zip(edges, edges[1:])]
+
+
+def check_updates(updates, expected):
+    complete = [update for update in updates if update.complete]
+    assert [update.key for update in complete] == list(expected)
+    assert {update.key: update.value for update in complete} == expected
+    for update in updates:
+        if not update.complete:
+            assert isinstance(update.value, str)
+            assert expected[update.key].startswith(update.value)
+
+
+@pytest.mark.parametrize("path", GOOD_REPLIES, ids=lambda p: p.stem)
+def test_random_chunk_boundaries(path):
+    reply = path.read_text()
+    expected = extract_json(reply)
+    rng = random.Random(path.stem)
+    for _ in range(25):
+        boundaries = rng.sample(range(1, len(reply)), k=min(len(reply) - 1, rng.randint(1, 200)))
+        parser, updates = feed_all(split_at(reply, boundaries))
+        check_updates(updates, expected)
+        assert parser.done
+
+
+def test_every_boundary_of_small_reply(sample_package):
+    reply = "Here you go:\n```json\n" + json.dumps(sample_package, indent=2) + "\n```"
+    for size in (1, 2, 3, 7, 64):
+        chunks = [reply[i:i + size] for i in range(0, len(reply), size)]
+        parser, updates = feed_all(chunks)
+        check_updates(updates, sample_package)
+        assert parser.values == sample_package
+
+
+def test_escapes_split_across_chunks():
+    value = 'line "one"\nsecond\\line é— done'
+    reply = json.dumps({"analysis": value, "n": 12, "flag": True, "none": None})
+    expected = json.loads(reply)
+    for cut in range(1, len(reply)):
+        _, updates = feed_all([reply[:cut], reply[cut:]])
+        check_updates(updates, expected)
+
+
+def test_partial_strings_fed_one_character_at_a_time():
+    value = 'Tab\there, "quoted" \\ caf\u00e9 \U0001F600 done'
+    reply = json.dumps({"analysis": value})
+    _, updates = feed_all(list(reply))
+    partials = [update.value for update in updates if not update.complete]
+    assert all(value.startswith(partial) for partial in partials)
+    assert all(len(a) < len(b) for a, b in zip(partials, partials[1:]))
+    assert partials[-1] == value and updates[-1].complete
+
+
+def test_string_values_stream_as_partial_updates():
+    parser = IncrementalJSONParser()
+    updates = parser.feed('{"cover_letter": "Dear hiring')
+    assert [(u.key, u.value, u.complete) for u in updates] == [("cover_letter", "Dear hiring", False)]
+    updates = parser.feed(' manager", "cv": "# CV"}')
+    assert [(u.key, u.value, u.complete) for u in updates] == [
+        ("cover_letter", "Dear hiring manager", True), ("cv", "# CV", True)]
+    assert parser.done
+
+
+def test_nested_values_complete_when_closed():
+    parser = IncrementalJSONParser(partial_strings=False)
+    assert parser.feed('{"structured_cv": {"skills": {"a": ["x", "}"]}') == []
+    updates = parser.feed('}')
+    assert updates[0].value == {"skills": {"a": ["x", "}"]}}
+
+
+def test_manager_streams_keys_before_final_package(fake_env, sample_input, sample_package):
+    fake_env.chunk_size = 7
+    manager = AssistantManager()
+    try:
+        updates = list(manager.stream_resume_package(sample_input))
+    finally:
+        manager.close()
+
+    *partials, final = updates
+    assert final.key is None and final.value == sample_package
+    check_updates(partials, sample_package)
+    assert any(not update.complete for update in partials)
+
+
+def test_manager_without_streaming_yields_all_keys(fake_env, sample_input, sample_package):
+    fake_env.streaming = False
+    manager = AssistantManager()
+    try:
+        updates = list(manager.stream_resume_package(sample_input))
+    finally:
+        manager.close()
+
+    *partials, final = updates
+    check_updates(partials, sample_package)
+    assert final.value == sample_package
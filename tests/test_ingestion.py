@@ -0,0 +1,130 @@
+import time
+import docx
+import pytest
+from src.core import ingestion
+from src.core.ingestion import IngestionError, IngestionService
+from src.utils.cache import LRUCache, TieredCache
+
+DOCX_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+
+def make_docx(path):
+    document = docx.Document()
+    document.add_heading("Jane Doe", level=1)
+    document.add_paragraph("Data engineer with 8 years of experience.")
+    document.add_heading("Skills", level=2)
+    document.add_paragraph("Python", style="List Bullet")
+    document.add_paragraph("SQL", style="List Bullet")
+    table = document.add_table(rows=2, cols=2)
+    table.cell(0, 0).text, table.cell(0, 1).text = "Company", "Years"
+    table.cell(1, 0).text, table.cell(1, 1).text = "Acme", "2019-2024"
+    document.save(path)
+    return path
+
+
+@pytest.fixture(scope="module")
+def service():
+    with IngestionService(workers=2, timeout=10) as service:
+        yield service
+
+
+def test_ingests_docx_as_markdown(service, tmp_path):
+    document = service.ingest_file(make_docx(tmp_path / "resume.docx"))
+
+    assert document.file_type == DOCX_TYPE
+    assert document.markdown == (
+        "# Jane Doe\n\nData engineer with 8 years of experience.\n\n## Skills\n\n- Python\n\n- SQL\n\n"
+        "| Company | Years |\n| --- | --- |\n| Acme | 2019-2024 |")
+
+
+def test_ingests_text_bytes_normalized(service):
+    raw = "# John\r\n\r\n\r\n\r\nAnalyst with  SQL   \r\n".encode("utf-8")
+    document = service.ingest_bytes(raw, "resume.md")
+
+    assert document.file_type == "text/plain"
+    assert document.markdown == "# John\n\nAnalyst with  SQL"
+
+
+def test_unsupported_file_raises(service):
+    with pytest.raises(IngestionError, match="Unsupported file type"):
+        service.ingest_bytes(b"\x89PNG\r\n\x1a\n" + b"\x00" * 64, "photo.png")
+
+
+def test_directory_ingestion_reports_each_file(service, tmp_path):
+    for idx in range(6):
+        (tmp_path / f"resume_{idx}.txt").write_text(f"# Candidate {idx}\n\nSkills: Python")
+    make_docx(tmp_path / "resume_docx.docx")
+    (tmp_path / "broken.png").write_bytes(b"\x89PNG\r\n\x1a\n" + b"\x00" * 64)
+
+    results = service.ingest_directory(tmp_path)
+
+    by_name = {result.source.rsplit("/", 1)[-1]: result for result in results}
+    assert len(results) == 8
+    assert by_name["broken.png"].error.startswith("Unsupported file type")
+    assert by_name["resume_3.txt"].markdown == "# Candidate 3\n\nSkills: Python"
+    assert by_name["resume_docx.docx"].markdown.startswith("# Jane Doe")
+    assert sum(result.error is None for result in results) == 7
+
+
+def test_cache_skips_workers_on_repeat(tmp_path):
+    cache = TieredCache(LRUCache(max_entries=8))
+    path = tmp_path / "resume.txt"
+    path.write_text("# Cached candidate")
+    service = IngestionService(workers=1, cache=cache)
+    try:
+        first = service.ingest_file(path)
+        service.close()
+        second = service.ingest_file(path)
+    finally:
+        service.close()
+
+    assert first == second
+    assert cache.stats()["hits"] == 1
+    # The cache hit never started a new pool
+    assert service._pool is None
+
+
+def test_repeat_upload_is_served_from_memory(tmp_path, monkeypatch):
+    cache = TieredCache(LRUCache(max_entries=8))
+    with IngestionService(workers=1, cache=cache) as service:
+        first = service.ingest_bytes(b"# Uploaded candidate", "resume.md")
+
+        def staged(*args):
+            raise AssertionError("a cached upload should not be written to disk or validated")
+
+        monkeypatch.setattr(ingestion, "create_temp_file", staged)
+        monkeypatch.setattr(ingestion, "validate_file", staged)
+        second = service.ingest_bytes(b"# Uploaded candidate", "resume.md")
+
+    assert first == second
+    assert second.file_type == "text/plain" and second.markdown == "# Uploaded candidate"
+
+
+class SlowConverter:
+    def convert_uncached(self, data, extension):
+        time.sleep(5)
+
+
+class GreedyConverter:
+    def convert_uncached(self, data, extension):
+        raise MemoryError
+
+
+def test_worker_conversion_times_out(tmp_path, monkeypatch):
+    path = tmp_path / "resume.txt"
+    path.write_text("slow")
+    monkeypatch.setattr(ingestion, "_worker_converter", SlowConverter())
+
+    start = time.monotonic()
+    with pytest.raises(IngestionError, match="timed out after 0.2 seconds"):
+        ingestion._convert_in_worker(str(path), ".txt", 0.2)
+    assert time.monotonic() - start < 2
+
+
+def test_worker_memory_error_is_reported(tmp_path, monkeypatch):
+    path = tmp_path / "resume.txt"
+    path.write_text("big")
+    monkeypatch.setattr(ingestion, "_worker_converter", GreedyConverter())
+
+    with pytest.raises(IngestionError, match="memory limit"):
+        ingestion._convert_in_worker(str(path), ".txt", 5)
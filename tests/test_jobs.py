@@ -0,0 +1,128 @@
+import time
+import pytest
+from assistant_manager import AssistantManager
+from src.config import settings
+from src.core.admission import AdmissionController, AdmissionQueue
+from src.core.jobs import COMPLETED, FAILED, JobQueue, JobStore
+from src.core.providers import StubProvider, synthetic_package
+from src.utils import metrics
+from src.utils.cache import canonical_hash
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    monkeypatch.setitem(settings.RESPONSE_CACHE, "enabled", False)
+    return AssistantManager(provider=StubProvider(latency=0.3, chunk_size=200))
+
+
+@pytest.fixture
+def queues(tmp_path):
+    """Job queues on one job table, as if run by separate processes"""
+    created = []
+
+    def make(manager, **options):
+        queue = JobQueue(manager, JobStore(tmp_path / "jobs.sqlite3"), **options)
+        created.append(queue)
+        return queue
+
+    yield make
+    for queue in created:
+        queue.close()
+
+
+def test_job_runs_in_the_background(queues, manager, sample_input):
+    queue = queues(manager)
+    start = time.monotonic()
+    job_id = queue.submit(sample_input)
+
+    assert time.monotonic() - start < 0.2
+    assert queue.get(job_id).status in ("queued", "running")
+    job = queue.wait(job_id, timeout=5)
+    assert job.status == COMPLETED and job.error is None
+    assert job.result == synthetic_package(sample_input)
+    assert job.partial["cover_letter"] == job.result["cover_letter"]
+    assert job.created_at <= job.started_at <= job.finished_at
+
+
+def test_duplicate_submissions_join_the_job_in_flight(queues, manager, sample_input):
+    queue = queues(manager)
+    coalesced = metrics.JOBS_SUBMITTED.value(result="coalesced")
+
+    first = queue.submit(sample_input)
+    assert queue.submit(dict(sample_input)) == first
+    other = queue.submit(dict(sample_input, job_name="Other"))
+    assert other != first
+    assert metrics.JOBS_SUBMITTED.value(result="coalesced") == coalesced + 1
+
+    queue.wait(first, timeout=5)
+    assert queue.submit(sample_input) != first
+
+
+def test_failed_job_keeps_its_error(queues, manager, sample_input):
+    manager.provider.failure_rate = 1.0
+    queue = queues(manager)
+
+    job = queue.wait(queue.submit(sample_input), timeout=5)
+
+    assert job.status == FAILED and job.result is None
+    assert "run failed" in job.error
+
+
+def test_another_process_reattaches_to_the_result(queues, manager, sample_input):
+    job_id = queues(manager).submit(sample_input)
+
+    reader = queues(manager)
+    assert reader.wait(job_id, timeout=5).result == synthetic_package(sample_input)
+    assert reader.get("missing") is None
+
+
+def test_jobs_of_a_stopped_process_are_resumed(queues, manager, sample_input, tmp_path):
+    store = JobStore(tmp_path / "jobs.sqlite3")
+    job_id, created = store.submit("key", sample_input, owner="stopped", lease=-1)
+    assert created
+
+    queue = queues(manager)
+    assert queue.wait(job_id, timeout=5).result == synthetic_package(sample_input)
+    assert queue.recover() == 0
+
+
+def test_submit_takes_over_a_job_whose_owner_died(queues, manager, sample_input):
+    queue = queues(manager)
+    # Left behind after the queue started, so only the submit can notice it
+    job_id, _ = queue.store.submit(canonical_hash(sample_input), sample_input, owner="dead", lease=-1)
+
+    assert queue.submit(dict(sample_input)) == job_id
+    assert queue.wait(job_id, timeout=5).result == synthetic_package(sample_input)
+
+
+def test_running_queues_pick_up_abandoned_jobs(queues, manager, sample_input):
+    queue = queues(manager, lease=0.3)
+    job_id, _ = queue.store.submit("key", sample_input, owner="dead", lease=-1)
+
+    assert queue.wait(job_id, timeout=5).status == COMPLETED
+
+
+def test_leases_are_renewed_while_jobs_run(queues, manager, sample_input, tmp_path):
+    manager.provider.latency = 1.0
+    queue = queues(manager, lease=0.3)
+    job_id = queue.submit(sample_input)
+
+    time.sleep(0.6)
+    assert JobStore(tmp_path / "jobs.sqlite3").claim_stale("other", lease=10) == []
+    assert queue.wait(job_id, timeout=5).status == COMPLETED
+
+
+def test_job_reports_its_place_in_line(queues, sample_input, monkeypatch):
+    monkeypatch.setitem(settings.RESPONSE_CACHE, "enabled", False)
+    controller = AdmissionController(AdmissionQueue(max_concurrent=1, expected_run_seconds=5))
+    queue = queues(AssistantManager(provider=StubProvider(latency=0.5), admission=controller), workers=2)
+
+    first = queue.submit(sample_input)
+    time.sleep(0.1)
+    second = queue.submit(dict(sample_input, job_name="Other"))
+    time.sleep(0.2)
+
+    waiting = queue.get(second)
+    assert (waiting.status, waiting.position, waiting.estimated_wait) == ("running", 1, 5)
+    queue.wait(first, timeout=5)
+    assert queue.wait(second, timeout=5).position is None
@@ -0,0 +1,136 @@
+import threading
+import httpx
+import pytest
+from openai import OpenAI
+from assistant_manager import AssistantManager
+from src.config import settings
+from src.core.completion import PollBackoff, RunFailedError, complete_run
+from src.core.providers import StubProvider
+from src.exporters.export_cache import ExportCache
+from src.utils import metrics
+from src.utils.metrics import Counter, Histogram, Registry
+
+
+@pytest.fixture
+def registry():
+    return Registry()
+
+
+def test_exposition_format(registry):
+    requests = Counter("requests_total", "Requests served", ["result"], registry=registry)
+    latency = Histogram("latency_seconds", "Stage latency", ["stage"], buckets=(0.1, 1), registry=registry)
+    requests.inc(result="cached")
+    requests.inc(2, result='say "hi"')
+    for value in (0.05, 0.5, 0.5, 3):
+        latency.observe(value, stage="run")
+
+    assert registry.exposition().splitlines() == [
+        "# HELP requests_total Requests served",
+        "# TYPE requests_total counter",
+        'requests_total{result="cached"} 1',
+        'requests_total{result="say \\"hi\\""} 2',
+        "# HELP latency_seconds Stage latency",
+        "# TYPE latency_seconds histogram",
+        'latency_seconds_bucket{stage="run",le="0.1"} 1',
+        'latency_seconds_bucket{stage="run",le="1"} 3',
+        'latency_seconds_bucket{stage="run",le="+Inf"} 4',
+        'latency_seconds_sum{stage="run"} 4.05',
+        'latency_seconds_count{stage="run"} 4',
+    ]
+
+
+def test_labels_are_checked(registry):
+    counter = Counter("runs_total", "Runs", ["status"], registry=registry)
+    with pytest.raises(ValueError):
+        counter.inc()
+    with pytest.raises(ValueError):
+        Counter("runs_total", "Runs again", registry=registry)
+
+
+def test_concurrent_updates_are_not_lost(registry):
+    counter = Counter("hits_total", "Hits", registry=registry)
+    histogram = Histogram("sizes", "Sizes", buckets=(1,), registry=registry)
+
+    def work():
+        for _ in range(10000):
+            counter.inc()
+            histogram.observe(1)
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert counter.value() == 40000 and histogram.count() == 40000
+
+
+def test_endpoint_serves_the_registry(registry):
+    Counter("up_total", "Scrapes", registry=registry).inc()
+    server = metrics.start_http_server(0, registry=registry)
+    try:
+        response = httpx.get(f"http://127.0.0.1:{server.server_port}/metrics")
+        missing = httpx.get(f"http://127.0.0.1:{server.server_port}/other")
+    finally:
+        server.shutdown()
+
+    assert response.headers["content-type"] == metrics.CONTENT_TYPE
+    assert "up_total 1" in response.text
+    assert missing.status_code == 404
+
+
+def test_taken_port_does_not_stop_the_app(registry):
+    server = metrics.start_http_server(0, registry=registry)
+    try:
+        taken = dict(settings.METRICS, enabled=True, port=server.server_port)
+        assert metrics.start_metrics_server(taken) is None
+        assert metrics.start_metrics_server(dict(taken, enabled=False)) is None
+    finally:
+        server.shutdown()
+
+
+def test_requests_runs_stages_and_cache(monkeypatch, sample_input):
+    monkeypatch.setitem(settings.RESPONSE_CACHE, "enabled", True)
+    monkeypatch.setitem(settings.RESPONSE_CACHE, "disk", False)
+    before = {result: metrics.REQUESTS.value(result=result) for result in ("generated", "cached", "failed")}
+    runs = {status: metrics.RUNS.value(status=status) for status in ("completed", "failed")}
+    hits = metrics.CACHE_LOOKUPS.value(cache="response", result="hit")
+    parses = metrics.STAGE_SECONDS.count(stage="parse_response")
+
+    manager = AssistantManager(provider=StubProvider())
+    manager.generate_resume_package(sample_input)
+    manager.generate_resume_package(sample_input)
+    manager.provider.failure_rate = 1.0
+    with pytest.raises(RunFailedError):
+        manager.generate_resume_package(dict(sample_input, job_name="Other"))
+
+    assert metrics.REQUESTS.value(result="generated") == before["generated"] + 1
+    assert metrics.REQUESTS.value(result="cached") == before["cached"] + 1
+    assert metrics.REQUESTS.value(result="failed") == before["failed"] + 1
+    assert metrics.RUNS.value(status="completed") == runs["completed"] + 1
+    assert metrics.RUNS.value(status="failed") == runs["failed"] + 1
+    assert metrics.CACHE_LOOKUPS.value(cache="response", result="hit") == hits + 1
+    assert metrics.STAGE_SECONDS.count(stage="parse_response") == parses + 1
+
+
+def test_poll_iterations(fake_api):
+    fake_api.streaming = False
+    fake_api.run_duration = 0.2
+    client = OpenAI(api_key="test-key", base_url=fake_api.base_url, max_retries=0)
+    runs, total = metrics.RUN_POLLS.count(), metrics.RUN_POLLS.sum()
+
+    complete_run(client, client.beta.threads.create().id, "asst_test",
+                 backoff=PollBackoff(initial=0.05, maximum=0.1))
+
+    assert metrics.RUN_POLLS.count() == runs + 1
+    assert metrics.RUN_POLLS.sum() - total == fake_api.count("GET", "run")
+
+
+def test_export_bytes(sample_package):
+    from export_pdf import render_resume_pdf
+
+    produced = metrics.EXPORT_BYTES.value(renderer="render_resume_pdf")
+    cache = ExportCache.from_settings(dict(settings.EXPORT_CACHE, enabled=True))
+    document = cache.render(render_resume_pdf, sample_package["structured_cv"])
+    cache.render(render_resume_pdf, sample_package["structured_cv"])
+
+    assert metrics.EXPORT_BYTES.value(renderer="render_resume_pdf") == produced + 2 * len(document)
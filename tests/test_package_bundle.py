@@ -0,0 +1,62 @@
+import io
+import zipfile
+import pytest
+from src.exporters.package_bundle import (
+    build_package_zip, bundle_members, package_markdown, package_text, write_zip)
+from src.exporters.pdf_exporter import render_resume_pdf
+
+
+@pytest.fixture
+def package():
+    return {"analysis": "Strong match.", "cv": "# Jane Doe", "cover_letter": "Dear team,"}
+
+
+def test_bundle_contains_every_member(package, sample_package):
+    data = build_package_zip(package,
+                             render_pdf=lambda: render_resume_pdf(sample_package["structured_cv"]),
+                             render_docx=lambda: b"docx bytes")
+
+    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+        assert archive.namelist() == ["analysis.md", "resume.md", "cover_letter.md",
+                                      "ats_resume_package.md", "ats_resume_package.txt",
+                                      "resume.pdf", "resume.docx"]
+        assert archive.read("analysis.md") == b"Strong match."
+        assert archive.read("ats_resume_package.txt").decode() == package_text(package)
+        assert archive.read("ats_resume_package.md").decode() == package_markdown(package)
+        assert archive.read("resume.pdf").startswith(b"%PDF-")
+        assert archive.getinfo("resume.pdf").compress_type == zipfile.ZIP_STORED
+        assert archive.getinfo("resume.md").compress_type == zipfile.ZIP_DEFLATED
+
+
+def test_members_are_produced_one_at_a_time(package):
+    calls = []
+
+    def render(kind):
+        def produce():
+            calls.append(kind)
+            return kind.encode()
+        return produce
+
+    members = bundle_members(package, render_pdf=render("pdf"), render_docx=render("docx"))
+    assert calls == []
+
+    written = []
+    stream = io.BytesIO()
+    write_zip(((name, lambda produce=produce, name=name: written.append(name) or produce())
+               for name, produce in members), stream)
+
+    assert calls == ["pdf", "docx"]
+    assert written[-2:] == ["resume.pdf", "resume.docx"]
+
+
+def test_failed_member_aborts_bundle(package):
+    def broken():
+        raise KeyError("work_experience")
+
+    with pytest.raises(KeyError):
+        build_package_zip(package, render_pdf=broken, render_docx=lambda: b"")
+
+
+def test_package_text_layout(package):
+    assert package_text(package).splitlines()[1:5] == ["ATS Resume Package", "", "ANALYSIS", "--------"]
+    assert "## Cover Letter\nDear team," in package_markdown(package)
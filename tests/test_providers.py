@@ -0,0 +1,120 @@
+import json
+import pytest
+from assistant_manager import AssistantManager
+from src.config import settings
+from src.core.completion import RunFailedError
+from src.core.providers import LLMProvider, StubProvider, create_provider, load_replies, synthetic_package
+from src.core.response_parser import validate_resume_package
+
+
+@pytest.fixture
+def sleeps():
+    return []
+
+
+@pytest.fixture
+def manager_for(monkeypatch):
+    monkeypatch.setitem(settings.RESPONSE_CACHE, "enabled", False)
+    return lambda provider: AssistantManager(provider=provider)
+
+
+def test_synthetic_package_is_valid_and_addressed_to_the_job(sample_input):
+    package = synthetic_package(sample_input)
+
+    assert validate_resume_package(package) is package
+    assert package["structured_cv"]["work_experience"][1]["title"] == sample_input["job_name"]
+    assert synthetic_package(sample_input) == package
+
+
+def test_manager_generates_offline(manager_for, sample_input):
+    manager = manager_for(StubProvider(chunk_size=50))
+    updates = list(manager.stream_resume_package(sample_input))
+
+    *partials, final = updates
+    assert final.value == synthetic_package(sample_input)
+    assert {update.key for update in partials} >= {"cv", "structured_cv", "cover_letter", "analysis"}
+
+
+def test_recorded_replies(tmp_path, manager_for, sample_input, sample_package):
+    path = tmp_path / "replies.jsonl"
+    path.write_text(json.dumps(sample_package) + "\n\n" + json.dumps(f"```json\n{json.dumps(sample_package)}\n```") + "\n")
+    replies = load_replies(str(path))
+
+    assert len(replies) == 2
+    manager = manager_for(StubProvider(replies=replies))
+    assert manager.generate_resume_package(sample_input) == sample_package
+
+
+def test_latency_is_spread_over_chunks(sleeps):
+    stub = StubProvider(latency=0.5, chunk_size=10, sleep=sleeps.append)
+    reply = stub.get_reply(stub.create_run('{"job_name": "Analyst"}'))
+
+    assert len(sleeps) == -(-len(reply) // 10)
+    assert sum(sleeps) == pytest.approx(0.5)
+
+
+def test_draws_are_deterministic_per_request_and_attempt():
+    first, second = StubProvider(latency=1, latency_sigma=0.8, seed=3), StubProvider(latency=1, latency_sigma=0.8, seed=3)
+    runs = [first.create_run(content) for content in ("a", "b", "a")]
+    # Same requests sent in a different order
+    others = [second.create_run(content) for content in ("b", "a", "a")]
+
+    assert first.plan(runs[0]) == second.plan(others[1])
+    assert first.plan(runs[1]) == second.plan(others[0])
+    assert first.plan(runs[2]) == second.plan(others[2])
+    assert first.plan(runs[0]) != first.plan(runs[2])
+
+
+def test_attempts_are_forgotten_after_success(monkeypatch):
+    monkeypatch.setattr(StubProvider, "max_tracked", 3)
+    stub = StubProvider()
+    stub.create_run("a")
+    assert stub.create_run("a").attempt == 1
+    stub.get_reply(stub.create_run("a"))
+    assert stub.create_run("a").attempt == 0
+
+    for content in "bcde":
+        stub.create_run(content)
+    assert len(stub._attempts) == 3
+    # The oldest request was dropped, so its next run counts as a first attempt
+    assert stub.create_run("b").attempt == 0
+
+
+def test_incomplete_provider_fails_at_construction():
+    class NoReplies(LLMProvider):
+        def create_run(self, content):
+            return None
+
+    with pytest.raises(TypeError):
+        NoReplies()
+
+
+def test_failure_rate_and_latency_tail():
+    stub = StubProvider(latency=1.0, latency_sigma=0.5, failure_rate=0.2)
+    plans = [stub.plan(stub.create_run(str(idx))) for idx in range(2000)]
+    latencies = sorted(latency for latency, _ in plans)
+
+    assert sum(failed for _, failed in plans) / len(plans) == pytest.approx(0.2, abs=0.03)
+    assert latencies[len(latencies) // 2] == pytest.approx(1.0, rel=0.1)
+    assert latencies[int(len(latencies) * 0.99)] > 2.5
+
+
+def test_failures_and_timeouts_surface_through_the_manager(manager_for, sample_input, sleeps):
+    manager = manager_for(StubProvider(failure_rate=1.0, sleep=sleeps.append))
+    with pytest.raises(RunFailedError):
+        manager.generate_resume_package(sample_input)
+
+    manager = manager_for(StubProvider(latency=10, timeout=2, sleep=sleeps.append))
+    with pytest.raises(TimeoutError):
+        manager.generate_resume_package(sample_input)
+    assert sleeps[-1] == 2
+
+
+def test_create_provider_from_settings():
+    stub_settings = dict(settings.LLM_PROVIDER["stub"], latency=0.25, failure_rate=0.1)
+    provider = create_provider({"name": "stub", "stub": stub_settings}, timeout=5)
+
+    assert isinstance(provider, StubProvider)
+    assert (provider.latency, provider.failure_rate, provider.timeout) == (0.25, 0.1, 5)
+    with pytest.raises(ValueError):
+        create_provider({"name": "carrier-pigeon"})
@@ -0,0 +1,54 @@
+import pytest
+from src.config import settings
+from src.core.rate_limit import RateLimiter, SQLiteTokenBucket, TokenBucket, estimate_tokens
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_bucket_reserves_ahead_and_refills():
+    clock = Clock()
+    bucket = TokenBucket(per_minute=60, capacity=2, clock=clock)
+
+    assert [bucket.reserve() for _ in range(4)] == [0, 0, 1.0, 2.0]
+    assert bucket.peek() == 3.0
+    clock.now = 3.0
+    assert bucket.peek() == 0
+    clock.now = 100.0
+    assert [bucket.reserve() for _ in range(3)] == [0, 0, 1.0]
+
+
+def test_sqlite_buckets_share_one_quota(tmp_path):
+    first = SQLiteTokenBucket(tmp_path / "limits.sqlite3", "requests", per_minute=6, capacity=2)
+    second = SQLiteTokenBucket(tmp_path / "limits.sqlite3", "requests", per_minute=6, capacity=2)
+    other = SQLiteTokenBucket(tmp_path / "limits.sqlite3", "tokens", per_minute=6, capacity=2)
+
+    assert first.reserve() == 0 and second.reserve() == 0
+    assert second.peek() == pytest.approx(10, abs=0.1)
+    assert first.reserve() == pytest.approx(10, abs=0.1)
+    assert other.reserve() == 0
+    for bucket in (first, second, other):
+        bucket.close()
+
+
+def test_limiter_from_settings(tmp_path):
+    config = dict(settings.RATE_LIMIT, requests_per_minute=60, tokens_per_minute=12000,
+                  completion_tokens=1000, burst_seconds=10)
+    limiter = RateLimiter.from_settings(config)
+    tokens = limiter.cost("x" * 400)
+
+    assert tokens == estimate_tokens("x" * 400, 1000) == 1101
+    # The token quota holds up the first request it can't cover, while requests are still spare
+    assert limiter.reserve(tokens) == 0
+    assert limiter.reserve(tokens) == pytest.approx(202 / 200, abs=0.01)
+
+    assert RateLimiter.from_settings(dict(config, requests_per_minute=0)).requests is None
+    shared = RateLimiter.from_settings(dict(config, backend="sqlite", sqlite_path=tmp_path / "l.sqlite3"))
+    assert isinstance(shared.tokens, SQLiteTokenBucket)
+    with pytest.raises(ValueError):
+        RateLimiter.from_settings(dict(config, backend="redis"))
@@ -0,0 +1,76 @@
+import json
+from pathlib import Path
+import pytest
+from src.core.response_parser import (
+    ResponseFormatError, extract_json, parse_resume_package, strip_trailing_commas
+)
+
+REPLIES_DIR = Path(__file__).parent / "data" / "replies"
+
+
+def load_reply(name):
+    return (REPLIES_DIR / name).read_text()
+
+
+@pytest.mark.parametrize("name", sorted(p.name for p in REPLIES_DIR.glob("good_*.txt")))
+def test_good_replies_parse(name):
+    package = parse_resume_package(load_reply(name))
+    assert package["structured_cv"]["name"] == "John Doe"
+
+
+@pytest.mark.parametrize("name", sorted(p.name for p in REPLIES_DIR.glob("bad_*.txt")))
+def test_bad_replies_raise_value_error(name):
+    with pytest.raises(ValueError):
+        parse_resume_package(load_reply(name))
+
+
+def test_fenced_reply_ignores_surrounding_prose(sample_package):
+    assert parse_resume_package(load_reply("good_fenced.txt")) == sample_package
+
+
+def test_trailing_comma_repair_keeps_string_contents():
+    package = parse_resume_package(load_reply("good_trailing_commas.txt"))
+    assert package["analysis"] == "Keywords to add: [SQL, dbt, ] and {Airflow, }."
+    assert package["structured_cv"]["skills"]["Soft Skills"] == ["Leadership", "Communication"]
+
+
+def test_strip_trailing_commas():
+    assert strip_trailing_commas('{"a": [1, 2, ], "b": ",]",\n}') == '{"a": [1, 2 ], "b": ",]"\n}'
+    assert strip_trailing_commas('{"a": "x\\",}"}') == '{"a": "x\\",}"}'
+
+
+def test_syntax_error_location_refers_to_original_reply():
+    reply = 'Sure!\n```json\n{\n  "cv": "x"\n  "analysis": "y"\n}\n```'
+    with pytest.raises(ResponseFormatError) as excinfo:
+        extract_json(reply)
+    assert (excinfo.value.line, excinfo.value.column) == (5, 3)
+    assert '"analysis": "y"' in str(excinfo.value)
+
+
+@pytest.mark.parametrize("reply", ['{"a": 1,\n', '{"cv": "x"\n', '{"cv": "x"\r\n'])
+def test_truncated_reply_ending_in_newline_reports_location(reply):
+    with pytest.raises(ResponseFormatError) as excinfo:
+        extract_json(reply)
+    assert excinfo.value.line == reply.count("\n") + 1
+
+
+def test_schema_error_reports_path(sample_package):
+    sample_package["structured_cv"]["work_experience"].append(
+        {"title": "Analyst", "company": "Acme", "responsibilities": []})
+    with pytest.raises(ResponseFormatError) as excinfo:
+        parse_resume_package(json.dumps(sample_package))
+    assert excinfo.value.path == "structured_cv.work_experience[1]"
+    assert "dates" in str(excinfo.value)
+
+
+def test_skill_type_error_reports_path(sample_package):
+    sample_package["structured_cv"]["skills"]["Technical"][1] = 42
+    with pytest.raises(ResponseFormatError) as excinfo:
+        parse_resume_package(json.dumps(sample_package))
+    assert excinfo.value.path == 'structured_cv.skills["Technical"][1]'
+
+
+def test_missing_keys(sample_package):
+    del sample_package["cover_letter"]
+    with pytest.raises(ResponseFormatError, match="missing required keys in response: cover_letter"):
+        parse_resume_package(json.dumps(sample_package))
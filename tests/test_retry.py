@@ -0,0 +1,153 @@
+import asyncio
+import contextvars
+import random
+import httpx
+import openai
+import pytest
+from assistant_manager import AssistantManager, AsyncAssistantManager
+from src.config import settings
+from src.core.retry import RetryPolicy, current_budget, is_retryable, retry_after, retry_budget
+from src.utils import metrics
+
+
+@pytest.fixture(autouse=True)
+def fast_retries(monkeypatch):
+    monkeypatch.setitem(settings.RETRY, "initial_delay", 0.01)
+    monkeypatch.setitem(settings.RETRY, "max_delay", 0.05)
+    # Faults should hit the request's own calls, not background warm-up
+    monkeypatch.setitem(settings.THREAD_POOL, "warm_up", False)
+
+
+def status_error(status, headers=None):
+    response = httpx.Response(status, headers=headers, request=httpx.Request("GET", "http://api.test/"))
+    return openai.APIStatusError("injected", response=response, body=None)
+
+
+def test_classifies_errors():
+    assert all(is_retryable(status_error(status)) for status in (408, 409, 429, 500, 503))
+    assert not any(is_retryable(status_error(status)) for status in (400, 401, 404))
+    assert is_retryable(openai.APIConnectionError(request=httpx.Request("GET", "http://api.test/")))
+    assert not is_retryable(status_error(503, {"x-should-retry": "false"}))
+    assert not is_retryable(ValueError("bad reply"))
+
+
+def test_reads_retry_after():
+    assert retry_after(status_error(429, {"retry-after": "2"})) == 2
+    assert retry_after(status_error(429, {"retry-after-ms": "250"})) == 0.25
+    assert retry_after(status_error(429, {"retry-after": "Wed, 21 Oct 2015 07:28:00 GMT"})) == 0
+    assert retry_after(status_error(429, {"retry-after": "soon"})) is None
+    assert retry_after(status_error(500)) is None
+
+
+def test_backoff_is_jittered_below_a_growing_cap():
+    policy = RetryPolicy(initial_delay=1, max_delay=4, multiplier=2, rng=random.Random(7))
+    delays = [[policy.backoff(retry) for _ in range(200)] for retry in range(4)]
+
+    for retry, ceiling in enumerate((1, 2, 4, 4)):
+        assert all(0 <= delay <= ceiling for delay in delays[retry])
+        assert max(delays[retry]) > ceiling * 0.8
+    assert len(set(delays[0])) == 200
+
+
+def test_honors_retry_after_and_stops_at_max_attempts():
+    sleeps, calls = [], []
+
+    def flaky():
+        calls.append(1)
+        raise status_error(429, {"retry-after": "1.5"})
+
+    policy = RetryPolicy(max_attempts=3, sleep=sleeps.append)
+    with pytest.raises(openai.APIStatusError):
+        policy.call(flaky, operation="flaky")
+
+    assert len(calls) == 3 and sleeps == [1.5, 1.5]
+    with pytest.raises(openai.APIStatusError):
+        RetryPolicy(max_retry_after=1, sleep=sleeps.append).call(flaky)
+    assert len(calls) == 4
+
+
+def test_budget_is_shared_by_the_request():
+    sleeps = []
+    policy = RetryPolicy(max_attempts=10, sleep=sleeps.append)
+    give_ups = metrics.RETRY_GIVE_UPS.value(reason="budget")
+
+    def failing():
+        raise status_error(503)
+
+    with retry_budget(3) as budget:
+        with pytest.raises(openai.APIStatusError):
+            policy.call(failing)
+        with pytest.raises(openai.APIStatusError):
+            policy.call(failing)
+
+    assert len(sleeps) == 3 and budget.remaining == 0
+    assert metrics.RETRY_GIVE_UPS.value(reason="budget") == give_ups + 2
+
+
+def test_budget_held_by_a_generator_closes_from_another_context():
+    def stream():
+        with retry_budget(1):
+            yield
+
+    generator = stream()
+    contextvars.copy_context().run(next, generator)
+    generator.close()
+
+    assert current_budget() is None
+
+
+def test_request_survives_transient_errors(fake_env, sample_input, sample_package):
+    fake_env.streaming = False
+    fake_env.run_duration = 0.1
+    fake_env.inject_fault("threads", 503)
+    fake_env.inject_fault("messages", 500, times=2)
+    fake_env.inject_fault("runs", 429, headers={"Retry-After": "0"})
+    fake_env.inject_fault("run", 502)
+    expected = {("threads.create", "503"): 1, ("messages.create", "500"): 2,
+                ("runs.create", "429"): 1, ("runs.retrieve", "502"): 1}
+    before = {key: metrics.RETRIES.value(operation=key[0], reason=key[1]) for key in expected}
+
+    manager = AssistantManager()
+    assert manager.generate_resume_package(sample_input) == sample_package
+    manager.close()
+
+    assert {key: metrics.RETRIES.value(operation=key[0], reason=key[1]) - before[key]
+            for key in expected} == expected
+    assert fake_env.count("POST", "messages") == 3
+
+
+def test_request_fails_once_budget_is_spent(fake_env, sample_input, monkeypatch):
+    monkeypatch.setitem(settings.RETRY, "budget", 2)
+    monkeypatch.setitem(settings.RETRY, "max_attempts", 10)
+    fake_env.streaming = False
+    fake_env.inject_fault("run", 503, times=20)
+
+    manager = AssistantManager()
+    with pytest.raises(openai.InternalServerError):
+        manager.generate_resume_package(sample_input)
+    manager.close()
+
+    assert fake_env.count("GET", "run") == 3
+
+
+def test_non_retryable_errors_are_raised_at_once(fake_env, sample_input):
+    fake_env.inject_fault("messages", 400)
+
+    manager = AssistantManager()
+    with pytest.raises(openai.BadRequestError):
+        manager.generate_resume_package(sample_input)
+    manager.close()
+
+    assert fake_env.count("POST", "messages") == 1
+
+
+def test_async_manager_retries(fake_env, sample_input, sample_package):
+    fake_env.inject_fault("messages", 503)
+    fake_env.inject_fault("runs", 500)
+
+    async def run():
+        async with AsyncAssistantManager() as manager:
+            return await manager.generate_resume_package(sample_input)
+
+    assert asyncio.run(run()) == sample_package
+    assert fake_env.count("POST", "messages") == 2 and fake_env.count("POST", "runs") == 2
@@ -0,0 +1,68 @@
+import pytest
+from fpdf import FPDF
+from src.exporters.text_layout import GlyphWidthCache, write_paragraph
+
+TEXT = ("Led the migration of forty legacy reporting jobs to a cloud warehouse, cutting "
+        "monthly close from nine days to three while mentoring four junior analysts and "
+        "partnering with finance, sales and product leadership on forecasting.")
+
+
+@pytest.fixture
+def pdf():
+    pdf = FPDF()
+    pdf.add_page()
+    pdf.set_font('Times', '', 10)
+    return pdf
+
+
+@pytest.mark.parametrize("size,max_width", [(8, 120), (10, 180), (10, 60), (14, 30)])
+def test_lines_fit_and_keep_every_word(pdf, size, max_width):
+    pdf.set_font('Times', '', size)
+    lines = GlyphWidthCache().wrap(pdf, TEXT, max_width)
+
+    assert ' '.join(lines).split() == TEXT.split()
+    assert all(pdf.get_string_width(line) <= max_width for line in lines)
+    # Greedy: the next word would not have fit on the previous line
+    for line, following in zip(lines, lines[1:]):
+        assert pdf.get_string_width(f"{line} {following.split()[0]}") > max_width
+
+
+def test_long_words_split_between_characters(pdf):
+    lines = GlyphWidthCache().wrap(pdf, "short " + "x" * 200, 40)
+
+    assert lines[0] == "short"
+    assert ''.join(lines[1:]) == "x" * 200
+    assert all(pdf.get_string_width(line) <= 40 for line in lines)
+
+
+def test_empty_text_is_one_blank_line(pdf):
+    assert GlyphWidthCache().wrap(pdf, "   ", 100) == ['']
+
+
+def test_widths_cached_per_font_and_size(pdf):
+    cache = GlyphWidthCache()
+    regular = cache.measure(pdf, "Wide")
+    pdf.set_font('Times', 'B', 10)
+    bold = cache.measure(pdf, "Wide")
+    pdf.set_font('Times', '', 20)
+    large = cache.measure(pdf, "Wide")
+
+    assert regular < bold
+    assert large == pytest.approx(2 * regular)
+    assert len(cache._tables) == 3
+
+
+def test_paragraph_uses_full_width_and_hangs_indent(pdf):
+    pdf.cell(5, 3.5, '-')
+    start_y = pdf.y
+    count = write_paragraph(pdf, TEXT, 3.5)
+
+    assert count == len(GlyphWidthCache().wrap(pdf, TEXT, pdf.w - pdf.r_margin - 20 - 2 * pdf.c_margin))
+    assert pdf.y == pytest.approx(start_y + count * 3.5)
+    assert pdf.x == pdf.l_margin
+
+
+def test_paragraph_breaks_across_pages(pdf):
+    pdf.set_y(pdf.page_break_trigger - 5)
+    write_paragraph(pdf, TEXT * 3, 3.5)
+    assert pdf.page == 2
@@ -0,0 +1,122 @@
+import asyncio
+import time
+import pytest
+from openai import AsyncOpenAI, OpenAI
+from src.core.thread_pool import AssistantThreadPool, AsyncAssistantThreadPool
+from assistant_manager import AssistantManager, AsyncAssistantManager
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met in time"
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def client(fake_api):
+    return OpenAI(api_key="test-key", base_url=fake_api.base_url, max_retries=0)
+
+
+def test_warm_up_pre_creates_threads(client, fake_api):
+    pool = AssistantThreadPool(client, size=3)
+    wait_for(lambda: pool.stats()["idle"] == 3)
+    assert fake_api.count("POST", "threads") == 3
+
+    thread_id = pool.acquire()
+    assert thread_id in fake_api.threads
+    assert pool.stats()["warm_hits"] == 1
+    wait_for(lambda: pool.stats()["idle"] == 3)
+    pool.close()
+
+
+def test_release_deletes_thread_in_background(client, fake_api):
+    pool = AssistantThreadPool(client, size=1)
+    thread_id = pool.acquire()
+    pool.release(thread_id)
+    wait_for(lambda: thread_id in fake_api.deleted_threads)
+    pool.close()
+
+
+def test_keep_policy_leaves_threads(client, fake_api):
+    pool = AssistantThreadPool(client, size=1, cleanup="keep")
+    pool.release(pool.acquire())
+    pool.close()
+    assert fake_api.count("DELETE", "thread") == 1  # only the idle refill
+
+
+def test_cold_pool_creates_inline(client, fake_api):
+    pool = AssistantThreadPool(client, size=2, warm_up=False)
+    assert fake_api.count("POST", "threads") == 0
+
+    thread_id = pool.acquire()
+    assert thread_id in fake_api.threads
+    assert pool.stats()["cold_misses"] == 1
+    pool.close()
+
+
+def test_close_deletes_idle_threads(client, fake_api):
+    pool = AssistantThreadPool(client, size=2)
+    wait_for(lambda: pool.stats()["idle"] == 2)
+    pool.close()
+    assert fake_api.threads == {}
+
+
+def test_invalid_cleanup_policy(client):
+    with pytest.raises(ValueError):
+        AssistantThreadPool(client, cleanup="recycle", warm_up=False)
+
+
+def test_async_pool(fake_api):
+    async def run():
+        client = AsyncOpenAI(api_key="test-key", base_url=fake_api.base_url, max_retries=0)
+        pool = AsyncAssistantThreadPool(client, size=2)
+        pool.start()
+        await asyncio.sleep(0.2)
+        thread_id = await pool.acquire()
+        stats = pool.stats()
+        pool.release(thread_id)
+        await pool.close()
+        await client.close()
+        return thread_id, stats
+
+    thread_id, stats = asyncio.run(run())
+    assert stats["warm_hits"] == 1
+    assert thread_id in fake_api.deleted_threads
+    assert fake_api.threads == {}
+
+
+def test_manager_takes_threads_from_pool(fake_env, sample_input):
+    manager = AssistantManager()
+    pool = manager.provider.thread_pool
+    wait_for(lambda: pool.stats()["idle"] == pool.stats()["size"])
+
+    for _ in range(3):
+        manager.generate_resume_package(sample_input)
+    manager.close()
+
+    stats = pool.stats()
+    assert stats["warm_hits"] == 3
+    assert stats["deleted"] == stats["created"]
+    assert fake_env.threads == {}
+
+
+def test_async_manager_cleans_up_threads(fake_env, sample_input):
+    async def run():
+        async with AsyncAssistantManager() as manager:
+            await asyncio.gather(*(manager.generate_resume_package(sample_input) for _ in range(5)))
+
+    asyncio.run(run())
+    assert fake_env.threads == {}
+
+
+def test_legacy_manager_cleans_up_threads(fake_env, sample_input, monkeypatch):
+    from src.core import assistant
+
+    monkeypatch.setattr(assistant, "OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr(assistant, "ASSISTANT_ID", "asst_test")
+    manager = assistant.AssistantManager()
+    manager.generate_resume_package(sample_input)
+    manager.close()
+
+    assert fake_env.threads == {}
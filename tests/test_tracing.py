@@ -0,0 +1,157 @@
+import json
+import threading
+import pytest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from assistant_manager import AssistantManager
+from src.config import settings
+from src.core.providers import StubProvider
+from src.core.response_parser import parse_resume_package
+from src.exporters.export_cache import ExportCache
+from src.utils import tracing
+from src.utils.tracing import JsonlExporter, OTLPExporter, Tracer
+
+
+@pytest.fixture
+def tracer(monkeypatch):
+    tracer = Tracer()
+    monkeypatch.setattr(tracing, "_tracer", tracer)
+    return tracer
+
+
+def names(trace):
+    return [span.name for span in trace.spans]
+
+
+def test_nested_spans_form_one_trace(tracer):
+    with tracer.span("request", user="a") as root:
+        with tracer.span("stage") as stage:
+            tracing.add_event("checkpoint", step=1)
+        tracing.set_attributes(done=True)
+
+    assert stage.parent_id == root.span_id and stage.trace is root.trace
+    assert root.attributes == {"user": "a", "done": True}
+    assert stage.events[0][1:] == ("checkpoint", {"step": 1})
+    assert root.end_ns >= stage.end_ns >= stage.start_ns >= root.start_ns
+    assert list(tracer.recent) == [root.trace]
+    assert [row["stage"] for row in root.trace.breakdown()] == ["request", "  stage"]
+    assert tracing.current_span() is None
+
+
+def test_errors_mark_the_span_and_propagate(tracer):
+    with pytest.raises(KeyError):
+        with tracer.span("request"):
+            with tracer.span("lookup"):
+                raise KeyError("name")
+
+    root, lookup = tracer.recent[-1].spans
+    assert (root.status, lookup.status) == ("error", "error")
+    assert lookup.error == "KeyError: 'name'"
+
+
+def test_jsonl_export(tmp_path):
+    path = tmp_path / "traces.jsonl"
+    tracer = Tracer([JsonlExporter(path)])
+    with tracer.span("request"):
+        with tracer.span("stage", size=3):
+            pass
+    tracer.flush()
+
+    spans = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [span["name"] for span in spans] == ["request", "stage"]
+    assert spans[1]["parent_id"] == spans[0]["span_id"]
+    assert spans[1]["attributes"] == {"size": 3}
+    assert len({span["trace_id"] for span in spans}) == 1
+
+
+def test_otlp_export_to_collector():
+    received = []
+
+    class Collector(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+        def do_POST(self):
+            received.append((self.path, json.loads(self.rfile.read(int(self.headers["Content-Length"])))))
+            self.send_response(200)
+            self.end_headers()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Collector)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        tracer = Tracer([OTLPExporter(f"http://127.0.0.1:{server.server_port}", "resume-test")])
+        with pytest.raises(ValueError):
+            with tracer.span("request", jobs=3, cached=False):
+                raise ValueError("bad reply")
+        tracer.flush()
+    finally:
+        server.shutdown()
+
+    path, payload = received[0]
+    span = payload["resourceSpans"][0]["scopeSpans"][0]["spans"][0]
+    assert path == "/v1/traces"
+    assert payload["resourceSpans"][0]["resource"]["attributes"][0]["value"] == {"stringValue": "resume-test"}
+    assert len(span["traceId"]) == 32 and len(span["spanId"]) == 16
+    assert span["attributes"] == [{"key": "jobs", "value": {"intValue": "3"}},
+                                  {"key": "cached", "value": {"boolValue": False}}]
+    assert span["status"] == {"code": 2, "message": "ValueError: bad reply"}
+
+
+def test_tracer_from_settings(tmp_path):
+    assert Tracer.from_settings(dict(settings.TRACING, exporter="none")).exporters == []
+    tracer = Tracer.from_settings(dict(settings.TRACING, exporter="jsonl", jsonl_path=tmp_path / "t.jsonl"))
+    assert isinstance(tracer.exporters[0], JsonlExporter)
+    with pytest.raises(ValueError):
+        Tracer.from_settings(dict(settings.TRACING, exporter="zipkin"))
+
+
+def test_generation_stages(tracer, sample_input, monkeypatch):
+    monkeypatch.setitem(settings.RESPONSE_CACHE, "enabled", True)
+    monkeypatch.setitem(settings.RESPONSE_CACHE, "disk", False)
+    manager = AssistantManager(provider=StubProvider(chunk_size=100))
+    manager.generate_resume_package(sample_input)
+    manager.generate_resume_package(sample_input)
+
+    first, second = tracer.recent
+    assert names(first) == ["generate_resume_package", "response_cache.get", "provider.create_run",
+                            "provider.run", "parse_response", "extract_json",
+                            "validate_resume_package", "response_cache.put"]
+    assert first.spans[3].attributes["chunks"] > 1
+    assert "first_chunk_ms" in first.spans[3].attributes
+    assert names(second) == ["generate_resume_package", "response_cache.get"]
+    assert second.spans[1].attributes == {"hit": True}
+
+
+def test_openai_run_events(tracer, fake_env, sample_input):
+    manager = AssistantManager()
+    manager.generate_resume_package(sample_input)
+    manager.close()
+
+    trace = tracer.recent[-1]
+    assert {"thread_pool.acquire", "messages.create", "provider.run"} <= set(names(trace))
+    run_span = next(span for span in trace.spans if span.name == "provider.run")
+    events = [name for _, name, _ in run_span.events]
+    assert events[0] == "thread.run.created"
+    assert "run.first_delta" in events and events[-1] == "thread.message.completed"
+
+
+def test_repaired_json_is_recorded(tracer, sample_package):
+    reply = json.dumps(sample_package)[:-1] + ",}"
+    with tracer.span("request"):
+        assert parse_resume_package(reply) == sample_package
+
+    extract = tracer.recent[-1].spans[1]
+    assert extract.name == "extract_json"
+    assert [name for _, name, _ in extract.events] == ["extract_json.trailing_comma_repair"]
+
+
+def test_export_stages(tracer, sample_package):
+    from export_pdf import render_resume_pdf
+
+    cache = ExportCache.from_settings(dict(settings.EXPORT_CACHE, enabled=True))
+    cache.render(render_resume_pdf, sample_package["structured_cv"])
+    cache.render(render_resume_pdf, sample_package["structured_cv"])
+
+    miss, hit = tracer.recent
+    assert names(miss) == ["export_cache.render", "export.render_pdf"]
+    assert miss.spans[0].attributes == {"renderer": "render_resume_pdf", "hit": False}
+    assert names(hit) == ["export_cache.render"] and hit.spans[0].attributes["hit"] is True